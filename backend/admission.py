@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Admission Control - Per-endpoint-class concurrency limits with bounded queues
+
+Each endpoint class (upload, match, skill-gap) runs at most max_concurrent
+requests at once. Up to max_queue more wait for a slot, for at most
+queue_timeout seconds; anything beyond that is rejected straight away with
+429 and a Retry-After estimate. Admitted requests therefore never compete
+with an unbounded backlog, and their latency stays predictable under overload.
+"""
+
+import asyncio
+import functools
+import math
+import os
+import threading
+import time
+
+# name -> (max_concurrent, max_queue, queue_timeout seconds); overridable per class via env
+DEFAULT_LIMITS = {
+    'upload': (4, 16, 10.0),
+    'match': (8, 32, 5.0),
+    'skill-gap': (16, 64, 2.0)
+}
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted; retry_after is in whole seconds"""
+
+    def __init__(self, name, reason, retry_after):
+        super().__init__(f"{name}: {reason}")
+        self.name = name
+        self.reason = reason
+        self.retry_after = retry_after
+
+class AdmissionClass:
+    """Concurrency limit plus bounded wait queue for one endpoint class (threads)"""
+
+    def __init__(self, name, max_concurrent, max_queue, queue_timeout):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._condition = threading.Condition()
+
+        self.in_flight = 0
+        self.queued = 0
+        self.max_queued_seen = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._service_time = None  # moving average of seconds per admitted request
+
+    def retry_after(self):
+        """Rough time until a new request would be admitted, in seconds (at least 1)"""
+        service_time = self._service_time or 1.0
+        waves = (self.queued + 1) / max(1, self.max_concurrent)
+        return max(1, math.ceil(service_time * waves))
+
+    def _reject(self, reason):
+        self.rejected += 1
+        raise AdmissionRejected(self.name, reason, self.retry_after())
+
+    def check(self):
+        """Raise AdmissionRejected if a new request would be turned away without queueing"""
+        if self.in_flight >= self.max_concurrent and self.queued >= self.max_queue:
+            self._reject('queue full')
+
+    def acquire(self):
+        """Take a slot, waiting in the queue if needed; raises AdmissionRejected"""
+        with self._condition:
+            if self.in_flight < self.max_concurrent and self.queued == 0:
+                self.in_flight += 1
+                self.admitted += 1
+                return time.perf_counter()
+
+            if self.queued >= self.max_queue:
+                self._reject('queue full')
+
+            self.queued += 1
+            self.max_queued_seen = max(self.max_queued_seen, self.queued)
+            try:
+                admitted = self._condition.wait_for(
+                    lambda: self.in_flight < self.max_concurrent, timeout=self.queue_timeout
+                )
+            finally:
+                self.queued -= 1
+
+            if not admitted:
+                self.timed_out += 1
+                self._reject('queue timeout')
+
+            self.in_flight += 1
+            self.admitted += 1
+            return time.perf_counter()
+
+    def release(self, started=None):
+        with self._condition:
+            self.in_flight -= 1
+            if started is not None:
+                self._record(time.perf_counter() - started)
+            self._condition.notify()
+
+    def _record(self, duration):
+        # Exponential moving average keeps Retry-After tracking current load
+        self._service_time = duration if self._service_time is None else 0.8 * self._service_time + 0.2 * duration
+
+    def stats(self):
+        return {
+            'max_concurrent': self.max_concurrent,
+            'max_queue': self.max_queue,
+            'queue_timeout': self.queue_timeout,
+            'in_flight': self.in_flight,
+            'queue_depth': self.queued,
+            'max_queue_depth': self.max_queued_seen,
+            'admitted': self.admitted,
+            'rejected': self.rejected,
+            'timed_out': self.timed_out,
+            'avg_service_ms': round(self._service_time * 1000, 1) if self._service_time else None
+        }
+
+class AsyncAdmissionClass(AdmissionClass):
+    """Same limits for coroutines running on one event loop"""
+
+    def __init__(self, name, max_concurrent, max_queue, queue_timeout):
+        super().__init__(name, max_concurrent, max_queue, queue_timeout)
+        self._async_condition = None  # created lazily on the serving loop
+
+    async def acquire_async(self):
+        if self._async_condition is None:
+            self._async_condition = asyncio.Condition()
+
+        async with self._async_condition:
+            if self.in_flight < self.max_concurrent and self.queued == 0:
+                self.in_flight += 1
+                self.admitted += 1
+                return time.perf_counter()
+
+            if self.queued >= self.max_queue:
+                self._reject('queue full')
+
+            self.queued += 1
+            self.max_queued_seen = max(self.max_queued_seen, self.queued)
+            try:
+                await asyncio.wait_for(
+                    self._async_condition.wait_for(lambda: self.in_flight < self.max_concurrent),
+                    timeout=self.queue_timeout
+                )
+            except asyncio.TimeoutError:
+                self.timed_out += 1
+                self._reject('queue timeout')
+            finally:
+                self.queued -= 1
+
+            self.in_flight += 1
+            self.admitted += 1
+            return time.perf_counter()
+
+    async def release_async(self, started=None):
+        async with self._async_condition:
+            self.in_flight -= 1
+            if started is not None:
+                self._record(time.perf_counter() - started)
+            self._async_condition.notify()
+
+class AdmissionController:
+    """Holds one admission class per endpoint class and wraps route handlers with them"""
+
+    def __init__(self, limits=None, async_mode=False):
+        self.async_mode = async_mode
+        class_type = AsyncAdmissionClass if async_mode else AdmissionClass
+        self.classes = {
+            name: class_type(name, *self._configured(name, defaults))
+            for name, defaults in (limits or DEFAULT_LIMITS).items()
+        }
+
+    @staticmethod
+    def _configured(name, defaults):
+        """Apply ADMISSION_<NAME>_CONCURRENCY / _QUEUE / _TIMEOUT overrides"""
+        prefix = f"ADMISSION_{name.upper().replace('-', '_')}"
+        max_concurrent, max_queue, queue_timeout = defaults
+        return (
+            int(os.getenv(f'{prefix}_CONCURRENCY', max_concurrent)),
+            int(os.getenv(f'{prefix}_QUEUE', max_queue)),
+            float(os.getenv(f'{prefix}_TIMEOUT', queue_timeout))
+        )
+
+    @staticmethod
+    def rejection_response(error):
+        """429 body and headers; plain dicts work as responses in both Flask and Quart"""
+        return (
+            {'error': f'Server busy ({error.reason}), please retry', 'retry_after': error.retry_after},
+            429,
+            {'Retry-After': str(error.retry_after)}
+        )
+
+    def limit(self, name):
+        """Decorator that admits the wrapped route through the named class"""
+        admission_class = self.classes[name]
+
+        def decorator(func):
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    try:
+                        started = await admission_class.acquire_async()
+                    except AdmissionRejected as e:
+                        return self.rejection_response(e)
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        await admission_class.release_async(started)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    started = admission_class.acquire()
+                except AdmissionRejected as e:
+                    return self.rejection_response(e)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    admission_class.release(started)
+            return wrapper
+
+        return decorator
+
+    def get_stats(self):
+        """Queue depth and admission counters for every class"""
+        return {name: admission_class.stats() for name, admission_class in self.classes.items()}
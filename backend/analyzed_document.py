@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Analyzed Document - Normalized resume text and its derived views, computed once
+"""
+
+import re
+from functools import cached_property
+from nltk.tokenize import sent_tokenize
+
+WORD_PATTERN = re.compile(r'\w+')
+
+class AnalyzedDocument:
+    """Holds the cleaned text plus lazily computed lowercase, word, token and sentence views"""
+
+    def __init__(self, text):
+        self.text = text
+
+    @cached_property
+    def lower(self):
+        """Lowercase view shared by every case-insensitive extractor"""
+        return self.text.lower()
+
+    @cached_property
+    def tokens(self):
+        """Whitespace tokens of the text"""
+        return self.text.split()
+
+    @cached_property
+    def words(self):
+        """Every maximal run of word characters in the lowercase view, built in one scan"""
+        return frozenset(WORD_PATTERN.findall(self.lower))
+
+    @cached_property
+    def sentences(self):
+        """Sentences of the text"""
+        return sent_tokenize(self.text)
+
+    @property
+    def word_count(self):
+        return len(self.tokens)
+
+    @property
+    def sentence_count(self):
+        return len(self.sentences)
+
+    def has_words(self, words):
+        """True when every given lowercase word occurs as a whole word; a set lookup per word"""
+        return all(word in self.words for word in words)
+
+    def contains_any(self, keywords):
+        """Cheap literal check on the lowercase view, used to skip extractors that cannot match"""
+        return any(keyword in self.lower for keyword in keywords)
@@ -1,7 +1,6 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, request, jsonify, render_template, send_from_directory, Response, stream_with_context
 from flask_cors import CORS
 import os
-import sqlite3
 from werkzeug.utils import secure_filename
 import json
 from datetime import datetime
@@ -12,7 +11,12 @@ load_dotenv()
 
 # Import our custom modules
 from resume_parser import ResumeParser
-from job_matcher import JobMatcher
+from job_matcher import JobMatcher, StaleRankingError, IndexNotReadyError
+from database import (init_database, save_resume_analysis, store_job_matches, get_session_history,
+                      get_resume_details, save_match_ranking, load_match_ranking)
+from scheduler import RefreshScheduler
+from admission import AdmissionController, AdmissionRejected
+import match_pages
 
 app = Flask(__name__,
             template_folder='../templates',
@@ -30,65 +34,49 @@ os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 # Initialize components
 resume_parser = ResumeParser()
 job_matcher = JobMatcher()
+scheduler = RefreshScheduler(poll_interval=int(os.getenv('SCHEDULER_POLL_SECONDS', '30')))
+admission = AdmissionController()
 
 def allowed_file(filename):
     """Check if file extension is allowed"""
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def init_database():
-    """Initialize SQLite database for storing user data"""
-    # Create database directory if it doesn't exist
-    db_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database')
-    os.makedirs(db_dir, exist_ok=True)
-
-    # Connect to database
-    db_path = os.path.join(db_dir, 'users.db')
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Create users table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            session_id TEXT UNIQUE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-
-    # Create resume_analyses table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS resume_analyses (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            session_id TEXT,
-            filename TEXT,
-            extracted_text TEXT,
-            skills TEXT,
-            experience TEXT,
-            education TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (session_id) REFERENCES users (session_id)
-        )
-    ''')
-
-    # Create job_matches table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS job_matches (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            session_id TEXT,
-            resume_id INTEGER,
-            job_title TEXT,
-            company TEXT,
-            match_score REAL,
-            job_description TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (session_id) REFERENCES users (session_id),
-            FOREIGN KEY (resume_id) REFERENCES resume_analyses (id)
-        )
-    ''')
-
-    conn.commit()
-    conn.close()
+def init_app():
+    """Initialize the database and job index (run once, before workers fork)"""
+    init_database()
+    job_matcher.load_job_data()
+
+def refresh_external_skills():
+    """Learn trending skills from external sources and persist them"""
+    job_matcher.skill_service.update_from_external_sources()
+    job_matcher.skill_service.save()
+
+def start_scheduler():
+    """Register refresh tasks and start the scheduler thread (once per worker process)"""
+    if os.getenv('SCHEDULER_ENABLED', 'true').lower() != 'true':
+        return
+
+    jitter = float(os.getenv('SCHEDULER_JITTER', '0.1'))
+    live_hours = float(os.getenv('LIVE_JOBS_REFRESH_HOURS',
+                                 job_matcher.update_interval.total_seconds() / 3600))
+    last_live_update = job_matcher.last_update.timestamp() if job_matcher.last_update else None
+
+    # Shared tasks: exactly one worker runs each, coordinated through the database
+    scheduler.add_task('live_jobs', lambda: job_matcher.rebuild_index(use_live_data=True),
+                       interval=live_hours * 3600, jitter=jitter, last_run=last_live_update)
+    scheduler.add_task('skill_learning', refresh_external_skills,
+                       interval=float(os.getenv('SKILL_LEARNING_REFRESH_HOURS', '24')) * 3600, jitter=jitter)
+    scheduler.add_task('index_rebuild', job_matcher.rebuild_index_if_stale,
+                       interval=float(os.getenv('INDEX_REBUILD_MINUTES', '30')) * 60, jitter=jitter)
+
+    # Local task: every worker maps snapshots published by whichever worker rebuilt the index
+    scheduler.add_task('index_reload', job_matcher.reload_index_if_changed,
+                       interval=float(os.getenv('INDEX_RELOAD_SECONDS', '60')), jitter=jitter, local=True)
+    scheduler.add_task('skill_reload', lambda: job_matcher.skill_service.reload_if_changed(force=True),
+                       interval=job_matcher.skill_service.reload_interval, jitter=jitter, local=True)
+
+    scheduler.start()
 
 @app.route('/')
 def index():
@@ -101,6 +89,7 @@ def dashboard():
     return render_template('dashboard.html')
 
 @app.route('/api/upload', methods=['POST'])
+@admission.limit('upload')
 def upload_resume():
     """Handle resume upload and analysis"""
     try:
@@ -127,31 +116,10 @@ def upload_resume():
                 session_id = request.form.get('session_id', f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
 
                 # Store in database
-                db_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database')
-                db_path = os.path.join(db_dir, 'users.db')
-                conn = sqlite3.connect(db_path)
-                cursor = conn.cursor()
-
-                # Insert or update user
-                cursor.execute('INSERT OR IGNORE INTO users (session_id) VALUES (?)', (session_id,))
-
-                # Insert resume analysis
-                cursor.execute('''
-                    INSERT INTO resume_analyses
-                    (session_id, filename, extracted_text, skills, experience, education)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    session_id,
-                    filename,
-                    parsed_data['text'],
-                    json.dumps(parsed_data['skills']),
-                    json.dumps(parsed_data['experience']),
-                    json.dumps(parsed_data['education'])
-                ))
-
-                resume_id = cursor.lastrowid
-                conn.commit()
-                conn.close()
+                resume_id = save_resume_analysis(session_id, filename, parsed_data)
+
+                # Encode the resume once so matching can be requested by resume_id alone
+                job_matcher.store_resume_profile(resume_id, parsed_data)
 
                 # Clean up uploaded file
                 os.remove(filepath)
@@ -172,53 +140,138 @@ def upload_resume():
         return jsonify({'error': f'An error occurred: {str(e)}'}), 500
 
 @app.route('/api/match-jobs', methods=['POST'])
+@admission.limit('match')
 def match_jobs():
-    """Find matching jobs for the parsed resume"""
+    """Find matching jobs for the parsed resume, one page at a time"""
     try:
-        data = request.get_json()
-        resume_data = data.get('resume_data')
+        data = request.get_json() or {}
         session_id = data.get('session_id')
         resume_id = data.get('resume_id')
 
-        if not resume_data:
-            return jsonify({'error': 'No resume data provided'}), 400
-
-        # Get job matches
-        matches = job_matcher.find_matches(resume_data)
-
-        # Store matches in database
-        if session_id and resume_id:
-            db_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database')
-            db_path = os.path.join(db_dir, 'users.db')
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-            for match in matches:
-                cursor.execute('''
-                    INSERT INTO job_matches
-                    (session_id, resume_id, job_title, company, match_score, job_description)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    session_id,
-                    resume_id,
-                    match['title'],
-                    match['company'],
-                    match['match_score'],
-                    match['description']
-                ))
-
-            conn.commit()
-            conn.close()
+        try:
+            fields = match_pages.parse_fields(data.get('fields'))
+            page_size = match_pages.parse_page_size(data.get('page_size'))
+            rerank_k, budget_ms = match_pages.parse_rerank(data)
+            cursor = data.get('cursor')
+            if cursor:
+                ranking_id, offset = match_pages.decode_cursor(cursor)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        if cursor:
+            # Later pages come from the stored ranking; nothing is re-scored
+            stored = load_match_ranking(ranking_id, match_pages.CURSOR_TTL)
+            if stored is None:
+                return jsonify({'error': 'Cursor expired, request the first page again'}), 410
+            index_version, ranking = stored['index_version'], stored['ranking']
+            resume_data = {'skills': stored['resume_skills']}
+        else:
+            resume_data, profile = data.get('resume_data'), None
+            if not resume_data and resume_id:
+                # Uploaded resumes are ranked from their stored vector; the client only sends the id
+                try:
+                    profile = job_matcher.resume_profile(resume_id)
+                except IndexNotReadyError:
+                    return jsonify({'error': 'Job index not ready'}), 503
+                if profile is None:
+                    return jsonify({'error': 'Resume not found'}), 404
+                resume_data = profile['resume_data']
+            if not resume_data:
+                return jsonify({'error': 'No resume data provided'}), 400
+
+            # Rank once and keep the ranking so later pages can be served from a cursor
+            index_version, ranking = job_matcher.rank_for_paging(resume_data, match_pages.RANKING_LIMIT,
+                                                                 rerank_k, budget_ms, profile)
+            ranking_id, offset = match_pages.new_ranking_id(), 0
+            if len(ranking) > page_size:
+                save_match_ranking(ranking_id, index_version, resume_data.get('skills', []), ranking,
+                                   match_pages.CURSOR_TTL)
+
+        if not ranking:
+            return jsonify({'success': True, 'matches': [], 'next_cursor': None, 'total': 0})
+
+        try:
+            full_matches, matches = job_matcher.build_page(index_version, ranking, offset, page_size,
+                                                           resume_data, fields)
+        except StaleRankingError:
+            return jsonify({'error': 'Job index was updated, request the first page again'}), 410
+
+        # Store the first page of matches in database
+        if session_id and resume_id and not cursor:
+            store_job_matches(resume_id, full_matches)
 
         return jsonify({
             'success': True,
-            'matches': matches
+            'matches': matches,
+            'next_cursor': match_pages.next_cursor(ranking_id, offset, page_size, len(ranking)),
+            'total': len(ranking)
         })
 
     except Exception as e:
         return jsonify({'error': f'An error occurred: {str(e)}'}), 500
 
+@app.route('/api/match-jobs/stream', methods=['POST'])
+def match_jobs_stream():
+    """Stream matching jobs as Server-Sent Events, one event per enriched match"""
+    data = request.get_json() or {}
+    resume_data = data.get('resume_data')
+    session_id = data.get('session_id')
+    resume_id = data.get('resume_id')
+    top_n = request.args.get('top_n', 10, type=int)
+    try:
+        rerank_k, budget_ms = match_pages.parse_rerank(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    profile = None
+    if not resume_data and resume_id:
+        try:
+            profile = job_matcher.resume_profile(resume_id)
+        except IndexNotReadyError:
+            return jsonify({'error': 'Job index not ready'}), 503
+        if profile is None:
+            return jsonify({'error': 'Resume not found'}), 404
+        resume_data = profile['resume_data']
+    if not resume_data:
+        return jsonify({'error': 'No resume data provided'}), 400
+
+    # The slot is held until the stream closes, not just until the response object is returned
+    match_admission = admission.classes['match']
+    try:
+        started = match_admission.acquire()
+    except AdmissionRejected as e:
+        return admission.rejection_response(e)
+
+    def generate():
+        matches = []
+        try:
+            for match in job_matcher.iter_matches(resume_data, top_n, include_gap=True,
+                                                   rerank_k=rerank_k, budget_ms=budget_ms, profile=profile):
+                matches.append(match)
+                yield sse_event('match', match)
+
+            # Store matches in database once the client has everything
+            if session_id and resume_id:
+                store_job_matches(resume_id, matches)
+
+            yield sse_event('done', {'count': len(matches)})
+
+        except Exception as e:
+            yield sse_event('error', {'error': f'An error occurred: {str(e)}'})
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # stop reverse proxies from buffering the stream
+    })
+    response.call_on_close(lambda: match_admission.release(started))
+    return response
+
+def sse_event(event, payload):
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
 @app.route('/api/skill-gap', methods=['POST'])
+@admission.limit('skill-gap')
 def analyze_skill_gap():
     """Analyze skill gaps between resume and job requirements"""
     try:
@@ -240,65 +293,85 @@ def analyze_skill_gap():
 def get_user_history(session_id):
     """Get user's resume analysis and job match history"""
     try:
-        db_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database')
-        db_path = os.path.join(db_dir, 'users.db')
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # Get resume analyses
-        cursor.execute('''
-            SELECT id, filename, skills, experience, education, created_at
-            FROM resume_analyses
-            WHERE session_id = ?
-            ORDER BY created_at DESC
-        ''', (session_id,))
-
-        resumes = []
-        for row in cursor.fetchall():
-            resumes.append({
-                'id': row[0],
-                'filename': row[1],
-                'skills': json.loads(row[2]) if row[2] else [],
-                'experience': json.loads(row[3]) if row[3] else [],
-                'education': json.loads(row[4]) if row[4] else [],
-                'created_at': row[5]
-            })
+        resumes, matches = get_session_history(session_id)
 
-        # Get job matches
-        cursor.execute('''
-            SELECT job_title, company, match_score, created_at
-            FROM job_matches
-            WHERE session_id = ?
-            ORDER BY created_at DESC
-            LIMIT 20
-        ''', (session_id,))
+        return jsonify({
+            'success': True,
+            'resumes': resumes,
+            'matches': matches
+        })
 
-        matches = []
-        for row in cursor.fetchall():
-            matches.append({
-                'job_title': row[0],
-                'company': row[1],
-                'match_score': row[2],
-                'created_at': row[3]
+    except Exception as e:
+        return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+
+@app.route('/api/resumes/<int:resume_id>')
+def get_resume(resume_id):
+    """Get the full text, experience and education of one resume (loaded on demand)"""
+    try:
+        details = get_resume_details(resume_id)
+        if details is None:
+            return jsonify({'error': 'Resume not found'}), 404
+
+        return jsonify({
+            'success': True,
+            'resume': details
+        })
+
+    except Exception as e:
+        return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+
+@app.route('/api/trending-skills')
+def get_trending_skills():
+    """Get trending skills; window=week|month for decayed counts, compare=true for week vs month"""
+    try:
+        top_n = request.args.get('top_n', 20, type=int)
+        window = request.args.get('window')
+
+        if request.args.get('compare', 'false').lower() == 'true':
+            return jsonify({
+                'success': True,
+                'trends': job_matcher.skill_learner.compare_trending_skills(top_n)
             })
 
-        conn.close()
+        if window not in (None, 'week', 'month'):
+            return jsonify({'error': 'window must be "week" or "month"'}), 400
 
+        skills = job_matcher.get_trending_skills(top_n, window)
         return jsonify({
             'success': True,
-            'resumes': resumes,
-            'matches': matches
+            'window': window or 'all_time',
+            'skills': [{'skill': skill, 'count': count} for skill, count in skills]
         })
 
     except Exception as e:
         return jsonify({'error': f'An error occurred: {str(e)}'}), 500
 
-if __name__ == '__main__':
-    # Initialize database
-    init_database()
+@app.route('/api/scheduler/status')
+def get_scheduler_status():
+    """Get next-run and last-duration stats for background refresh tasks"""
+    try:
+        return jsonify({
+            'success': True,
+            'tasks': scheduler.get_stats(),
+            'index_version': job_matcher.index.version if job_matcher.index else None
+        })
 
-    # Load job data
-    job_matcher.load_job_data()
+    except Exception as e:
+        return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+
+@app.route('/api/admission/metrics')
+def get_admission_metrics():
+    """Get concurrency, queue depth and rejection counts per endpoint class (this worker)"""
+    return jsonify({
+        'success': True,
+        'pid': os.getpid(),
+        'classes': admission.get_stats()
+    })
+
+if __name__ == '__main__':
+    # Initialize database and load job data
+    init_app()
+    start_scheduler()
 
     print("🚀 Resume Analyzer and Job Match Recommender")
     print("📊 Server starting on http://localhost:5000")
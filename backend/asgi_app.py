@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+ASGI server mode - the same API as app.py, with CPU-bound work offloaded to a process pool
+
+Run from the backend directory:
+    hypercorn asgi_app:app --bind 0.0.0.0:5000
+
+Requests are handled on one event loop; resume parsing, vectorizing and
+similarity run in ComputePool worker processes, and SQLite calls run on
+threads, so a slow parse never blocks other requests.
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime
+from quart import Quart, request, jsonify, render_template, Response
+from quart_cors import cors
+from werkzeug.utils import secure_filename
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+import compute_pool
+from compute_pool import ComputePool
+from job_matcher import JobMatcher, StaleRankingError, IndexNotReadyError
+from database import (init_database, save_resume_analysis, store_job_matches, get_session_history,
+                      get_resume_details, save_match_ranking, load_match_ranking)
+from scheduler import RefreshScheduler
+from admission import AdmissionController, AdmissionRejected
+import match_pages
+
+app = Quart(__name__,
+            template_folder='../templates',
+            static_folder='../static')
+app = cors(app)
+
+# Configuration
+app.config['UPLOAD_FOLDER'] = '../uploads'
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc'}
+
+# Ensure upload directory exists
+os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+
+# The server process owns index builds, refreshes and trends; workers only read the index
+job_matcher = JobMatcher()
+pool = ComputePool(job_matcher.index_dir)
+scheduler = RefreshScheduler(poll_interval=int(os.getenv('SCHEDULER_POLL_SECONDS', '30')))
+admission = AdmissionController(async_mode=True)
+
+def allowed_file(filename):
+    """Check if file extension is allowed"""
+    return '.' in filename and \
+           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+
+def sse_event(event, payload):
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+@app.before_serving
+async def startup():
+    """Build the index before starting workers so they can map it"""
+    await asyncio.to_thread(init_database)
+    await asyncio.to_thread(job_matcher.load_job_data)
+    pool.start()
+
+    if os.getenv('SCHEDULER_ENABLED', 'true').lower() == 'true':
+        # Rebuilds run here and publish new snapshots; workers reload them on their next request
+        scheduler.add_task('live_jobs', lambda: job_matcher.rebuild_index(use_live_data=True),
+                           interval=float(os.getenv('LIVE_JOBS_REFRESH_HOURS', '6')) * 3600,
+                           last_run=job_matcher.last_update.timestamp() if job_matcher.last_update else None)
+        scheduler.add_task('index_rebuild', job_matcher.rebuild_index_if_stale,
+                           interval=float(os.getenv('INDEX_REBUILD_MINUTES', '30')) * 60)
+        scheduler.start()
+
+@app.after_serving
+async def shutdown():
+    scheduler.stop()
+    await asyncio.to_thread(pool.shutdown)
+
+@app.route('/')
+async def index():
+    """Serve the main page"""
+    return await render_template('index.html')
+
+@app.route('/dashboard')
+async def dashboard():
+    """Serve the dashboard page"""
+    return await render_template('dashboard.html')
+
+@app.route('/api/upload', methods=['POST'])
+@admission.limit('upload')
+async def upload_resume():
+    """Handle resume upload and analysis"""
+    try:
+        files = await request.files
+        form = await request.form
+
+        if 'resume' not in files:
+            return jsonify({'error': 'No file uploaded'}), 400
+
+        file = files['resume']
+        if file.filename == '':
+            return jsonify({'error': 'No file selected'}), 400
+
+        if not allowed_file(file.filename):
+            return jsonify({'error': 'Invalid file type. Please upload PDF or DOCX files.'}), 400
+
+        # Secure the filename and save
+        filename = secure_filename(file.filename)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_')
+        filename = timestamp + filename
+        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+        await file.save(filepath)
+
+        try:
+            # Parse the resume in a worker process
+            parsed_data = await pool.run(compute_pool.parse_resume, filepath)
+        finally:
+            # Clean up uploaded file
+            os.remove(filepath)
+
+        if not parsed_data['success']:
+            return jsonify({'error': parsed_data['error']}), 400
+
+        # Get session ID from request or generate new one
+        session_id = form.get('session_id', f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        resume_id = await asyncio.to_thread(save_resume_analysis, session_id, filename, parsed_data)
+
+        # Encode the resume once so matching can be requested by resume_id alone
+        await pool.run(compute_pool.store_resume_profile, resume_id, parsed_data)
+
+        return jsonify({
+            'success': True,
+            'session_id': session_id,
+            'resume_id': resume_id,
+            'data': parsed_data
+        })
+
+    except Exception as e:
+        return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+
+@app.route('/api/match-jobs', methods=['POST'])
+@admission.limit('match')
+async def match_jobs():
+    """Find matching jobs for the parsed resume, one page at a time"""
+    try:
+        data = await request.get_json() or {}
+        session_id = data.get('session_id')
+        resume_id = data.get('resume_id')
+
+        try:
+            fields = match_pages.parse_fields(data.get('fields'))
+            page_size = match_pages.parse_page_size(data.get('page_size'))
+            rerank_k, budget_ms = match_pages.parse_rerank(data)
+            cursor = data.get('cursor')
+            if cursor:
+                ranking_id, offset = match_pages.decode_cursor(cursor)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        if cursor:
+            # Later pages come from the stored ranking; nothing is re-scored
+            stored = await asyncio.to_thread(load_match_ranking, ranking_id, match_pages.CURSOR_TTL)
+            if stored is None:
+                return jsonify({'error': 'Cursor expired, request the first page again'}), 410
+            index_version, ranking = stored['index_version'], stored['ranking']
+            resume_data = {'skills': stored['resume_skills']}
+        else:
+            resume_data, profile = data.get('resume_data'), None
+            if not resume_data and resume_id:
+                # Uploaded resumes are ranked from their stored vector; the client only sends the id
+                try:
+                    profile = await pool.run(compute_pool.resume_profile, resume_id)
+                except IndexNotReadyError:
+                    return jsonify({'error': 'Job index not ready'}), 503
+                if profile is None:
+                    return jsonify({'error': 'Resume not found'}), 404
+                resume_data = profile['resume_data']
+            if not resume_data:
+                return jsonify({'error': 'No resume data provided'}), 400
+
+            index_version, ranking = await pool.run(compute_pool.rank_for_paging, resume_data,
+                                                    match_pages.RANKING_LIMIT, rerank_k, budget_ms, profile)
+            ranking_id, offset = match_pages.new_ranking_id(), 0
+            if len(ranking) > page_size:
+                await asyncio.to_thread(save_match_ranking, ranking_id, index_version,
+                                        resume_data.get('skills', []), ranking, match_pages.CURSOR_TTL)
+
+        if not ranking:
+            return jsonify({'success': True, 'matches': [], 'next_cursor': None, 'total': 0})
+
+        try:
+            full_matches, matches = await pool.run(compute_pool.build_page, index_version, ranking, offset,
+                                                   page_size, resume_data, fields)
+        except StaleRankingError:
+            return jsonify({'error': 'Job index was updated, request the first page again'}), 410
+
+        # Store the first page of matches in database
+        if session_id and resume_id and not cursor:
+            await asyncio.to_thread(store_job_matches, resume_id, full_matches)
+
+        return jsonify({
+            'success': True,
+            'matches': matches,
+            'next_cursor': match_pages.next_cursor(ranking_id, offset, page_size, len(ranking)),
+            'total': len(ranking)
+        })
+
+    except Exception as e:
+        return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+
+@app.route('/api/match-jobs/stream', methods=['POST'])
+async def match_jobs_stream():
+    """Stream matching jobs as Server-Sent Events, one event per enriched match"""
+    data = await request.get_json() or {}
+    resume_data = data.get('resume_data')
+    session_id = data.get('session_id')
+    resume_id = data.get('resume_id')
+    top_n = request.args.get('top_n', 10, type=int)
+    try:
+        rerank_k, budget_ms = match_pages.parse_rerank(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    profile = None
+    if not resume_data and resume_id:
+        try:
+            profile = await pool.run(compute_pool.resume_profile, resume_id)
+        except IndexNotReadyError:
+            return jsonify({'error': 'Job index not ready'}), 503
+        if profile is None:
+            return jsonify({'error': 'Resume not found'}), 404
+        resume_data = profile['resume_data']
+    if not resume_data:
+        return jsonify({'error': 'No resume data provided'}), 400
+
+    # Turn requests away with a 429 and Retry-After while the queue is full. The slot
+    # itself is taken inside the stream: a body that is never iterated (client gone
+    # before the first chunk) never runs its finally, so a slot taken here could never
+    # be released.
+    match_admission = admission.classes['match']
+    try:
+        match_admission.check()
+    except AdmissionRejected as e:
+        return admission.rejection_response(e)
+
+    async def generate():
+        try:
+            started = await match_admission.acquire_async()
+        except AdmissionRejected as e:
+            yield sse_event('error', {'error': f'Server busy ({e.reason}), please retry',
+                                      'retry_after': e.retry_after}).encode('utf-8')
+            return
+
+        matches = []
+        try:
+            ranked = await pool.run(compute_pool.rank_jobs, resume_data, top_n, rerank_k, budget_ms, profile)
+
+            # Enrich all matches in parallel, but send them in rank order
+            pending = [
+                asyncio.ensure_future(pool.run(compute_pool.build_match, job, score, resume_data, True))
+                for job, score in ranked
+            ]
+            for future in pending:
+                match = await future
+                matches.append(match)
+                yield sse_event('match', match).encode('utf-8')
+
+            if session_id and resume_id:
+                await asyncio.to_thread(store_job_matches, resume_id, matches)
+
+            yield sse_event('done', {'count': len(matches)}).encode('utf-8')
+
+        except Exception as e:
+            yield sse_event('error', {'error': f'An error occurred: {str(e)}'}).encode('utf-8')
+
+        finally:
+            await match_admission.release_async(started)
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@app.route('/api/skill-gap', methods=['POST'])
+@admission.limit('skill-gap')
+async def analyze_skill_gap():
+    """Analyze skill gaps between resume and job requirements"""
+    try:
+        data = await request.get_json()
+        resume_skills = data.get('resume_skills', [])
+        job_description = data.get('job_description', '')
+
+        gap_analysis = await pool.run(compute_pool.analyze_skill_gap, resume_skills, job_description)
+
+        return jsonify({
+            'success': True,
+            'gap_analysis': gap_analysis
+        })
+
+    except Exception as e:
+        return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+
+@app.route('/api/history/<session_id>')
+async def get_user_history(session_id):
+    """Get user's resume analysis and job match history"""
+    try:
+        resumes, matches = await asyncio.to_thread(get_session_history, session_id)
+
+        return jsonify({
+            'success': True,
+            'resumes': resumes,
+            'matches': matches
+        })
+
+    except Exception as e:
+        return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+
+@app.route('/api/resumes/<int:resume_id>')
+async def get_resume(resume_id):
+    """Get the full text, experience and education of one resume (loaded on demand)"""
+    try:
+        details = await asyncio.to_thread(get_resume_details, resume_id)
+        if details is None:
+            return jsonify({'error': 'Resume not found'}), 404
+
+        return jsonify({
+            'success': True,
+            'resume': details
+        })
+
+    except Exception as e:
+        return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+
+@app.route('/api/trending-skills')
+async def get_trending_skills():
+    """Get trending skills; window=week|month for decayed counts, compare=true for week vs month"""
+    try:
+        top_n = request.args.get('top_n', 20, type=int)
+        window = request.args.get('window')
+
+        if request.args.get('compare', 'false').lower() == 'true':
+            trends = await asyncio.to_thread(job_matcher.skill_learner.compare_trending_skills, top_n)
+            return jsonify({
+                'success': True,
+                'trends': trends
+            })
+
+        if window not in (None, 'week', 'month'):
+            return jsonify({'error': 'window must be "week" or "month"'}), 400
+
+        skills = await asyncio.to_thread(job_matcher.get_trending_skills, top_n, window)
+        return jsonify({
+            'success': True,
+            'window': window or 'all_time',
+            'skills': [{'skill': skill, 'count': count} for skill, count in skills]
+        })
+
+    except Exception as e:
+        return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+
+@app.route('/api/scheduler/status')
+async def get_scheduler_status():
+    """Get next-run and last-duration stats for background refresh tasks"""
+    try:
+        tasks = await asyncio.to_thread(scheduler.get_stats)
+        return jsonify({
+            'success': True,
+            'tasks': tasks,
+            'index_version': job_matcher.index.version if job_matcher.index else None,
+            'compute_workers': pool.workers
+        })
+
+    except Exception as e:
+        return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+
+@app.route('/api/admission/metrics')
+async def get_admission_metrics():
+    """Get concurrency, queue depth and rejection counts per endpoint class"""
+    return jsonify({
+        'success': True,
+        'pid': os.getpid(),
+        'classes': admission.get_stats()
+    })
+
+if __name__ == '__main__':
+    print("🚀 Resume Analyzer and Job Match Recommender (ASGI)")
+    print("📊 Server starting on http://localhost:5000")
+    print(f"⚙️ Compute workers: {pool.workers}")
+
+    app.run(host='0.0.0.0', port=5000)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Bulk Resume Ingestion - Parses a directory or zip archive of resumes in parallel
+
+Usage (from the backend directory):
+    python bulk_ingest.py /path/to/resumes.zip --workers 8
+    python bulk_ingest.py /path/to/resume_dir --run-name agency_2024_06
+
+Progress is checkpointed in users.db, so re-running the same command after a
+crash skips every file that was already stored.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from database import init_database, get_connection, insert_resume_analysis
+
+SUPPORTED_EXTENSIONS = {'.pdf', '.docx', '.doc'}
+
+# Per-process state for pool workers
+_worker_parser = None
+_worker_archives = {}
+
+def _init_worker():
+    """Load the NLP models once per worker process"""
+    global _worker_parser
+    from resume_parser import ResumeParser
+    _worker_parser = ResumeParser()
+
+def _parse_file(source, file_key):
+    """Parse one resume in a worker; returns (file_key, parsed_data)"""
+    try:
+        if not zipfile.is_zipfile(source):
+            return file_key, _worker_parser.parse_resume(os.path.join(source, file_key))
+        return file_key, _parse_archive_member(source, file_key)
+    except Exception as e:
+        return file_key, {'success': False, 'error': str(e)}
+
+def _parse_archive_member(source, file_key):
+    # Keep the archive open so its central directory is only read once per worker
+    archive = _worker_archives.get(source)
+    if archive is None:
+        archive = _worker_archives[source] = zipfile.ZipFile(source)
+
+    # Parsers need a real file with the right extension
+    suffix = os.path.splitext(file_key)[1].lower()
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        with archive.open(file_key) as member:
+            shutil.copyfileobj(member, tmp)
+        tmp_path = tmp.name
+
+    try:
+        return _worker_parser.parse_resume(tmp_path)
+    finally:
+        os.remove(tmp_path)
+
+class BulkIngester:
+    """Parses many resumes with a process pool and stores them in batched transactions"""
+
+    def __init__(self, source, run_name=None, session_id=None, workers=None, batch_size=100):
+        self.source = source
+        self.run_name = run_name or os.path.splitext(os.path.basename(os.path.normpath(source)))[0]
+        self.session_id = session_id or f"bulk_{self.run_name}"
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+
+        self.processed = 0
+        self.failed = 0
+        self.started_at = None
+
+    def discover_files(self):
+        """List resume files in the directory or archive, in a stable order"""
+        if zipfile.is_zipfile(self.source):
+            with zipfile.ZipFile(self.source) as archive:
+                names = [
+                    info.filename for info in archive.infolist()
+                    if not info.is_dir() and os.path.splitext(info.filename)[1].lower() in SUPPORTED_EXTENSIONS
+                ]
+            return sorted(names)
+
+        file_keys = []
+        for root, _, files in os.walk(self.source):
+            for name in files:
+                if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS:
+                    file_keys.append(os.path.relpath(os.path.join(root, name), self.source))
+        return sorted(file_keys)
+
+    def completed_files(self, retry_failed=False):
+        """File keys already checkpointed for this run"""
+        conn = get_connection()
+        try:
+            query = 'SELECT file_key FROM ingest_checkpoints WHERE run_name = ?'
+            if retry_failed:
+                query += " AND status = 'ok'"
+            return {row[0] for row in conn.execute(query, (self.run_name,))}
+        finally:
+            conn.close()
+
+    def write_batch(self, results):
+        """Store parsed resumes and their checkpoints in one transaction"""
+        conn = get_connection()
+        try:
+            cursor = conn.cursor()
+            for file_key, parsed_data in results:
+                if parsed_data.get('success'):
+                    resume_id = insert_resume_analysis(cursor, self.session_id, os.path.basename(file_key), parsed_data)
+                    checkpoint = (self.run_name, file_key, 'ok', resume_id, None)
+                else:
+                    checkpoint = (self.run_name, file_key, 'failed', None, parsed_data.get('error'))
+
+                cursor.execute('''
+                    INSERT OR REPLACE INTO ingest_checkpoints
+                    (run_name, file_key, status, resume_id, error)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', checkpoint)
+            conn.commit()
+        finally:
+            conn.close()
+
+        self.processed += len(results)
+        self.failed += sum(1 for _, parsed_data in results if not parsed_data.get('success'))
+
+    def report(self, total):
+        elapsed = time.time() - self.started_at
+        rate = self.processed / elapsed if elapsed > 0 else 0.0
+        print(f"📄 {self.processed}/{total} files ({self.failed} failed) - {rate:.1f} files/sec")
+
+    def run(self, retry_failed=False):
+        """Ingest every file not yet checkpointed; returns a summary dict"""
+        init_database()
+
+        all_files = self.discover_files()
+        done = self.completed_files(retry_failed)
+        pending = [file_key for file_key in all_files if file_key not in done]
+        print(f"🚀 Ingesting {len(pending)} of {len(all_files)} resumes from {self.source} "
+              f"with {self.workers} workers (run '{self.run_name}')")
+
+        self.started_at = time.time()
+        buffer = []
+
+        # Bound the number of in-flight files so memory stays flat on huge inputs
+        max_in_flight = self.workers * 4
+        queue = iter(pending)
+        in_flight = set()
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as executor:
+            while True:
+                while len(in_flight) < max_in_flight:
+                    file_key = next(queue, None)
+                    if file_key is None:
+                        break
+                    in_flight.add(executor.submit(_parse_file, self.source, file_key))
+
+                if not in_flight:
+                    break
+
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    buffer.append(future.result())
+
+                if len(buffer) >= self.batch_size:
+                    self.write_batch(buffer)
+                    buffer = []
+                    self.report(len(pending))
+
+        if buffer:
+            self.write_batch(buffer)
+        self.report(len(pending))
+
+        elapsed = time.time() - self.started_at
+        return {
+            'run_name': self.run_name,
+            'session_id': self.session_id,
+            'processed': self.processed,
+            'failed': self.failed,
+            'skipped': len(all_files) - len(pending),
+            'elapsed_seconds': round(elapsed, 2),
+            'files_per_second': round(self.processed / elapsed, 2) if elapsed > 0 else 0.0
+        }
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Bulk-ingest resumes from a directory or zip archive')
+    arg_parser.add_argument('source', help='Directory or .zip archive containing PDF/DOCX resumes')
+    arg_parser.add_argument('--run-name', help='Checkpoint name; re-use it to resume an interrupted run')
+    arg_parser.add_argument('--session-id', help='Session to attach the resumes to (default: bulk_<run-name>)')
+    arg_parser.add_argument('--workers', type=int, help='Parser processes (default: CPU count)')
+    arg_parser.add_argument('--batch-size', type=int, default=100, help='Resumes per database transaction')
+    arg_parser.add_argument('--retry-failed', action='store_true', help='Parse files that failed in a previous run again')
+    args = arg_parser.parse_args()
+
+    ingester = BulkIngester(args.source, args.run_name, args.session_id, args.workers, args.batch_size)
+    summary = ingester.run(retry_failed=args.retry_failed)
+
+    print(f"✅ Ingested {summary['processed']} resumes ({summary['failed']} failed, "
+          f"{summary['skipped']} already done) at {summary['files_per_second']} files/sec")
+
+if __name__ == "__main__":
+    main()
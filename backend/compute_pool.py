@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Compute Pool - Runs CPU-bound parsing and matching in worker processes for the async server
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+# Per-process state, created once by the pool initializer
+_resume_parser = None
+_job_matcher = None
+
+def _init_worker(index_dir):
+    """Load the NLP models and map the shared job index once per worker"""
+    global _resume_parser, _job_matcher
+    from resume_parser import ResumeParser
+    from job_matcher import JobMatcher
+
+    _resume_parser = ResumeParser()
+    _job_matcher = JobMatcher(index_dir)
+    _job_matcher.load_index()
+
+def parse_resume(file_path):
+    # Pick up skills other processes learned and saved since this worker last checked
+    _resume_parser.skill_service.reload_if_changed()
+    return _resume_parser.parse_resume(file_path)
+
+def store_resume_profile(resume_id, resume_data):
+    _job_matcher.reload_index_if_changed()
+    return _job_matcher.store_resume_profile(resume_id, resume_data) is not None
+
+def resume_profile(resume_id):
+    _job_matcher.reload_index_if_changed()
+    return _job_matcher.resume_profile(resume_id)
+
+def rank_jobs(resume_data, top_n=10, rerank_k=None, budget_ms=None, profile=None):
+    """Rank the resume against the index; returns [(job record, score)] best-first"""
+    # Pick up snapshots the server published since this worker last looked
+    _job_matcher.reload_index_if_changed()
+
+    index = _job_matcher.index
+    if index is None:
+        return []
+
+    return [
+        (index.job_data.iloc[row].to_dict(), score)
+        for row, score in _job_matcher.rank_jobs(index, resume_data, top_n, rerank_k, budget_ms, profile)
+    ]
+
+def build_match(job, match_score, resume_data, include_gap=False):
+    return _job_matcher.build_match(job, match_score, resume_data, include_gap)
+
+def rank_for_paging(resume_data, limit=100, rerank_k=None, budget_ms=None, profile=None):
+    _job_matcher.reload_index_if_changed()
+    return _job_matcher.rank_for_paging(resume_data, limit, rerank_k, budget_ms, profile)
+
+def build_page(index_version, ranking, offset, page_size, resume_data, fields):
+    return _job_matcher.build_page(index_version, ranking, offset, page_size, resume_data, fields)
+
+def analyze_skill_gap(resume_skills, job_description):
+    return _job_matcher.analyze_skill_gap(resume_skills, job_description)
+
+class ComputePool:
+    """Process pool whose workers each hold a parser and a read-only mapping of the job index"""
+
+    def __init__(self, index_dir, workers=None):
+        self.index_dir = index_dir
+        self.workers = workers or int(os.getenv('COMPUTE_WORKERS', os.cpu_count() or 1))
+        self.executor = None
+
+    def start(self):
+        # spawn: never fork an event loop or model state half-initialized by another thread
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(self.index_dir,)
+        )
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    async def run(self, func, *args, **kwargs):
+        """Run func(*args, **kwargs) in a worker without blocking the event loop"""
+        if self.executor is None:
+            # run_in_executor(None, ...) would use the loop's thread pool, where the per-worker
+            # parser and matcher were never initialized
+            raise RuntimeError("ComputePool.run() called before start()")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
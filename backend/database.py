@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""
+Database - SQLite location, connections and schema shared by the app, scheduler and CLIs
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+
+DATABASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'database')
+
+def get_db_path():
+    """Return the path of the SQLite user database"""
+    return os.getenv('DATABASE_PATH', os.path.join(DATABASE_DIR, 'users.db'))
+
+def get_connection(timeout=30):
+    """Open a connection to the user database"""
+    return sqlite3.connect(get_db_path(), timeout=timeout)
+
+def init_database():
+    """Initialize SQLite database for storing user data"""
+    # Create database directory if it doesn't exist
+    os.makedirs(os.path.dirname(get_db_path()), exist_ok=True)
+
+    # Connect to database
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    # Create users table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Create resume_analyses table (narrow metadata read by history lookups)
+    reclaim_space = migrate_resume_analyses(cursor)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS resume_analyses (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT,
+            filename TEXT,
+            skills TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (session_id) REFERENCES users (session_id)
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_analyses_session ON resume_analyses (session_id)')
+
+    # Create resume_blobs table (compressed text and large JSON, loaded only when asked for)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS resume_blobs (
+            resume_id INTEGER PRIMARY KEY,
+            extracted_text BLOB,
+            experience BLOB,
+            education BLOB,
+            FOREIGN KEY (resume_id) REFERENCES resume_analyses (id)
+        )
+    ''')
+
+    # Create jobs table (one row per distinct posting, ids stay stable across index rebuilds)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_key TEXT UNIQUE,
+            title TEXT,
+            company TEXT,
+            location TEXT,
+            description TEXT,
+            requirements TEXT,
+            salary_range TEXT,
+            job_type TEXT,
+            experience_level TEXT,
+            url TEXT,
+            source TEXT,
+            first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Create job_matches table
+    migrate_job_matches(cursor)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS job_matches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            resume_id INTEGER,
+            job_id INTEGER,
+            match_score REAL,
+            session_id TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (resume_id) REFERENCES resume_analyses (id),
+            FOREIGN KEY (job_id) REFERENCES jobs (id)
+        )
+    ''')
+    if 'session_id' not in [row[1] for row in cursor.execute('PRAGMA table_info(job_matches)')]:
+        cursor.execute('ALTER TABLE job_matches ADD COLUMN session_id TEXT')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_job_matches_resume ON job_matches (resume_id)')
+
+    # Create scheduler_tasks table (shared state for background refresh tasks)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS scheduler_tasks (
+            name TEXT PRIMARY KEY,
+            next_run REAL,
+            last_run REAL,
+            last_duration REAL,
+            last_status TEXT,
+            lease_owner TEXT,
+            lease_expires REAL
+        )
+    ''')
+
+    # Create ingest_checkpoints table (progress of bulk ingestion runs)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ingest_checkpoints (
+            run_name TEXT,
+            file_key TEXT,
+            status TEXT,
+            resume_id INTEGER,
+            error TEXT,
+            processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (run_name, file_key)
+        )
+    ''')
+
+    # Create match_rankings table (full rankings behind paginated match responses)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS match_rankings (
+            id TEXT PRIMARY KEY,
+            index_version TEXT,
+            resume_skills TEXT,
+            ranking TEXT,
+            created_at REAL
+        )
+    ''')
+
+    # Create resume_vectors table (resume vectors cached per job index version)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS resume_vectors (
+            resume_id INTEGER PRIMARY KEY,
+            index_version TEXT,
+            vector_indices BLOB,
+            vector_data BLOB,
+            signature BLOB,
+            features TEXT,
+            created_at REAL,
+            FOREIGN KEY (resume_id) REFERENCES resume_analyses (id)
+        )
+    ''')
+
+    conn.commit()
+
+    # VACUUM cannot run inside a transaction, so pages freed by the migration are reclaimed after commit
+    if reclaim_space:
+        conn.execute('VACUUM')
+        print("✅ Reclaimed space freed by the resume_analyses migration")
+    conn.close()
+
+def migrate_resume_analyses(cursor):
+    """
+    Move extracted text and large JSON out of resume_analyses into compressed resume_blobs.
+
+    Returns True when rows were moved, so the caller can VACUUM once committed.
+    """
+    columns = [row[1] for row in cursor.execute('PRAGMA table_info(resume_analyses)')]
+    if 'extracted_text' not in columns:
+        return False
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS resume_blobs (
+            resume_id INTEGER PRIMARY KEY,
+            extracted_text BLOB,
+            experience BLOB,
+            education BLOB,
+            FOREIGN KEY (resume_id) REFERENCES resume_analyses (id)
+        )
+    ''')
+
+    migrated = 0
+    rows = cursor.execute('SELECT id, extracted_text, experience, education FROM resume_analyses')
+    while True:
+        batch = rows.fetchmany(500)
+        if not batch:
+            break
+        cursor.connection.executemany(
+            'INSERT OR REPLACE INTO resume_blobs (resume_id, extracted_text, experience, education) VALUES (?, ?, ?, ?)',
+            [(resume_id, compress_text(text), compress_text(experience), compress_text(education))
+             for resume_id, text, experience, education in batch]
+        )
+        migrated += len(batch)
+
+    # Rebuild the table without the wide columns; ids are kept so matches still join
+    cursor.execute('''
+        CREATE TABLE resume_analyses_narrow (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT,
+            filename TEXT,
+            skills TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (session_id) REFERENCES users (session_id)
+        )
+    ''')
+    cursor.execute('''
+        INSERT INTO resume_analyses_narrow (id, session_id, filename, skills, created_at)
+        SELECT id, session_id, filename, skills, created_at FROM resume_analyses
+    ''')
+    cursor.execute('DROP TABLE resume_analyses')
+    cursor.execute('ALTER TABLE resume_analyses_narrow RENAME TO resume_analyses')
+    print(f"✅ Moved text of {migrated} resumes into compressed resume_blobs")
+    return True
+
+def migrate_job_matches(cursor):
+    """
+    Move job_matches rows that embed job text into jobs + (resume_id, job_id, score) rows.
+
+    Legacy rows recorded without a resume_id keep their session_id so they
+    still show up in that session's history.
+    """
+    columns = [row[1] for row in cursor.execute('PRAGMA table_info(job_matches)')]
+    if 'job_description' not in columns:
+        return
+
+    rows = cursor.execute('''
+        SELECT resume_id, job_title, company, match_score, job_description, created_at, session_id
+        FROM job_matches
+    ''').fetchall()
+
+    cursor.execute('ALTER TABLE job_matches RENAME TO job_matches_legacy')
+    cursor.execute('''
+        CREATE TABLE job_matches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            resume_id INTEGER,
+            job_id INTEGER,
+            match_score REAL,
+            session_id TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (resume_id) REFERENCES resume_analyses (id),
+            FOREIGN KEY (job_id) REFERENCES jobs (id)
+        )
+    ''')
+
+    job_ids = upsert_jobs(cursor, [
+        {'title': title, 'company': company, 'description': description}
+        for _, title, company, _, description, _, _ in rows
+    ], touch=False)
+    cursor.executemany(
+        'INSERT INTO job_matches (resume_id, job_id, match_score, session_id, created_at) VALUES (?, ?, ?, ?, ?)',
+        [
+            (resume_id, job_ids[job_key(title, company)], match_score,
+             session_id if resume_id is None else None, created_at)
+            for resume_id, title, company, match_score, _, created_at, session_id in rows
+        ]
+    )
+    cursor.execute('DROP TABLE job_matches_legacy')
+    print(f"✅ Migrated {len(rows)} job matches to the normalized jobs table")
+
+def job_key(title, company):
+    """Stable identity of a posting: the same (title, company) always maps to the same job id"""
+    normalized = f"{str(title).strip().lower()}|{str(company).strip().lower()}"
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+JOB_COLUMNS = ('title', 'company', 'location', 'description', 'requirements', 'salary_range',
+               'job_type', 'experience_level', 'url', 'source')
+
+def upsert_jobs(cursor, jobs, touch=True):
+    """
+    Insert or refresh job postings and return {job_key: job_id}.
+
+    Existing rows keep their id; their details are updated to the latest
+    posting and, when touch is set, last_seen moves to now.
+    """
+    records = {}
+    for job in jobs:
+        key = job_key(job.get('title', ''), job.get('company', ''))
+        records[key] = tuple(str(job.get(column, '') or '') for column in JOB_COLUMNS)
+
+    placeholders = ', '.join('?' for _ in JOB_COLUMNS)
+    updates = ', '.join(f"{column} = excluded.{column}" for column in JOB_COLUMNS)
+    if touch:
+        updates += ', last_seen = CURRENT_TIMESTAMP'
+
+    cursor.executemany(f'''
+        INSERT INTO jobs (job_key, {', '.join(JOB_COLUMNS)}) VALUES (?, {placeholders})
+        ON CONFLICT(job_key) DO UPDATE SET {updates}
+    ''', [(key, *values) for key, values in records.items()])
+
+    # Look ids up in chunks to stay under SQLite's bound-variable limit
+    keys = list(records)
+    job_ids = {}
+    for start in range(0, len(keys), 500):
+        chunk = keys[start:start + 500]
+        rows = cursor.execute(
+            f"SELECT job_key, id FROM jobs WHERE job_key IN ({', '.join('?' for _ in chunk)})", chunk
+        ).fetchall()
+        job_ids.update(rows)
+    return job_ids
+
+def sync_jobs(jobs):
+    """Upsert a batch of postings in one transaction and return {job_key: job_id}"""
+    conn = get_connection()
+    try:
+        job_ids = upsert_jobs(conn.cursor(), jobs)
+        conn.commit()
+        return job_ids
+    finally:
+        conn.close()
+
+def compress_text(text):
+    return zlib.compress(text.encode('utf-8'), 6) if text is not None else None
+
+def decompress_text(blob):
+    return zlib.decompress(blob).decode('utf-8') if blob is not None else None
+
+def insert_resume_analysis(cursor, session_id, filename, parsed_data):
+    """Insert a parsed resume for a session and return its id (the caller commits)"""
+    # Insert or update user
+    cursor.execute('INSERT OR IGNORE INTO users (session_id) VALUES (?)', (session_id,))
+
+    # Insert resume analysis
+    cursor.execute('''
+        INSERT INTO resume_analyses (session_id, filename, skills)
+        VALUES (?, ?, ?)
+    ''', (session_id, filename, json.dumps(parsed_data['skills'])))
+    resume_id = cursor.lastrowid
+
+    cursor.execute('''
+        INSERT INTO resume_blobs (resume_id, extracted_text, experience, education)
+        VALUES (?, ?, ?, ?)
+    ''', (
+        resume_id,
+        compress_text(parsed_data['text']),
+        compress_text(json.dumps(parsed_data['experience'])),
+        compress_text(json.dumps(parsed_data['education']))
+    ))
+
+    return resume_id
+
+def get_resume_details(resume_id):
+    """Return the skills, full text, experience and education of a resume, or None"""
+    conn = get_connection()
+    try:
+        row = conn.execute('''
+            SELECT rb.extracted_text, rb.experience, rb.education, ra.skills
+            FROM resume_blobs rb
+            JOIN resume_analyses ra ON ra.id = rb.resume_id
+            WHERE rb.resume_id = ?
+        ''', (resume_id,)).fetchone()
+    finally:
+        conn.close()
+
+    if row is None:
+        return None
+
+    experience, education = decompress_text(row[1]), decompress_text(row[2])
+    return {
+        'id': resume_id,
+        'skills': json.loads(row[3]) if row[3] else [],
+        'text': decompress_text(row[0]) or '',
+        'experience': json.loads(experience) if experience else [],
+        'education': json.loads(education) if education else []
+    }
+
+def save_resume_analysis(session_id, filename, parsed_data):
+    """Insert a parsed resume in its own transaction and return its id"""
+    conn = get_connection()
+    try:
+        resume_id = insert_resume_analysis(conn.cursor(), session_id, filename, parsed_data)
+        conn.commit()
+        return resume_id
+    finally:
+        conn.close()
+
+def insert_job_matches(cursor, resume_id, matches):
+    """Record the matches shown for a resume by job id (the caller commits)"""
+    cursor.executemany(
+        'INSERT INTO job_matches (resume_id, job_id, match_score) VALUES (?, ?, ?)',
+        [(resume_id, match['job_id'], match['match_score']) for match in matches if match.get('job_id') is not None]
+    )
+
+def store_job_matches(resume_id, matches):
+    """Insert the matches shown for a resume in their own transaction"""
+    conn = get_connection()
+    try:
+        insert_job_matches(conn.cursor(), resume_id, matches)
+        conn.commit()
+    finally:
+        conn.close()
+
+def get_session_history(session_id):
+    """Return (resumes, matches) recorded for a session, newest first"""
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+
+        # Get resume analyses
+        cursor.execute('''
+            SELECT id, filename, skills, created_at
+            FROM resume_analyses
+            WHERE session_id = ?
+            ORDER BY created_at DESC
+        ''', (session_id,))
+
+        resumes = []
+        for row in cursor.fetchall():
+            resumes.append({
+                'id': row[0],
+                'filename': row[1],
+                'skills': json.loads(row[2]) if row[2] else [],
+                'created_at': row[3]
+            })
+
+        # Get job matches
+        cursor.execute('''
+            SELECT jobs.title, jobs.company, job_matches.match_score, job_matches.created_at
+            FROM job_matches
+            LEFT JOIN resume_analyses ON resume_analyses.id = job_matches.resume_id
+            JOIN jobs ON jobs.id = job_matches.job_id
+            WHERE resume_analyses.session_id = ?
+               OR (job_matches.resume_id IS NULL AND job_matches.session_id = ?)
+            ORDER BY job_matches.created_at DESC
+            LIMIT 20
+        ''', (session_id, session_id))
+
+        matches = []
+        for row in cursor.fetchall():
+            matches.append({
+                'job_title': row[0],
+                'company': row[1],
+                'match_score': row[2],
+                'created_at': row[3]
+            })
+
+        return resumes, matches
+    finally:
+        conn.close()
+
+def save_match_ranking(ranking_id, index_version, resume_skills, ranking, ttl=1800):
+    """Store a full ranking for later pages and drop rankings older than ttl seconds"""
+    now = time.time()
+    conn = get_connection()
+    try:
+        conn.execute('DELETE FROM match_rankings WHERE created_at < ?', (now - ttl,))
+        conn.execute('''
+            INSERT INTO match_rankings (id, index_version, resume_skills, ranking, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (ranking_id, index_version, json.dumps(resume_skills), json.dumps(ranking), now))
+        conn.commit()
+    finally:
+        conn.close()
+
+def load_match_ranking(ranking_id, ttl=1800):
+    """Return a stored ranking as a dict, or None if it is unknown or expired"""
+    conn = get_connection()
+    try:
+        row = conn.execute('''
+            SELECT index_version, resume_skills, ranking
+            FROM match_rankings
+            WHERE id = ? AND created_at >= ?
+        ''', (ranking_id, time.time() - ttl)).fetchone()
+    finally:
+        conn.close()
+
+    if row is None:
+        return None
+    return {
+        'index_version': row[0],
+        'resume_skills': json.loads(row[1]),
+        'ranking': json.loads(row[2])
+    }
+
+def save_resume_vector(resume_id, index_version, vector_indices, vector_data, signature, features):
+    """Store a resume's encoded vector and match features, replacing any older version"""
+    conn = get_connection()
+    try:
+        conn.execute('''
+            INSERT OR REPLACE INTO resume_vectors
+                (resume_id, index_version, vector_indices, vector_data, signature, features, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (resume_id, index_version, vector_indices, vector_data, signature, json.dumps(features), time.time()))
+        conn.commit()
+    finally:
+        conn.close()
+
+def load_resume_vector(resume_id):
+    """Return a stored resume vector as a dict of raw bytes and features, or None"""
+    conn = get_connection()
+    try:
+        row = conn.execute('''
+            SELECT index_version, vector_indices, vector_data, signature, features
+            FROM resume_vectors
+            WHERE resume_id = ?
+        ''', (resume_id,)).fetchone()
+    finally:
+        conn.close()
+
+    if row is None:
+        return None
+    return {
+        'index_version': row[0],
+        'vector_indices': row[1],
+        'vector_data': row[2],
+        'signature': row[3],
+        'features': json.loads(row[4])
+    }
@@ -13,11 +13,143 @@ from textblob import TextBlob
 import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
-import pickle
 import os
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from skill_store import SkillStore
+from skill_trends import SkillTrendTracker
+
+# Patterns for identifying potential skills, compiled once per process
+SKILL_PATTERNS = [
+    re.compile(r'\b([A-Z][a-z]+(?:\.[a-z]+)*)\b', re.IGNORECASE),  # CamelCase or dotted (React.js, Node.js)
+    re.compile(r'\b([a-z]+(?:-[a-z]+)+)\b', re.IGNORECASE),        # hyphenated (scikit-learn, vue-cli)
+    re.compile(r'\b([A-Z]{2,})\b', re.IGNORECASE),                 # Acronyms (AWS, API, SQL)
+    re.compile(r'\b([a-z]+\+\+?)\b', re.IGNORECASE),               # Plus versions (C++, C+)
+]
+
+# Common skill contexts
+SKILL_CONTEXT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in [
+        r'experience (?:with|in|using) ([^,.]+)',
+        r'proficient (?:with|in|using) ([^,.]+)',
+        r'knowledge of ([^,.]+)',
+        r'familiar with ([^,.]+)',
+        r'skills?:?\s*([^.]+)',
+        r'technologies?:?\s*([^.]+)',
+        r'tools?:?\s*([^.]+)',
+        r'frameworks?:?\s*([^.]+)',
+        r'languages?:?\s*([^.]+)'
+    ]
+]
+
+SKILL_SEPARATOR_PATTERN = re.compile(r'[,;/&\n\r]+')
+TECH_EXTENSION_PATTERN = re.compile(r'\.(js|py|java|cpp|cs)$')
+PLUS_VERSION_PATTERN = re.compile(r'^[a-z]+\+\+?$')
+DIGIT_PATTERN = re.compile(r'\d+')
+
+# Common non-skill words
+NON_SKILLS = frozenset([
+    'experience', 'years', 'work', 'team', 'project', 'development',
+    'software', 'application', 'system', 'solution', 'business',
+    'company', 'position', 'role', 'job', 'career', 'opportunity'
+])
+
+TECH_CONTEXT_KEYWORDS = (
+    'programming', 'coding', 'development', 'framework', 'library',
+    'database', 'cloud', 'devops', 'frontend', 'backend'
+)
+
+def extract_potential_skills(text):
+    """Extract potential skills from text using multiple patterns"""
+    potential_skills = set()
+
+    # Method 1: Pattern matching
+    for pattern in SKILL_PATTERNS:
+        potential_skills.update(pattern.findall(text))
+
+    # Method 2: Common skill contexts
+    for pattern in SKILL_CONTEXT_PATTERNS:
+        for match in pattern.findall(text):
+            # Split by common separators
+            for skill in SKILL_SEPARATOR_PATTERN.split(match):
+                skill = skill.strip()
+                if len(skill) > 1 and len(skill) < 30:
+                    potential_skills.add(skill)
+
+    # Method 3: Noun phrases (requires TextBlob)
+    try:
+        blob = TextBlob(text)
+        for phrase in blob.noun_phrases:
+            if len(phrase.split()) <= 3:  # Max 3 words
+                potential_skills.add(phrase)
+    except:
+        pass
+
+    return potential_skills
+
+def has_tech_context(text):
+    """Check once per document whether it mentions technical context keywords"""
+    text_lower = text.lower()
+    return any(keyword in text_lower for keyword in TECH_CONTEXT_KEYWORDS)
+
+def is_likely_skill(skill_lower, stop_words, known_skills, tech_context):
+    """Determine if a lowercased candidate is likely a real technical skill"""
+    # Skip if too short or too long
+    if len(skill_lower) < 2 or len(skill_lower) > 25:
+        return False
+
+    # Skip common words
+    if skill_lower in stop_words or skill_lower in NON_SKILLS:
+        return False
+
+    # Positive indicators, cheapest first
+    return (
+        # Context clues (precomputed for the whole document)
+        tech_context
+        # Already known skills
+        or skill_lower in known_skills
+        # Common tech suffixes/prefixes
+        or skill_lower.endswith(('.js', '.py', 'sql', 'db'))
+        or skill_lower.startswith(('micro', 'web', 'api'))
+        # Technical patterns
+        or bool(TECH_EXTENSION_PATTERN.search(skill_lower))
+        or bool(PLUS_VERSION_PATTERN.search(skill_lower))  # C++, C+
+        # Version numbers
+        or bool(DIGIT_PATTERN.search(skill_lower))
+    )
+
+def learn_from_batch(descriptions, stop_words, known_skills, max_contexts):
+    """
+    Learn from one batch of job descriptions.
+
+    Returns a Counter of skill mentions (one per document) and, for each skill,
+    up to max_contexts description snippets. Runs in pool worker processes.
+    """
+    frequency = Counter()
+    contexts = defaultdict(list)
+
+    for description in descriptions:
+        if not description:
+            continue
+
+        tech_context = has_tech_context(description)
+        snippet = description[:100]
+        document_skills = set()
+
+        for skill in extract_potential_skills(description):
+            skill_lower = skill.lower().strip()
+            if is_likely_skill(skill_lower, stop_words, known_skills, tech_context):
+                document_skills.add(skill.lower())
+
+        for skill in document_skills:
+            frequency[skill] += 1
+            if len(contexts[skill]) < max_contexts:
+                contexts[skill].append(snippet)
+
+    return frequency, dict(contexts)
 
 class DynamicSkillLearner:
-    def __init__(self):
+    def __init__(self, store_path="database/learned_skills.db", max_contexts_per_skill=20):
         """Initialize the dynamic skill learning system"""
         
         # Download required NLTK data
@@ -42,21 +174,27 @@ class DynamicSkillLearner:
             'tools': set(['git', 'docker', 'kubernetes', 'jenkins', 'terraform', 'ansible'])
         }
         
-        # Dynamic skills learned from data
-        self.learned_skills = defaultdict(set)
-        self.skill_frequency = Counter()
-        self.skill_contexts = defaultdict(list)
-        
-        # Load existing learned skills
-        self.load_learned_skills()
+        # Dynamic skills learned from data, persisted incrementally
+        self.store = SkillStore(store_path, max_contexts=max_contexts_per_skill)
+        self._learned_skills = None  # loaded lazily on first access
+
+        # Changes not yet written by save_learned_skills()
+        self._new_skills = set()
+        self._frequency_delta = Counter()
+        self._pending_contexts = []
+
+        # Import skills saved by older versions in the pickle format
+        self.migrate_pickle(os.path.splitext(store_path)[0] + '.pkl')
+
+        # Time-decayed trend sketches (constant size, saved alongside the deltas).
+        # Mentions not yet saved are also kept in their own tracker, which is merged
+        # into the stored state on save so other processes' mentions are kept.
+        self.trends = self.load_trends()
+        self._trend_delta = SkillTrendTracker()
         
         # Patterns for identifying potential skills
-        self.skill_patterns = [
-            r'\b([A-Z][a-z]+(?:\.[a-z]+)*)\b',  # CamelCase or dotted (React.js, Node.js)
-            r'\b([a-z]+(?:-[a-z]+)+)\b',        # hyphenated (scikit-learn, vue-cli)
-            r'\b([A-Z]{2,})\b',                 # Acronyms (AWS, API, SQL)
-            r'\b([a-z]+\+\+?)\b',               # Plus versions (C++, C+)
-        ]
+        self.skill_patterns = SKILL_PATTERNS
+        self.max_contexts_per_skill = max_contexts_per_skill
     
     def fetch_trending_skills_from_github(self):
         """Fetch trending technologies from GitHub API (Free)"""
@@ -125,118 +263,64 @@ class DynamicSkillLearner:
             print(f"Error fetching StackOverflow tags: {e}")
             return set()
     
-    def learn_skills_from_job_postings(self, job_descriptions):
-        """Learn new skills from job posting descriptions"""
+    def learn_skills_from_job_postings(self, job_descriptions, workers=None, batch_size=256,
+                                       parallel_threshold=500, timestamp=None):
+        """
+        Learn new skills from job posting descriptions.
+
+        Descriptions are processed in batches; large inputs fan out across a
+        process pool and the per-batch counters are merged here.
+        """
+        job_descriptions = [description for description in job_descriptions if description]
+        known_skills = frozenset().union(*self.base_skills.values())
+        batches = [job_descriptions[i:i + batch_size] for i in range(0, len(job_descriptions), batch_size)]
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers > 1 and len(job_descriptions) >= parallel_threshold:
+            # spawn avoids forking a process that may be running server threads
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                futures = [
+                    executor.submit(learn_from_batch, batch, self.stop_words, known_skills,
+                                    self.max_contexts_per_skill)
+                    for batch in batches
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [
+                learn_from_batch(batch, self.stop_words, known_skills, self.max_contexts_per_skill)
+                for batch in batches
+            ]
+
         new_skills = set()
-        
-        for description in job_descriptions:
-            if not description:
-                continue
-            
-            # Extract potential skills using various methods
-            potential_skills = self.extract_potential_skills(description)
-            
-            for skill in potential_skills:
-                # Validate if it's likely a real skill
-                if self.is_likely_skill(skill, description):
-                    new_skills.add(skill.lower())
-                    self.skill_frequency[skill.lower()] += 1
-                    self.skill_contexts[skill.lower()].append(description[:100])
-        
+        for frequency, contexts in results:
+            new_skills.update(frequency)
+            self._frequency_delta.update(frequency)
+            self.observe_trends(frequency, timestamp)
+            for skill, skill_contexts in contexts.items():
+                self._pending_contexts.extend((skill, context) for context in skill_contexts)
+
         # Categorize new skills
         categorized_skills = self.categorize_skills(new_skills)
         
         # Add to learned skills
         for category, skills in categorized_skills.items():
-            self.learned_skills[category].update(skills)
+            self.add_learned_skills(category, skills)
         
-        print(f"🧠 Learned {len(new_skills)} new skills from job postings")
+        print(f"🧠 Learned {len(new_skills)} new skills from {len(job_descriptions)} job postings")
         return new_skills
     
     def extract_potential_skills(self, text):
         """Extract potential skills from text using multiple patterns"""
-        potential_skills = set()
-        
-        # Method 1: Pattern matching
-        for pattern in self.skill_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            potential_skills.update(matches)
-        
-        # Method 2: Common skill contexts
-        skill_contexts = [
-            r'experience (?:with|in|using) ([^,.]+)',
-            r'proficient (?:with|in|using) ([^,.]+)',
-            r'knowledge of ([^,.]+)',
-            r'familiar with ([^,.]+)',
-            r'skills?:?\s*([^.]+)',
-            r'technologies?:?\s*([^.]+)',
-            r'tools?:?\s*([^.]+)',
-            r'frameworks?:?\s*([^.]+)',
-            r'languages?:?\s*([^.]+)'
-        ]
-        
-        for pattern in skill_contexts:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # Split by common separators
-                skills = re.split(r'[,;/&\n\r]+', match)
-                for skill in skills:
-                    skill = skill.strip()
-                    if len(skill) > 1 and len(skill) < 30:
-                        potential_skills.add(skill)
-        
-        # Method 3: Noun phrases (requires TextBlob)
-        try:
-            blob = TextBlob(text)
-            for phrase in blob.noun_phrases:
-                if len(phrase.split()) <= 3:  # Max 3 words
-                    potential_skills.add(phrase)
-        except:
-            pass
-        
-        return potential_skills
+        return extract_potential_skills(text)
     
     def is_likely_skill(self, potential_skill, context):
         """Determine if a potential skill is likely a real technical skill"""
-        skill_lower = potential_skill.lower().strip()
-        
-        # Skip if too short or too long
-        if len(skill_lower) < 2 or len(skill_lower) > 25:
-            return False
-        
-        # Skip common words
-        if skill_lower in self.stop_words:
-            return False
-        
-        # Skip common non-skill words
-        non_skills = {
-            'experience', 'years', 'work', 'team', 'project', 'development',
-            'software', 'application', 'system', 'solution', 'business',
-            'company', 'position', 'role', 'job', 'career', 'opportunity'
-        }
-        if skill_lower in non_skills:
-            return False
-        
-        # Positive indicators
-        positive_indicators = [
-            # Already known skills
-            any(skill_lower in category_skills for category_skills in self.base_skills.values()),
-            # Technical patterns
-            bool(re.search(r'\.(js|py|java|cpp|cs)$', skill_lower)),
-            bool(re.search(r'^[a-z]+\+\+?$', skill_lower)),  # C++, C+
-            # Common tech suffixes/prefixes
-            any(skill_lower.endswith(suffix) for suffix in ['.js', '.py', 'sql', 'db']),
-            any(skill_lower.startswith(prefix) for prefix in ['micro', 'web', 'api']),
-            # Version numbers
-            bool(re.search(r'\d+', skill_lower)),
-            # Context clues
-            any(keyword in context.lower() for keyword in [
-                'programming', 'coding', 'development', 'framework', 'library',
-                'database', 'cloud', 'devops', 'frontend', 'backend'
-            ])
-        ]
-        
-        return any(positive_indicators)
+        known_skills = frozenset().union(*self.base_skills.values())
+        return is_likely_skill(potential_skill.lower().strip(), self.stop_words, known_skills,
+                               has_tech_context(context))
     
     def categorize_skills(self, skills):
         """Automatically categorize skills based on patterns and context"""
@@ -300,9 +384,10 @@ class DynamicSkillLearner:
         
         # Add to learned skills
         for category, skills in categorized.items():
-            self.learned_skills[category].update(skills)
+            self.add_learned_skills(category, skills)
             for skill in skills:
-                self.skill_frequency[skill] += 1
+                self._frequency_delta[skill] += 1
+            self.observe_trends({skill: 1 for skill in skills})
         
         print(f"✅ Added {len(all_external_skills)} skills from external sources")
     
@@ -321,39 +406,120 @@ class DynamicSkillLearner:
         
         return all_skills
     
-    def get_trending_skills(self, top_n=20):
-        """Get most frequently mentioned skills"""
-        return self.skill_frequency.most_common(top_n)
-    
-    def save_learned_skills(self, filename="database/learned_skills.pkl"):
-        """Save learned skills to file"""
-        data = {
-            'learned_skills': dict(self.learned_skills),
-            'skill_frequency': dict(self.skill_frequency),
-            'skill_contexts': dict(self.skill_contexts),
-            'last_updated': datetime.now().isoformat()
-        }
-        
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        with open(filename, 'wb') as f:
-            pickle.dump(data, f)
-        
-        print(f"💾 Saved learned skills to {filename}")
-    
-    def load_learned_skills(self, filename="database/learned_skills.pkl"):
+    @property
+    def learned_skills(self):
+        """Learned skills by category, loaded from the store on first use"""
+        if self._learned_skills is None:
+            self.load_learned_skills()
+        return self._learned_skills
+
+    def add_learned_skills(self, category, skills):
+        """Add skills to a category and remember which ones still need saving"""
+        known = self.learned_skills[category]
+        for skill in skills:
+            if skill not in known:
+                known.add(skill)
+                self._new_skills.add((category, skill))
+
+    def get_trending_skills(self, top_n=20, window=None):
+        """Get most frequently mentioned skills, all-time or in a decay window ('week' or 'month')"""
+        if window is not None:
+            return self.trends.top(window, top_n)
+
+        if not self._frequency_delta:
+            return self.store.top_skills(top_n)
+
+        # Merge unsaved counts with the stored top skills
+        candidates = Counter(dict(self.store.top_skills(top_n + len(self._frequency_delta))))
+        for skill in self._frequency_delta:
+            if skill not in candidates:
+                candidates[skill] = self.store.get_frequency(skill)
+        candidates.update(self._frequency_delta)
+        return candidates.most_common(top_n)
+
+    def compare_trending_skills(self, top_n=20, short_window='week', long_window='month'):
+        """Skills trending this week relative to the last month"""
+        return self.trends.compare(short_window, long_window, top_n)
+
+    def observe_trends(self, skill_counts, timestamp=None):
+        self.trends.observe(skill_counts, timestamp)
+        self._trend_delta.observe(skill_counts, timestamp)
+
+    def load_trends(self, payload=None):
+        """Restore the trend sketches saved with the learned skills"""
+        try:
+            payload = payload or self.store.get_meta('trend_state')
+            if payload:
+                return SkillTrendTracker.from_json(payload)
+        except Exception as e:
+            print(f"Warning: Could not load skill trends: {e}")
+        return SkillTrendTracker()
+
+    def merge_trend_state(self, payload):
+        """Stored trend state plus the mentions this process has not saved yet"""
+        trends = self.load_trends(payload) if payload else SkillTrendTracker()
+        trends.merge(self._trend_delta)
+        return trends
+
+    def get_skill_contexts(self, skill):
+        """Get sampled job description snippets in which a skill was seen"""
+        skill = skill.lower()
+        pending = [context for pending_skill, context in self._pending_contexts if pending_skill == skill]
+        return self.store.get_contexts(skill) + pending
+
+    def save_learned_skills(self):
+        """Write skills, counts and contexts learned since the last save
+
+        Returns the store version before and after the write, or None when there was nothing to save.
+        """
+        if not (self._new_skills or self._frequency_delta or self._pending_contexts):
+            return None
+
+        # Merge into the stored sketches inside the write transaction; replacing them
+        # would drop mentions that other workers saved since this process loaded them
+        merged = []
+        def merge_trends(payload):
+            merged.append(self.merge_trend_state(payload))
+            return merged[-1].to_json()
+
+        versions = self.store.apply_delta(self._new_skills, self._frequency_delta, self._pending_contexts,
+                                          merge_meta={'trend_state': merge_trends})
+        print(f"💾 Saved {len(self._new_skills)} new skills and {sum(self._frequency_delta.values())} "
+              f"mentions to {self.store.db_path}")
+
+        self.trends = merged[-1]
+        self._trend_delta = SkillTrendTracker()
+        self._new_skills = set()
+        self._frequency_delta = Counter()
+        self._pending_contexts = []
+        return versions
+
+    def load_learned_skills(self):
         """Load previously learned skills"""
         try:
-            if os.path.exists(filename):
-                with open(filename, 'rb') as f:
-                    data = pickle.load(f)
-                
-                self.learned_skills = defaultdict(set, {k: set(v) for k, v in data.get('learned_skills', {}).items()})
-                self.skill_frequency = Counter(data.get('skill_frequency', {}))
-                self.skill_contexts = defaultdict(list, data.get('skill_contexts', {}))
-                
-                print(f"📚 Loaded {sum(len(skills) for skills in self.learned_skills.values())} learned skills")
+            self._learned_skills = self.store.load_learned_skills()
+            print(f"📚 Loaded {sum(len(skills) for skills in self._learned_skills.values())} learned skills")
         except Exception as e:
             print(f"Warning: Could not load learned skills: {e}")
+            self._learned_skills = defaultdict(set)
+
+    def reload_learned_skills(self):
+        """Re-read learned skills from the store, keeping skills this process has not saved yet"""
+        unsaved = set(self._new_skills)
+        self.load_learned_skills()
+        for category, skill in unsaved:
+            self._learned_skills[category].add(skill)
+        self.trends = self.merge_trend_state(self.store.get_meta('trend_state'))
+
+    def migrate_pickle(self, filename):
+        """Import a learned_skills.pkl written by older versions into an empty store"""
+        try:
+            if os.path.exists(filename) and self.store.is_empty():
+                count = self.store.import_pickle(filename)
+                os.rename(filename, filename + '.migrated')
+                print(f"📦 Migrated {count} learned skills from {filename}")
+        except Exception as e:
+            print(f"Warning: Could not migrate learned skills: {e}")
 
 # Test function
 if __name__ == "__main__":
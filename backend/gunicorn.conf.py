@@ -0,0 +1,54 @@
+"""
+Gunicorn configuration - builds the job index once in the master and shares it with workers
+
+Run from the backend directory:
+    gunicorn -c gunicorn.conf.py app:app
+
+Set WARMUP=false to skip the pre-fork warm-up and GC freeze.
+"""
+
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+workers = int(os.getenv('WEB_CONCURRENCY', '2'))
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+timeout = 120
+
+# Import app.py in the master so models and the job index are loaded before fork
+preload_app = True
+
+warmup_enabled = os.getenv('WARMUP', 'true').lower() == 'true'
+
+def on_starting(server):
+    """Build (or map) the job index in the master process and warm every lazy path"""
+    import app
+    import warmup
+    app.init_app()
+
+    if warmup_enabled:
+        # A failed warm-up only costs first-request latency; it must not stop the server starting
+        try:
+            warmup.warm_up(app.resume_parser, app.job_matcher)
+        except Exception as e:
+            server.log.warning(f"⚠️ Warm-up failed: {e}")
+        warmup.freeze_heap()
+
+def pre_fork(server, worker):
+    """Freeze objects the master created since the last fork so workers share their pages"""
+    if warmup_enabled:
+        import gc
+        gc.freeze()
+
+def post_worker_init(worker):
+    """Map the index the master wrote to disk and start background refreshes"""
+    import app
+    if app.job_matcher.index is None:
+        app.job_matcher.load_index()
+
+    # Threads do not survive fork, so each worker starts its own scheduler
+    app.start_scheduler()
+
+    import warmup
+    usage = warmup.memory_usage()
+    if usage is not None:
+        worker.log.info(warmup.format_usage(f"worker {worker.pid}", usage))
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Job Index - Immutable, disk-backed snapshot of the job corpus and its TF-IDF vectors
+"""
+
+import json
+import os
+import pickle
+import shutil
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import TfidfVectorizer
+from utils.job_features import add_job_features, job_text
+from utils.minhash import MinHasher, empty_signatures
+
+# Default TF-IDF configuration shared by every index build
+VECTORIZER_PARAMS = {
+    'max_features': 5000,
+    'stop_words': 'english',
+    'ngram_range': (1, 2),
+    'lowercase': True
+}
+
+# Word-level MinHash width; fewer permutations are faster to compare but estimate Jaccard less precisely
+JACCARD_NUM_PERM = int(os.getenv('JACCARD_NUM_PERM', '64'))
+
+# Joins the members of set-valued job columns (noun phrases, title tokens) in the text blob
+SET_SEPARATOR = '\x1f'
+
+def _json_default(value):
+    return value.item() if hasattr(value, 'item') else str(value)
+
+class JobTable:
+    """
+    Read-only job table stored as memory-mapped arrays.
+
+    Text, set and other object columns live in one UTF-8 blob addressed by
+    per-row offsets; numeric columns are plain arrays. Rows are decoded only
+    when read, so every process shares the mapped pages instead of holding its
+    own unpickled DataFrame. Offers the parts of the DataFrame API the
+    matcher uses: len(), columns, table[column] and table.iloc[row].
+    """
+
+    def __init__(self, columns, text, offsets, arrays):
+        self.columns = pd.Index([name for name, _ in columns])
+        self._kinds = dict(columns)
+        self._text = text
+        # (text columns, rows + 1) offsets into the blob, in column order
+        self._offsets = offsets
+        self._text_slot = {name: slot for slot, name in enumerate(
+            name for name, kind in columns if kind != 'array'
+        )}
+        self._arrays = arrays
+        self.iloc = _TableRows(self)
+
+    def __len__(self):
+        return self._offsets.shape[1] - 1
+
+    def value(self, row, column):
+        kind = self._kinds[column]
+        if kind == 'array':
+            return self._arrays[column][row].item()
+
+        offsets = self._offsets[self._text_slot[column]]
+        text = bytes(self._text[offsets[row]:offsets[row + 1]]).decode('utf-8')
+        if kind == 'set':
+            return frozenset(text.split(SET_SEPARATOR)) if text else frozenset()
+        if kind == 'json':
+            return json.loads(text)
+        return text
+
+    def row(self, row):
+        """One job as a Series, the same shape DataFrame.iloc[row] returns"""
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(f"Row {row} out of range for {len(self)} jobs")
+        return pd.Series({column: self.value(row, column) for column in self.columns}, name=row, dtype=object)
+
+    def __getitem__(self, column):
+        if column not in self._kinds:
+            raise KeyError(column)
+        if self._kinds[column] == 'array':
+            return pd.Series(np.array(self._arrays[column]), name=column)
+        return pd.Series([self.value(row, column) for row in range(len(self))], name=column, dtype=object)
+
+    @staticmethod
+    def save(job_data, directory):
+        """Write a DataFrame as jobs_text.npy, jobs_offsets.npy and one jobs_<n>.npy per numeric column"""
+        columns, encoded = [], []
+        for number, name in enumerate(job_data.columns):
+            values = job_data[name].to_numpy()
+            if values.dtype.kind in 'biuf':
+                columns.append([name, 'array'])
+                np.save(os.path.join(directory, f"jobs_{number}.npy"), values)
+                continue
+
+            if all(isinstance(value, str) for value in values):
+                kind, texts = 'str', values
+            elif all(isinstance(value, (set, frozenset)) for value in values):
+                kind, texts = 'set', [SET_SEPARATOR.join(sorted(value)) for value in values]
+            else:
+                kind, texts = 'json', [json.dumps(value, default=_json_default) for value in values]
+            columns.append([name, kind])
+            encoded.append([text.encode('utf-8') for text in texts])
+
+        lengths = np.array([[len(text) for text in column] for column in encoded], dtype=np.int64)
+        offsets = np.zeros((len(encoded), len(job_data) + 1), dtype=np.int64)
+        if len(encoded):
+            offsets[:, 1:] = np.cumsum(lengths.ravel()).reshape(lengths.shape)
+            offsets[1:, 0] = offsets[:-1, -1]
+        blob = b''.join(text for column in encoded for text in column)
+
+        np.save(os.path.join(directory, 'jobs_text.npy'), np.frombuffer(blob, dtype=np.uint8))
+        np.save(os.path.join(directory, 'jobs_offsets.npy'), offsets)
+        return columns
+
+    @classmethod
+    def load(cls, directory, columns, mmap_mode='r'):
+        """Open a table written by save(); columns is the [name, kind] list save() returned"""
+        def load_array(name):
+            return np.load(os.path.join(directory, name), mmap_mode=mmap_mode)
+
+        arrays = {
+            name: load_array(f"jobs_{number}.npy")
+            for number, (name, kind) in enumerate(columns) if kind == 'array'
+        }
+        return cls(columns, load_array('jobs_text.npy'), load_array('jobs_offsets.npy'), arrays)
+
+class _TableRows:
+    """table.iloc[row] for a JobTable"""
+
+    def __init__(self, table):
+        self._table = table
+
+    def __getitem__(self, row):
+        return self._table.row(int(row))
+
+class JobIndex:
+    """Job DataFrame, fitted vectorizer and job vectors that are always used together"""
+
+    def __init__(self, job_data, vectorizer, job_vectors, version=None, signatures=None):
+        self.job_data = job_data
+        self.vectorizer = vectorizer
+        self.job_vectors = job_vectors
+        # (jobs, num_perm) uint32 MinHash signatures of each job's word set
+        self.signatures = signatures
+        self.hasher = MinHasher(num_perm=signatures.shape[1], shingle_size=1) if signatures is not None else None
+        # False when load() had to sketch a snapshot saved without minhash.npy
+        self.signatures_saved = True
+        # Sortable, filesystem-safe version used as the snapshot directory name
+        self.version = version or datetime.now().strftime('%Y%m%dT%H%M%S%f')
+
+    @classmethod
+    def build(cls, job_data, vectorizer_params=None):
+        """Fit a new vectorizer on the given jobs and return the resulting index"""
+        job_data = job_data.reset_index(drop=True)
+        # Parse job text once here so scoring only reads precomputed feature columns
+        job_data = add_job_features(job_data)
+        vectorizer = TfidfVectorizer(**(vectorizer_params or VECTORIZER_PARAMS))
+
+        # Combine title, description, and requirements for better matching
+        job_descriptions = [
+            f"{job['title']} {job['description']} {job.get('requirements', '')}"
+            for _, job in job_data.iterrows()
+        ]
+
+        job_vectors = vectorizer.fit_transform(job_descriptions).tocsr()
+        # Terms cut by max_features are kept only for introspection and grow with the corpus
+        vectorizer.stop_words_ = None
+        # float32 halves the size of the shared segments without affecting ranking
+        job_vectors = job_vectors.astype(np.float32)
+        job_vectors.indices = job_vectors.indices.astype(np.int32)
+        job_vectors.indptr = job_vectors.indptr.astype(np.int32)
+
+        # Word sets are sketched once here; queries compare fixed-width signatures instead
+        return cls(job_data, vectorizer, job_vectors, signatures=cls.sketch(job_data))
+
+    @staticmethod
+    def sketch(job_data):
+        """MinHash signatures of each job's word set (job_data is a DataFrame or JobTable)"""
+        if isinstance(job_data, pd.DataFrame):
+            jobs = job_data.to_dict('records')
+        else:
+            jobs = (job_data.iloc[row] for row in range(len(job_data)))
+        return MinHasher(num_perm=JACCARD_NUM_PERM, shingle_size=1).signatures(job_text(job) for job in jobs)
+
+    def __len__(self):
+        return len(self.job_data)
+
+    def jaccard(self, text, rows=None, num_perm=None):
+        """Estimated word-set Jaccard similarity of text against the given rows (default: every job)
+
+        num_perm compares only the first num_perm hashes of each signature, trading accuracy for speed.
+        """
+        if not text.strip():
+            return np.zeros(len(self) if rows is None else len(rows))
+        return self.jaccard_signature(self.hasher.signature(text), rows, num_perm)
+
+    def jaccard_signature(self, signature, rows=None, num_perm=None):
+        """Same as jaccard() for a signature already computed with self.hasher"""
+        signatures = self.signatures if rows is None else self.signatures[rows]
+        # A wordless query or job would match every other wordless text on all hashes
+        if empty_signatures(signature):
+            return np.zeros(len(signatures))
+        if num_perm:
+            signature, signatures = signature[:num_perm], signatures[:, :num_perm]
+        scores = (signatures == signature).mean(axis=1)
+        scores[empty_signatures(signatures)] = 0.0
+        return scores
+
+    def save(self, index_dir, keep=2):
+        """Write the index to disk so other processes can map it read-only"""
+        snapshots_dir = os.path.join(index_dir, 'snapshots')
+        snapshot_dir = os.path.join(snapshots_dir, self.version)
+        os.makedirs(snapshots_dir, exist_ok=True)
+
+        # Write into a scratch directory first so readers never see a half-written snapshot
+        tmp_dir = f"{snapshot_dir}.tmp-{os.getpid()}"
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+        os.makedirs(tmp_dir)
+
+        np.save(os.path.join(tmp_dir, 'vectors_data.npy'), self.job_vectors.data)
+        np.save(os.path.join(tmp_dir, 'vectors_indices.npy'), self.job_vectors.indices)
+        np.save(os.path.join(tmp_dir, 'vectors_indptr.npy'), self.job_vectors.indptr)
+        np.save(os.path.join(tmp_dir, 'minhash.npy'), np.ascontiguousarray(self.signatures, dtype=np.uint32))
+
+        # The vocabulary is capped at max_features terms, so this stays small as the corpus grows
+        with open(os.path.join(tmp_dir, 'vectorizer.pkl'), 'wb') as f:
+            pickle.dump(self.vectorizer, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        job_columns = JobTable.save(self.job_data, tmp_dir)
+
+        with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+            json.dump({
+                'version': self.version,
+                'shape': list(self.job_vectors.shape),
+                'job_count': len(self.job_data),
+                'job_columns': job_columns
+            }, f)
+
+        os.rename(tmp_dir, snapshot_dir)
+
+        # Publish the snapshot by atomically replacing the CURRENT pointer
+        pointer_tmp = os.path.join(index_dir, f"CURRENT.tmp-{os.getpid()}")
+        with open(pointer_tmp, 'w') as f:
+            f.write(self.version)
+        os.replace(pointer_tmp, os.path.join(index_dir, 'CURRENT'))
+
+        self.prune_snapshots(index_dir, keep)
+        print(f"💾 Saved job index {self.version} ({len(self.job_data)} jobs) to {index_dir}")
+
+    @staticmethod
+    def prune_snapshots(index_dir, keep=2):
+        """Delete all but the newest snapshots; mapped files stay valid until unmapped"""
+        snapshots_dir = os.path.join(index_dir, 'snapshots')
+        versions = sorted(
+            name for name in os.listdir(snapshots_dir)
+            if os.path.isdir(os.path.join(snapshots_dir, name)) and '.tmp-' not in name
+        )
+        for version in versions[:-keep]:
+            shutil.rmtree(os.path.join(snapshots_dir, version), ignore_errors=True)
+
+    @staticmethod
+    def current_version(index_dir):
+        """Return the version the CURRENT pointer refers to, or None"""
+        pointer_path = os.path.join(index_dir, 'CURRENT')
+        if not os.path.exists(pointer_path):
+            return None
+        with open(pointer_path) as f:
+            return f.read().strip() or None
+
+    @classmethod
+    def load(cls, index_dir, mmap=True):
+        """Load the current snapshot written by save(), memory-mapping the vectors and job table"""
+        version = cls.current_version(index_dir)
+        if version is None:
+            raise FileNotFoundError(f"No job index found in {index_dir}")
+        snapshot_dir = os.path.join(index_dir, 'snapshots', version)
+
+        with open(os.path.join(snapshot_dir, 'meta.json')) as f:
+            meta = json.load(f)
+
+        mmap_mode = 'r' if mmap else None
+        data = np.load(os.path.join(snapshot_dir, 'vectors_data.npy'), mmap_mode=mmap_mode)
+        indices = np.load(os.path.join(snapshot_dir, 'vectors_indices.npy'), mmap_mode=mmap_mode)
+        indptr = np.load(os.path.join(snapshot_dir, 'vectors_indptr.npy'), mmap_mode=mmap_mode)
+
+        # copy=False keeps the matrix backed by the shared, read-only page cache
+        job_vectors = csr_matrix((data, indices, indptr), shape=tuple(meta['shape']), copy=False)
+
+        with open(os.path.join(snapshot_dir, 'vectorizer.pkl'), 'rb') as f:
+            vectorizer = pickle.load(f)
+
+        if 'job_columns' in meta:
+            job_data = JobTable.load(snapshot_dir, meta['job_columns'], mmap_mode)
+        else:
+            # Snapshots from before the mapped job table pickled the whole DataFrame
+            job_data = pd.read_pickle(os.path.join(snapshot_dir, 'jobs.pkl'))
+
+        signatures_path = os.path.join(snapshot_dir, 'minhash.npy')
+        if os.path.exists(signatures_path):
+            signatures = np.load(signatures_path, mmap_mode=mmap_mode)
+        else:
+            # Snapshots from before MinHash signatures existed are sketched here, privately per process
+            signatures = cls.sketch(job_data)
+
+        index = cls(job_data, vectorizer, job_vectors, version=meta['version'], signatures=signatures)
+        index.signatures_saved = os.path.exists(signatures_path)
+        return index
+
+    @staticmethod
+    def modified_time(index_dir):
+        """Return when the current snapshot was published, or None"""
+        pointer_path = os.path.join(index_dir, 'CURRENT')
+        if not os.path.exists(pointer_path):
+            return None
+        return datetime.fromtimestamp(os.path.getmtime(pointer_path))
@@ -1,33 +1,79 @@
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import re
 import json
 import os
+import threading
+import time
 from textblob import TextBlob
 from datetime import datetime, timedelta
 from live_job_fetcher import LiveJobFetcher
-from dynamic_skill_learner import DynamicSkillLearner
+from skill_knowledge import get_skill_service
+from job_index import JobIndex, VECTORIZER_PARAMS
+from utils.minhash import canonical_indices, normalize_company
+from scipy.sparse import csr_matrix
+from utils.similarity import SimilarityCalculator, noun_phrases
+from utils.job_features import has_job_features
+from database import init_database, sync_jobs, job_key, get_resume_details, save_resume_vector, load_resume_vector
+
+# Fields a match can contain; clients may request any subset
+MATCH_FIELDS = (
+    'job_id', 'title', 'company', 'location', 'description', 'requirements', 'salary_range',
+    'job_type', 'experience_level', 'match_score', 'skill_match_percentage', 'skill_gap'
+)
+DEFAULT_MATCH_FIELDS = MATCH_FIELDS[:-1]
+
+class StaleRankingError(Exception):
+    """A stored ranking refers to an index snapshot that is no longer served"""
+
+class IndexNotReadyError(Exception):
+    """No job index snapshot has been loaded yet"""
 
 class JobMatcher:
-    def __init__(self):
+    def __init__(self, index_dir='../database/job_index'):
         """Initialize the job matcher with TF-IDF vectorizer"""
-        self.vectorizer = TfidfVectorizer(
-            max_features=5000,
-            stop_words='english',
-            ngram_range=(1, 2),
-            lowercase=True
-        )
-        self.job_data = None
-        self.job_vectors = None
+        self.vectorizer_params = dict(VECTORIZER_PARAMS)
+
+        # Job data, vectorizer and vectors live together in one index snapshot
+        self.index = None
+        self.index_dir = os.getenv('JOB_INDEX_DIR', index_dir)
+        self.live_csv_path = '../database/live_jobs.csv'
+        self.last_update_path = '../database/last_update.txt'
+        # Estimated Jaccard similarity above which two postings count as the same job
+        self.duplicate_threshold = float(os.getenv('JOB_DUPLICATE_THRESHOLD', '0.8'))
+
+        # Serializes index builds; requests never take this lock
+        self._build_lock = threading.Lock()
 
         # Initialize live data components
         self.live_job_fetcher = LiveJobFetcher()
-        self.skill_learner = DynamicSkillLearner()
-        self.last_update = None
+        self.skill_service = get_skill_service()
+        self.last_update = self.read_last_update()
         self.update_interval = timedelta(hours=6)  # Update every 6 hours
 
+        # Second ranking stage: multi-signal re-scoring of the top TF-IDF candidates
+        self.similarity = SimilarityCalculator()
+        self.rerank_k = int(os.getenv('RERANK_K', '30'))
+        self.rerank_budget_ms = float(os.getenv('RERANK_BUDGET_MS', '250'))
+        # Signature prefix used for Jaccard estimates at query time; 0 uses the full width
+        self.jaccard_num_perm = int(os.getenv('JACCARD_QUERY_PERM', '0'))
+
+    @property
+    def skill_learner(self):
+        return self.skill_service.learner
+
+    @property
+    def job_data(self):
+        return self.index.job_data if self.index is not None else None
+
+    @property
+    def vectorizer(self):
+        return self.index.vectorizer if self.index is not None else None
+
+    @property
+    def job_vectors(self):
+        return self.index.job_vectors if self.index is not None else None
+
     def load_job_data(self, csv_path='../database/jobs.csv', use_live_data=True):
         """Load job data from CSV file and optionally fetch live data"""
         try:
@@ -36,31 +82,137 @@ class JobMatcher:
                 print("🔄 Fetching live job data...")
                 self.update_live_job_data()
 
-            # Load existing data
-            if os.path.exists(csv_path):
-                self.job_data = pd.read_csv(csv_path)
-                print(f"✅ Loaded {len(self.job_data)} jobs from {csv_path}")
-            else:
-                # Create sample job data if file doesn't exist
-                self.create_sample_job_data(csv_path)
-                self.job_data = pd.read_csv(csv_path)
-                print(f"✅ Created and loaded {len(self.job_data)} sample jobs")
-
-            # Prepare job descriptions for vectorization
-            job_descriptions = []
-            for _, job in self.job_data.iterrows():
-                # Combine title, description, and requirements for better matching
-                combined_text = f"{job['title']} {job['description']} {job.get('requirements', '')}"
-                job_descriptions.append(combined_text)
-
-            # Fit TF-IDF vectorizer on job descriptions
-            self.job_vectors = self.vectorizer.fit_transform(job_descriptions)
-            print(f"✅ Vectorized {len(job_descriptions)} job descriptions")
+            # Another process may already have built an index from the same data
+            if self.index_is_current(csv_path):
+                self.load_index()
+                # Snapshots written before jobs had stable ids or ingest-time features are rebuilt once
+                if ('job_id' in self.job_data.columns and has_job_features(self.job_data)
+                        and self.index.signatures_saved):
+                    return
+
+            self.rebuild_index(csv_path)
 
         except Exception as e:
+            # Sample data is only written by read_job_data when the CSV is missing;
+            # any other failure must not touch the operator's jobs file
             print(f"❌ Error loading job data: {str(e)}")
+            if self.index is None and JobIndex.current_version(self.index_dir) is not None:
+                self.load_index()
+            if self.index is None:
+                raise
+            print("Continuing with existing index...")
+
+    def rebuild_index(self, csv_path='../database/jobs.csv', use_live_data=False):
+        """Build a complete new index snapshot and publish it with a single reference swap"""
+        with self._build_lock:
+            return self._build_and_publish(csv_path, use_live_data)
+
+    def rebuild_index_if_stale(self, csv_path='../database/jobs.csv'):
+        """Rebuild only when a job data source is newer than the published index"""
+        if self.index_is_current(csv_path):
+            return False
+        self.rebuild_index(csv_path)
+        return True
+
+    def reload_index_if_changed(self):
+        """Map a snapshot that another process published since we last loaded"""
+        version = JobIndex.current_version(self.index_dir)
+        if version is None or (self.index is not None and self.index.version == version):
+            return False
+        self.load_index()
+        return True
+
+    def rebuild_index_async(self, csv_path='../database/jobs.csv', use_live_data=True):
+        """Rebuild the index on a background thread; returns False if a build is already running"""
+        if not self._build_lock.acquire(blocking=False):
+            return False
+
+        def run():
+            try:
+                self._build_and_publish(csv_path, use_live_data)
+            except Exception as e:
+                print(f"⚠️ Background index rebuild failed: {e}")
+                print("Continuing with existing index...")
+            finally:
+                self._build_lock.release()
+
+        threading.Thread(target=run, name='job-index-builder', daemon=True).start()
+        return True
+
+    def _build_and_publish(self, csv_path, use_live_data):
+        """Build a new index off the request path, save it, then swap it in (caller holds the build lock)"""
+        if use_live_data:
+            print("🔄 Fetching live job data...")
+            self.update_live_job_data()
+
+        job_data = self.read_job_data(csv_path)
+
+        # Register postings in the jobs table so matches can refer to them by stable id
+        job_ids = sync_jobs(job_data.to_dict('records'))
+        job_data['job_id'] = [
+            job_ids[job_key(title, company)] for title, company in zip(job_data['title'], job_data['company'])
+        ]
+
+        # Fit TF-IDF vectorizer on job descriptions and publish the index to disk
+        new_index = JobIndex.build(job_data, self.vectorizer_params)
+        print(f"✅ Vectorized {len(new_index)} job descriptions")
+        new_index.save(self.index_dir)
+
+        # Re-open the saved index so the vectors are file-backed and shared between workers
+        self.load_index()
+        return self.index
+
+    def read_job_data(self, csv_path):
+        """Read static jobs plus any previously fetched live jobs into one DataFrame"""
+        if os.path.exists(csv_path):
+            job_data = pd.read_csv(csv_path)
+            print(f"✅ Loaded {len(job_data)} jobs from {csv_path}")
+        else:
+            # Create sample job data if file doesn't exist
             self.create_sample_job_data(csv_path)
-            self.load_job_data(csv_path)
+            job_data = pd.read_csv(csv_path)
+            print(f"✅ Created and loaded {len(job_data)} sample jobs")
+
+        if os.path.exists(self.live_csv_path):
+            live_df = pd.read_csv(self.live_csv_path)
+            job_data = pd.concat([job_data, live_df], ignore_index=True)
+            # Remove duplicates based on title and company
+            job_data = job_data.drop_duplicates(subset=['title', 'company'], keep='last')
+            print(f"✅ Merged {len(live_df)} live jobs")
+
+        job_data = job_data.fillna('').reset_index(drop=True)
+
+        # Index only one canonical posting per near-duplicate cluster; identical
+        # postings from different employers are different jobs
+        texts = (job_data['title'].astype(str) + ' ' + job_data['description'].astype(str)).tolist()
+        companies = [normalize_company(company) for company in job_data['company']]
+        keep = canonical_indices(texts, self.duplicate_threshold, groups=companies)
+        if len(keep) < len(job_data):
+            print(f"🧹 Collapsed {len(job_data) - len(keep)} near-duplicate jobs")
+            job_data = job_data.iloc[keep].reset_index(drop=True)
+
+        return job_data
+
+    def index_is_current(self, csv_path):
+        """Check whether the saved index is newer than every job data source"""
+        index_time = JobIndex.modified_time(self.index_dir)
+        if index_time is None:
+            return False
+
+        for path in (csv_path, self.live_csv_path):
+            if os.path.exists(path) and datetime.fromtimestamp(os.path.getmtime(path)) > index_time:
+                return False
+
+        return os.path.exists(csv_path)
+
+    def load_index(self):
+        """Map the saved job index read-only; pages are shared by every worker process"""
+        index = JobIndex.load(self.index_dir, mmap=True)
+
+        # Publish with one reference assignment. Requests read self.index once and keep
+        # using the snapshot they started with, so they never see a torn index.
+        self.index = index
+        print(f"✅ Mapped job index {index.version} with {len(index)} jobs from {self.index_dir}")
 
     def create_sample_job_data(self, csv_path):
         """Create sample job data for demonstration"""
@@ -207,50 +359,240 @@ class JobMatcher:
 
         return ' '.join(text_parts)
 
-    def find_matches(self, resume_data, top_n=10):
+    def find_matches(self, resume_data, top_n=10, rerank_k=None, budget_ms=None):
         """Find top matching jobs for the given resume"""
-        if self.job_data is None or self.job_vectors is None:
-            return []
-
         try:
-            # Preprocess resume text
-            resume_text = self.preprocess_resume_text(resume_data)
-
-            # Vectorize resume text
-            resume_vector = self.vectorizer.transform([resume_text])
-
-            # Calculate cosine similarity
-            similarities = cosine_similarity(resume_vector, self.job_vectors).flatten()
+            return list(self.iter_matches(resume_data, top_n, rerank_k=rerank_k, budget_ms=budget_ms))
 
-            # Get top matches
-            top_indices = similarities.argsort()[-top_n:][::-1]
-
-            matches = []
-            for idx in top_indices:
-                job = self.job_data.iloc[idx]
-                match_score = float(similarities[idx])
-
-                # Calculate additional metrics
-                skill_match = self.calculate_skill_match(resume_data.get('skills', []), job['requirements'])
+        except Exception as e:
+            print(f"Error in find_matches: {str(e)}")
+            return []
 
-                matches.append({
-                    'title': job['title'],
-                    'company': job['company'],
-                    'location': job['location'],
-                    'description': job['description'],
-                    'requirements': job['requirements'],
-                    'salary_range': job.get('salary_range', 'Not specified'),
-                    'job_type': job.get('job_type', 'Full-time'),
-                    'experience_level': job.get('experience_level', 'Not specified'),
-                    'match_score': round(match_score * 100, 2),
-                    'skill_match_percentage': skill_match
-                })
+    def iter_matches(self, resume_data, top_n=10, include_gap=False, rerank_k=None, budget_ms=None, profile=None):
+        """Yield enriched matches best-first, so callers can send each one as soon as it is ready"""
+        index = self.index
+        if index is None:
+            return
+
+        if profile is not None:
+            resume_data = profile['resume_data']
+
+        for row, score in self.rank_jobs(index, resume_data, top_n, rerank_k, budget_ms, profile):
+            yield self.build_match(index.job_data.iloc[row], score, resume_data, include_gap)
+
+    def rank_jobs(self, index, resume_data, top_n=10, rerank_k=None, budget_ms=None, profile=None):
+        """Two-stage ranking: cheap TF-IDF retrieval over every job, then re-rank the best candidates.
+
+        Returns [(row, score)] best-first. rerank_k=0 skips the second stage. A stored
+        profile (see resume_profile) replaces vectorizing resume_data.
+        """
+        rerank_k = self.rerank_k if rerank_k is None else rerank_k
+        budget_ms = self.rerank_budget_ms if budget_ms is None else budget_ms
+
+        if profile is None:
+            profile = self.build_profile(index, resume_data)
+        elif profile['index_version'] != index.version:
+            # The profile was encoded against a snapshot that has since been replaced
+            profile = (self.resume_profile(profile['resume_id'], index)
+                       or self.build_profile(index, profile['resume_data'], profile['resume_id']))
+
+        candidates = self.retrieve_candidates(index, profile, max(top_n, rerank_k))
+        if rerank_k > 0:
+            candidates = self.rerank_candidates(index, profile, candidates, rerank_k, budget_ms)
+
+        return candidates[:top_n]
+
+    def build_profile(self, index, resume_data, resume_id=None):
+        """Everything ranking needs from a resume, encoded against one index snapshot"""
+        # Vectorize resume text (float32 to match the shared job vectors)
+        resume_vector = index.vectorizer.transform([self.preprocess_resume_text(resume_data)])
+        resume_vector = resume_vector.astype(np.float32).tocsr()
+
+        resume_text = self.similarity.prepare_resume_text(resume_data)
+        experience = resume_data.get('experience') or {}
+
+        return {
+            'resume_id': resume_id,
+            'index_version': index.version,
+            'vector': resume_vector,
+            'signature': index.hasher.signature(resume_text),
+            'noun_phrases': noun_phrases(resume_text),
+            # Only what re-ranking and match enrichment read, not the full resume text
+            'resume_data': {
+                'skills': resume_data.get('skills', []),
+                'experience': {
+                    'job_titles': experience.get('job_titles', []),
+                    'timeline': [
+                        {key: item[key] for key in ('start_date', 'end_date') if key in item}
+                        for item in experience.get('timeline', [])
+                    ]
+                }
+            }
+        }
 
-            return matches
+    def store_resume_profile(self, resume_id, resume_data, index=None):
+        """Encode a resume against the given (default: current) index and keep it by resume_id"""
+        index = self.index if index is None else index
+        if index is None:
+            return None
 
+        try:
+            profile = self.build_profile(index, resume_data, resume_id)
+            save_resume_vector(
+                resume_id,
+                index.version,
+                profile['vector'].indices.astype(np.int32).tobytes(),
+                profile['vector'].data.astype(np.float32).tobytes(),
+                profile['signature'].astype(np.uint32).tobytes(),
+                {'noun_phrases': sorted(profile['noun_phrases']), 'resume_data': profile['resume_data']}
+            )
+            return profile
         except Exception as e:
-            print(f"Error in find_matches: {str(e)}")
+            print(f"⚠️ Could not store resume vector for {resume_id}: {e}")
+            return None
+
+    def resume_profile(self, resume_id, index=None):
+        """Load the stored profile for a resume, re-encoding it if the index vocabulary changed; None if unknown
+
+        Raises IndexNotReadyError when no index is loaded, so callers can tell that apart from an unknown resume.
+        """
+        # An empty index is falsy (JobIndex.__len__), so test for None explicitly
+        index = self.index if index is None else index
+        if index is None:
+            raise IndexNotReadyError("No job index is loaded")
+
+        stored = load_resume_vector(resume_id)
+        if stored is None or stored['index_version'] != index.version:
+            # Vectors from an older snapshot use a different vocabulary, so rebuild from the saved resume
+            resume_data = get_resume_details(resume_id)
+            if resume_data is None:
+                return None
+            # Encode against the snapshot the caller ranks with, even if a reload swapped self.index
+            return (self.store_resume_profile(resume_id, resume_data, index)
+                    or self.build_profile(index, resume_data, resume_id))
+
+        indices = np.frombuffer(stored['vector_indices'], dtype=np.int32)
+        data = np.frombuffer(stored['vector_data'], dtype=np.float32)
+        return {
+            'resume_id': resume_id,
+            'index_version': stored['index_version'],
+            'vector': csr_matrix((data, indices, [0, len(indices)]), shape=(1, index.job_vectors.shape[1])),
+            'signature': np.frombuffer(stored['signature'], dtype=np.uint32),
+            'noun_phrases': frozenset(stored['features']['noun_phrases']),
+            'resume_data': stored['features']['resume_data']
+        }
+
+    def retrieve_candidates(self, index, profile, limit):
+        """Score every job by TF-IDF cosine and return the best limit as [(row, score)]"""
+        # TF-IDF rows are L2-normalized, so the dot product is the cosine similarity.
+        # Computing it directly avoids copying the memory-mapped job vectors.
+        similarities = index.job_vectors.dot(profile['vector'].T).toarray().ravel()
+
+        # Select the top matches in linear time, then sort only those
+        limit = min(limit, len(similarities))
+        if limit <= 0:
             return []
+        top_indices = np.argpartition(similarities, -limit)[-limit:]
+        top_indices = top_indices[np.argsort(similarities[top_indices])[::-1]]
+
+        return [(int(idx), float(similarities[idx])) for idx in top_indices]
+
+    def rerank_candidates(self, index, profile, candidates, rerank_k, budget_ms):
+        """Re-score the best rerank_k candidates with comprehensive_similarity within a latency budget"""
+        deadline = time.perf_counter() + budget_ms / 1000
+
+        head, tail = candidates[:rerank_k], candidates[rerank_k:]
+
+        # One vectorized signature comparison covers every candidate's Jaccard estimate
+        jaccard_scores = index.jaccard_signature(profile['signature'], [row for row, _ in head], self.jaccard_num_perm)
+
+        reranked = []
+        for position, (row, score) in enumerate(head):
+            if time.perf_counter() >= deadline:
+                # Out of budget: unscored candidates keep their retrieval order behind the re-ranked ones
+                tail = head[position:] + tail
+                break
+
+            similarity = self.similarity.comprehensive_similarity(
+                profile['resume_data'], index.job_data.iloc[row], tfidf_score=score,
+                jaccard_score=jaccard_scores[position], resume_phrases=profile['noun_phrases']
+            )
+            reranked.append((row, similarity['overall_similarity']))
+
+        reranked.sort(key=lambda candidate: candidate[1], reverse=True)
+        if not reranked:
+            return tail
+        return reranked + self.scale_below(tail, reranked[-1][1])
+
+    @staticmethod
+    def scale_below(candidates, ceiling):
+        """Map retrieval-ordered cosine scores linearly onto [0, ceiling] so one ranking has one score scale"""
+        top = max((score for _, score in candidates), default=0.0)
+        if top <= 0:
+            return [(row, 0.0) for row, _ in candidates]
+        return [(row, ceiling * (score / top)) for row, score in candidates]
+
+    def build_match(self, job, match_score, resume_data, include_gap=False):
+        """Enrich one ranked job with skill match metrics for the response"""
+        # Calculate additional metrics
+        skill_match = self.calculate_skill_match(resume_data.get('skills', []), job['requirements'])
+
+        match = {
+            'job_id': int(job['job_id']) if 'job_id' in job else None,
+            'title': job['title'],
+            'company': job['company'],
+            'location': job['location'],
+            'description': job['description'],
+            'requirements': job['requirements'],
+            'salary_range': job.get('salary_range', 'Not specified'),
+            'job_type': job.get('job_type', 'Full-time'),
+            'experience_level': job.get('experience_level', 'Not specified'),
+            'match_score': round(match_score * 100, 2),
+            'skill_match_percentage': skill_match
+        }
+
+        if include_gap:
+            gap = self.analyze_skill_gap(
+                resume_data.get('skills', []),
+                f"{job['description']} {job['requirements']}"
+            )
+            match['skill_gap'] = {
+                'missing_skills': gap['missing_skills'][:5],
+                'match_percentage': gap['match_percentage']
+            }
+
+        return match
+
+    def rank_for_paging(self, resume_data, limit=100, rerank_k=None, budget_ms=None, profile=None):
+        """Rank once for pagination; returns the index version and [row, score] pairs best-first"""
+        index = self.index
+        if index is None:
+            return None, []
+
+        ranking = self.rank_jobs(index, resume_data, limit, rerank_k, budget_ms, profile)
+        return index.version, [[row, score] for row, score in ranking]
+
+    def build_page(self, index_version, ranking, offset, page_size, resume_data, fields=DEFAULT_MATCH_FIELDS):
+        """Enrich one page of a stored ranking; returns (full matches, projected matches)"""
+        index = self.index
+        if index is None or index.version != index_version:
+            # Another worker may have published the snapshot this ranking was scored against
+            self.reload_index_if_changed()
+            index = self.index
+            if index is None or index.version != index_version:
+                raise StaleRankingError(f"Ranking was built on index {index_version}")
+
+        include_gap = 'skill_gap' in fields
+        matches = [
+            self.build_match(index.job_data.iloc[row], score, resume_data, include_gap)
+            for row, score in ranking[offset:offset + page_size]
+        ]
+        return matches, [self.project_match(match, fields) for match in matches]
+
+    @staticmethod
+    def project_match(match, fields):
+        """Keep only the requested fields of a match"""
+        return {field: match[field] for field in fields if field in match}
 
     def calculate_skill_match(self, resume_skills, job_requirements):
         """Calculate percentage of skill match between resume and job"""
@@ -335,6 +677,15 @@ class JobMatcher:
 
         return found_skills
 
+    def read_last_update(self):
+        """Read the timestamp of the last live data refresh, if any"""
+        try:
+            with open(self.last_update_path) as f:
+                timestamp = f.read().strip()
+            return datetime.fromisoformat(timestamp) if timestamp else None
+        except (OSError, ValueError):
+            return None
+
     def should_update_live_data(self):
         """Check if live data should be updated"""
         if self.last_update is None:
@@ -354,32 +705,24 @@ class JobMatcher:
             if live_jobs:
                 # Save live jobs to CSV
                 live_df = pd.DataFrame(live_jobs)
-                live_df.to_csv('../database/live_jobs.csv', index=False)
+                live_df.to_csv(self.live_csv_path, index=False)
 
                 # Learn new skills from job descriptions
                 job_descriptions = [job.get('description', '') for job in live_jobs]
-                self.skill_learner.learn_skills_from_job_postings(job_descriptions)
+                self.skill_service.learn_from_job_postings(job_descriptions)
 
                 # Update skills from external sources
-                self.skill_learner.update_skills_from_external_sources()
+                self.skill_service.update_from_external_sources()
 
                 # Save learned skills
-                self.skill_learner.save_learned_skills()
-
-                # Combine with existing jobs if any
-                if self.job_data is not None:
-                    combined_df = pd.concat([self.job_data, live_df], ignore_index=True)
-                    # Remove duplicates based on title and company
-                    combined_df = combined_df.drop_duplicates(subset=['title', 'company'], keep='last')
-                    self.job_data = combined_df
-                else:
-                    self.job_data = live_df
+                self.skill_service.save()
 
+                # Live jobs are merged into the next index build by read_job_data()
                 self.last_update = datetime.now()
                 print(f"✅ Updated with {len(live_jobs)} live jobs")
 
                 # Save updated timestamp
-                with open('../database/last_update.txt', 'w') as f:
+                with open(self.last_update_path, 'w') as f:
                     f.write(self.last_update.isoformat())
 
         except Exception as e:
@@ -388,19 +731,20 @@ class JobMatcher:
 
     def get_dynamic_skills(self):
         """Get all skills including dynamically learned ones"""
-        return self.skill_learner.get_all_skills()
+        return dict(self.skill_service.snapshot().categories)
 
-    def get_trending_skills(self, top_n=20):
+    def get_trending_skills(self, top_n=20, window=None):
         """Get trending skills based on job market data"""
-        return self.skill_learner.get_trending_skills(top_n)
+        return self.skill_learner.get_trending_skills(top_n, window)
 
     def force_update_live_data(self):
         """Force update live data regardless of time interval"""
         self.last_update = None
-        self.update_live_job_data()
+        self.rebuild_index(use_live_data=True)
 
 # Test function
 if __name__ == "__main__":
+    init_database()
     matcher = JobMatcher()
 
     # Test with live data
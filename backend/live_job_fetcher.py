@@ -12,6 +12,7 @@ import pandas as pd
 from datetime import datetime
 import re
 from dotenv import load_dotenv
+from utils.minhash import canonical_indices, normalize_company
 
 # Load environment variables from .env file
 load_dotenv()
@@ -252,6 +253,9 @@ class LiveJobFetcher:
                 seen.add(key)
                 unique_jobs.append(job)
 
+        # Collapse reposts and cross-source copies whose descriptions are near-identical
+        unique_jobs = self.remove_near_duplicates(unique_jobs)
+
         print(f"✅ Fetched {len(unique_jobs)} unique jobs")
 
         # If no jobs were fetched, generate sample data
@@ -261,6 +265,20 @@ class LiveJobFetcher:
 
         return unique_jobs
 
+    def remove_near_duplicates(self, jobs, threshold=0.8):
+        """Keep one canonical posting per cluster of near-duplicate descriptions from the same company"""
+        if len(jobs) < 2:
+            return jobs
+
+        texts = [f"{job.get('title', '')} {job.get('description', '')}" for job in jobs]
+        # The same text posted by two employers is two jobs; boards spell one employer differently
+        companies = [normalize_company(job.get('company', '')) for job in jobs]
+        keep = canonical_indices(texts, threshold, groups=companies)
+
+        if len(keep) < len(jobs):
+            print(f"🧹 Removed {len(jobs) - len(keep)} near-duplicate jobs")
+        return [jobs[i] for i in keep]
+
     def generate_sample_jobs(self):
         """Generate sample job data when APIs fail"""
         sample_jobs = [
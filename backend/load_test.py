@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Load Test - Measures latency percentiles and throughput of a server at rising concurrency
+
+Usage (from the backend directory):
+    python load_test.py --url http://localhost:5000 --endpoint match
+    python load_test.py --endpoint upload --resume-file resume.pdf --levels 1,4,16,32
+    python load_test.py --start-server --resume-file resume.pdf \\
+        --mix upload=1,match=4,skill-gap=2,history=2 --output run.json
+
+--mix replays a weighted, seeded mix of endpoints; --output writes per-level
+and per-endpoint throughput, p50/p95/p99 latency and error rates as JSON so
+runs can be compared. --start-server runs a local server for the duration of
+the test: gunicorn with gunicorn.conf.py by default, or --server-cmd.
+
+Run it once against the Flask/Gunicorn server and once against the ASGI
+server with the same arguments; the highest level whose p99 stays under
+--p99-target is the concurrency each mode sustains.
+"""
+
+import argparse
+import json
+import os
+import random
+import shlex
+import signal
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import requests
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_RESUME = os.path.join(os.path.dirname(BACKEND_DIR), 'sample_resume.txt')
+
+ENDPOINTS = ('upload', 'match', 'skill-gap', 'history')
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+def parse_mix(value):
+    """Parse 'upload=1,match=4' into {'upload': 1.0, 'match': 4.0}"""
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{name}', expected one of {', '.join(ENDPOINTS)}")
+        mix[name] = float(weight) if weight else 1.0
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+def summarize(results, elapsed):
+    """Throughput, latency percentiles and error rate of (latency, status) results"""
+    latencies = [latency for latency, status in results if status == 200]
+    errors = len(results) - len(latencies)
+    summary = {
+        'requests': len(results),
+        'errors': errors,
+        'error_rate': round(errors / len(results), 4) if results else 0.0,
+        'status_codes': dict(Counter(str(status) for _, status in results))
+    }
+    if latencies:
+        summary.update({
+            'throughput_rps': round(len(latencies) / elapsed, 2),
+            'p50_ms': round(percentile(latencies, 50) * 1000, 1),
+            'p95_ms': round(percentile(latencies, 95) * 1000, 1),
+            'p99_ms': round(percentile(latencies, 99) * 1000, 1),
+            'mean_ms': round(statistics.mean(latencies) * 1000, 1)
+        })
+    return summary
+
+class LoadTester:
+    """Sends a fixed number of requests per concurrency level and records latencies per endpoint"""
+
+    def __init__(self, base_url, endpoint='match', resume_file=None, timeout=60, mix=None, seed=42):
+        self.base_url = base_url.rstrip('/')
+        self.mix = mix or {endpoint: 1.0}
+        self.resume_file = resume_file
+        self.timeout = timeout
+        self.seed = seed
+        self._local = threading.local()
+
+        with open(SAMPLE_RESUME) as f:
+            sample_text = f.read()
+        self.resume_data = {'text': sample_text, 'skills': [], 'experience': {}, 'education': {}}
+
+        # Filled in by prime() from one real upload, so match and history hit stored data
+        self.session_id = f"loadtest_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.resume_id = None
+
+    @property
+    def endpoint(self):
+        return '+'.join(self.mix)
+
+    def _session(self):
+        # One keep-alive connection per client thread
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def prime(self):
+        """Upload the resume once so match-by-id and history requests have data to read"""
+        if not self.resume_file:
+            return False
+        response = self._post_upload(requests.Session())
+        if response.status_code != 200:
+            print(f"⚠️ Priming upload failed with status {response.status_code}; matching by resume_data")
+            return False
+
+        data = response.json()
+        self.session_id, self.resume_id = data['session_id'], data['resume_id']
+        return True
+
+    def _post_upload(self, session):
+        with open(self.resume_file, 'rb') as f:
+            return session.post(f"{self.base_url}/api/upload",
+                                files={'resume': (os.path.basename(self.resume_file), f)},
+                                data={'session_id': self.session_id},
+                                timeout=self.timeout)
+
+    def send_request(self, endpoint=None):
+        """Send one request; returns (latency seconds, HTTP status or 0 on connection errors)"""
+        endpoint = endpoint or next(iter(self.mix))
+        session = self._session()
+        started = time.perf_counter()
+        try:
+            if endpoint == 'upload':
+                response = self._post_upload(session)
+            elif endpoint == 'skill-gap':
+                response = session.post(f"{self.base_url}/api/skill-gap", json={
+                    'resume_skills': ['python', 'sql', 'docker'],
+                    'job_description': self.resume_data['text']
+                }, timeout=self.timeout)
+            elif endpoint == 'history':
+                response = session.get(f"{self.base_url}/api/history/{self.session_id}", timeout=self.timeout)
+            else:
+                payload = {'resume_id': self.resume_id} if self.resume_id else {'resume_data': self.resume_data}
+                response = session.post(f"{self.base_url}/api/match-jobs", json=payload, timeout=self.timeout)
+            status = response.status_code
+        except requests.RequestException:
+            status = 0
+        return time.perf_counter() - started, status
+
+    def schedule(self, count, level_seed):
+        """Deterministic endpoint sequence for one level, drawn from the weighted mix"""
+        rng = random.Random(level_seed)
+        names = list(self.mix)
+        return rng.choices(names, weights=[self.mix[name] for name in names], k=count)
+
+    def run_level(self, concurrency, requests_per_level):
+        """Send requests_per_level requests with concurrency clients in flight"""
+        endpoints = self.schedule(requests_per_level, self.seed + concurrency)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(self.send_request, endpoints))
+        elapsed = time.perf_counter() - started
+
+        result = {'concurrency': concurrency, 'elapsed_s': round(elapsed, 3)}
+        result.update(summarize(results, elapsed))
+        if len(self.mix) > 1:
+            result['endpoints'] = {
+                name: summarize([r for r, endpoint in zip(results, endpoints) if endpoint == name], elapsed)
+                for name in self.mix
+            }
+        return result
+
+class LocalServer:
+    """Starts the API in a subprocess and waits until it answers"""
+
+    def __init__(self, command, base_url, startup_timeout=300):
+        self.command = command
+        self.base_url = base_url.rstrip('/')
+        self.startup_timeout = startup_timeout
+        self.process = None
+
+    def __enter__(self):
+        print(f"🔧 Starting server: {' '.join(self.command)}")
+        # A session of its own lets __exit__ stop the server's workers or reloader child too
+        self.process = subprocess.Popen(self.command, cwd=BACKEND_DIR, start_new_session=True)
+
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Server exited with code {self.process.returncode} during startup")
+            try:
+                if requests.get(f"{self.base_url}/api/admission/metrics", timeout=2).status_code == 200:
+                    print("✅ Server is up")
+                    return self
+            except requests.RequestException:
+                pass
+            time.sleep(1)
+
+        self.__exit__(None, None, None)
+        raise RuntimeError(f"Server did not answer within {self.startup_timeout}s")
+
+    def _signal_group(self, sig):
+        try:
+            os.killpg(self.process.pid, sig)
+        except ProcessLookupError:
+            pass
+
+    def __exit__(self, *exc_info):
+        if self.process is not None:
+            # Signal the whole process group, even if the parent already exited
+            self._signal_group(signal.SIGTERM)
+            try:
+                self.process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self._signal_group(signal.SIGKILL)
+                self.process.wait()
+        self.process = None
+
+def run(tester, levels, requests_per_level, p99_target):
+    """Run every level, print a table and return the JSON-ready report"""
+    print(f"🚀 Load testing {tester.base_url} ({tester.endpoint}), {requests_per_level} requests per level")
+    if tester.prime():
+        print(f"📄 Primed session {tester.session_id} with resume {tester.resume_id}")
+    print(f"{'conc':>5} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+
+    report = {
+        'url': tester.base_url,
+        'mix': tester.mix,
+        'requests_per_level': requests_per_level,
+        'p99_target_ms': p99_target,
+        'seed': tester.seed,
+        'started_at': datetime.now().isoformat(),
+        'levels': []
+    }
+
+    sustained = None
+    for concurrency in levels:
+        result = tester.run_level(concurrency, requests_per_level)
+        report['levels'].append(result)
+        if 'p99_ms' not in result:
+            print(f"{concurrency:>5} {'-':>9} {'-':>9} {'-':>9} {'-':>9} {result['errors']:>7}")
+            continue
+
+        print(f"{concurrency:>5} {result['throughput_rps']:>9} {result['p50_ms']:>9} "
+              f"{result['p95_ms']:>9} {result['p99_ms']:>9} {result['errors']:>7}")
+        for name, summary in result.get('endpoints', {}).items():
+            if 'p99_ms' in summary:
+                print(f"{'':>5}   {name:<10} p50={summary['p50_ms']} p99={summary['p99_ms']} "
+                      f"errors={summary['errors']}/{summary['requests']}")
+        if result['p99_ms'] <= p99_target and result['errors'] == 0:
+            sustained = concurrency
+
+    report['sustained_concurrency'] = sustained
+    if sustained:
+        print(f"✅ Highest concurrency with p99 <= {p99_target:.0f} ms: {sustained}")
+    else:
+        print(f"⚠️ No level kept p99 under {p99_target:.0f} ms")
+    return report
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Load test the resume analyzer API')
+    arg_parser.add_argument('--url', default='http://localhost:5000', help='Server base URL')
+    arg_parser.add_argument('--endpoint', choices=list(ENDPOINTS), default='match')
+    arg_parser.add_argument('--mix', help='Weighted endpoint mix, e.g. upload=1,match=4,skill-gap=2,history=2')
+    arg_parser.add_argument('--resume-file', help='PDF/DOCX resume to send for uploads')
+    arg_parser.add_argument('--levels', default='1,2,4,8,16,32', help='Comma-separated concurrency levels')
+    arg_parser.add_argument('--requests', type=int, default=200, help='Requests per concurrency level')
+    arg_parser.add_argument('--p99-target', type=float, default=1000.0, help='p99 latency budget in ms')
+    arg_parser.add_argument('--seed', type=int, default=42, help='Seed for the endpoint mix')
+    arg_parser.add_argument('--output', help='Write the report as JSON to this file')
+    arg_parser.add_argument('--start-server', action='store_true', help='Start a local server for the test')
+    arg_parser.add_argument('--server-cmd', default=f'{sys.executable} -m gunicorn -c gunicorn.conf.py app:app',
+                            help='Command used by --start-server, run from the backend directory')
+    args = arg_parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix) if args.mix else {args.endpoint: 1.0}
+    except ValueError as e:
+        arg_parser.error(str(e))
+    if 'upload' in mix and not args.resume_file:
+        arg_parser.error('--resume-file is required when uploads are part of the test')
+
+    tester = LoadTester(args.url, resume_file=args.resume_file, mix=mix, seed=args.seed)
+    levels = [int(level) for level in args.levels.split(',')]
+
+    if args.start_server:
+        with LocalServer(shlex.split(args.server_cmd), args.url):
+            report = run(tester, levels, args.requests, args.p99_target)
+    else:
+        report = run(tester, levels, args.requests, args.p99_target)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Wrote report to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Match Pages - Request parsing and cursors for paginated, field-projected match responses
+"""
+
+import os
+import uuid
+from job_matcher import MATCH_FIELDS, DEFAULT_MATCH_FIELDS
+
+# How many ranked jobs are kept server-side per request, and for how long
+RANKING_LIMIT = int(os.getenv('MATCH_RANKING_LIMIT', '100'))
+CURSOR_TTL = int(os.getenv('MATCH_CURSOR_TTL_SECONDS', '1800'))
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 50
+
+# Upper bounds on the re-ranking cost a single request may ask for
+MAX_RERANK_K = 200
+MAX_RERANK_BUDGET_MS = 2000
+
+def parse_fields(value):
+    """Accept a list or comma-separated string of match fields; None means the defaults"""
+    if not value:
+        return DEFAULT_MATCH_FIELDS
+
+    if isinstance(value, str):
+        fields = value.split(',')
+    elif isinstance(value, (list, tuple)) and all(isinstance(field, str) for field in value):
+        fields = value
+    else:
+        raise ValueError('fields must be a list or comma-separated string of field names')
+    fields = tuple(field.strip() for field in fields if field.strip())
+
+    unknown = set(fields) - set(MATCH_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return fields
+
+def parse_number(name, value, kind):
+    """Convert a request parameter; JSON lists and objects raise ValueError like bad strings do"""
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+
+def parse_page_size(value):
+    page_size = parse_number('page_size', value, int) if value is not None else DEFAULT_PAGE_SIZE
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+def parse_rerank(params):
+    """Read rerank_k and latency_budget_ms from a request; None keeps the server defaults"""
+    rerank_k = params.get('rerank_k')
+    budget_ms = params.get('latency_budget_ms')
+    return (
+        max(0, min(parse_number('rerank_k', rerank_k, int), MAX_RERANK_K)) if rerank_k is not None else None,
+        max(0.0, min(parse_number('latency_budget_ms', budget_ms, float), MAX_RERANK_BUDGET_MS))
+        if budget_ms is not None else None
+    )
+
+def new_ranking_id():
+    return uuid.uuid4().hex
+
+def encode_cursor(ranking_id, offset):
+    return f"{ranking_id}:{offset}"
+
+def decode_cursor(cursor):
+    """Return (ranking_id, offset); raises ValueError for malformed cursors"""
+    ranking_id, _, offset = str(cursor).partition(':')
+    if not ranking_id or not offset.isdigit():
+        raise ValueError('Invalid cursor')
+    return ranking_id, int(offset)
+
+def next_cursor(ranking_id, offset, page_size, total):
+    """Cursor for the page after this one, or None on the last page"""
+    next_offset = offset + page_size
+    return encode_cursor(ranking_id, next_offset) if next_offset < total else None
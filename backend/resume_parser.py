@@ -1,15 +1,85 @@
 import os
 import re
 import fitz  # PyMuPDF
-import docx2txt
-from docx import Document
 import spacy
 from textblob import TextBlob
-import nltk
-from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize, sent_tokenize
 import json
-from dynamic_skill_learner import DynamicSkillLearner
+from skill_knowledge import get_skill_service
+from analyzed_document import AnalyzedDocument, WORD_PATTERN
+from utils.pdf_parser import PDFParser
+from utils.docx_parser import DOCXParser
+
+# Extraction patterns, compiled once and shared by every parse
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[\w-]+')
+
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d{4})\s*[-–]\s*(\d{4}|\w+)\s*[:\-]?\s*([^\n]+)', re.IGNORECASE),
+    re.compile(r'(\w+\s+\d{4})\s*[-–]\s*(\w+\s+\d{4}|\w+)\s*[:\-]?\s*([^\n]+)', re.IGNORECASE),
+]
+
+JOB_TITLE_PATTERNS = [
+    re.compile(r'(software engineer|developer|analyst|manager|director|consultant|specialist|coordinator)', re.IGNORECASE),
+    re.compile(r'(senior|junior|lead|principal|associate)\s+(engineer|developer|analyst|manager)', re.IGNORECASE),
+]
+
+DEGREE_PATTERNS = [
+    re.compile(r'(bachelor|master|phd|doctorate|associate|diploma|certificate)\s*(of|in|degree)?\s*([^\n,]+)', re.IGNORECASE),
+    re.compile(r'(b\.?s\.?|m\.?s\.?|m\.?a\.?|ph\.?d\.?|b\.?a\.?)\s*(in)?\s*([^\n,]+)', re.IGNORECASE),
+]
+
+UNIVERSITY_PATTERN = re.compile(
+    r'(university|college|institute|school)\s+of\s+([^\n,]+)|([^\n,]+)\s+(university|college|institute)',
+    re.IGNORECASE
+)
+UNIVERSITY_KEYWORDS = ('university', 'college', 'institute', 'school')
+
+# Resume sections each extractor reads in section-routed mode. Contact details can sit
+# anywhere (footers, a second column), so contact extraction always reads the whole document.
+SECTION_ROUTES = {
+    'skills': ['skills', 'summary', 'experience', 'projects', 'certifications'],
+    'experience': ['experience'],
+    'education': ['education']
+}
+
+# Comprehensive skill database
+SKILLS_DATABASE = {
+    'programming_languages': [
+        'python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
+        'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'html', 'css', 'typescript',
+        'perl', 'shell', 'bash', 'powershell', 'vba', 'assembly'
+    ],
+    'frameworks_libraries': [
+        'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring',
+        'laravel', 'rails', 'asp.net', 'jquery', 'bootstrap', 'tensorflow', 'pytorch',
+        'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'seaborn', 'opencv'
+    ],
+    'databases': [
+        'mysql', 'postgresql', 'mongodb', 'sqlite', 'oracle', 'sql server', 'redis',
+        'cassandra', 'elasticsearch', 'dynamodb', 'firebase', 'neo4j'
+    ],
+    'cloud_platforms': [
+        'aws', 'azure', 'google cloud', 'gcp', 'heroku', 'digitalocean', 'linode',
+        'cloudflare', 'vercel', 'netlify'
+    ],
+    'tools_technologies': [
+        'git', 'github', 'gitlab', 'bitbucket', 'docker', 'kubernetes', 'jenkins',
+        'travis ci', 'circleci', 'ansible', 'terraform', 'vagrant', 'webpack',
+        'gulp', 'grunt', 'npm', 'yarn', 'pip', 'maven', 'gradle'
+    ],
+    'soft_skills': [
+        'leadership', 'communication', 'teamwork', 'problem solving', 'analytical',
+        'creative', 'adaptable', 'organized', 'detail oriented', 'time management',
+        'project management', 'critical thinking', 'collaboration', 'mentoring'
+    ],
+    'certifications': [
+        'aws certified', 'azure certified', 'google certified', 'cisco certified',
+        'microsoft certified', 'oracle certified', 'comptia', 'cissp', 'ceh',
+        'pmp', 'scrum master', 'agile', 'itil'
+    ]
+}
 
 class ResumeParser:
     def __init__(self):
@@ -21,68 +91,52 @@ class ResumeParser:
             print("⚠️  spaCy model not found. Please run: python -m spacy download en_core_web_sm")
             self.nlp = None
 
-        # Download required NLTK data
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt')
-
-        try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('stopwords')
-
-        self.stop_words = set(stopwords.words('english'))
+        # Shared skill knowledge; its learner has already made sure the NLTK data is present
+        self.skill_service = get_skill_service()
+        self.stop_words = self.skill_service.learner.stop_words
 
         # Comprehensive skill database
-        self.skills_database = {
-            'programming_languages': [
-                'python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-                'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'html', 'css', 'typescript',
-                'perl', 'shell', 'bash', 'powershell', 'vba', 'assembly'
-            ],
-            'frameworks_libraries': [
-                'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring',
-                'laravel', 'rails', 'asp.net', 'jquery', 'bootstrap', 'tensorflow', 'pytorch',
-                'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'seaborn', 'opencv'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'sqlite', 'oracle', 'sql server', 'redis',
-                'cassandra', 'elasticsearch', 'dynamodb', 'firebase', 'neo4j'
-            ],
-            'cloud_platforms': [
-                'aws', 'azure', 'google cloud', 'gcp', 'heroku', 'digitalocean', 'linode',
-                'cloudflare', 'vercel', 'netlify'
-            ],
-            'tools_technologies': [
-                'git', 'github', 'gitlab', 'bitbucket', 'docker', 'kubernetes', 'jenkins',
-                'travis ci', 'circleci', 'ansible', 'terraform', 'vagrant', 'webpack',
-                'gulp', 'grunt', 'npm', 'yarn', 'pip', 'maven', 'gradle'
-            ],
-            'soft_skills': [
-                'leadership', 'communication', 'teamwork', 'problem solving', 'analytical',
-                'creative', 'adaptable', 'organized', 'detail oriented', 'time management',
-                'project management', 'critical thinking', 'collaboration', 'mentoring'
-            ],
-            'certifications': [
-                'aws certified', 'azure certified', 'google certified', 'cisco certified',
-                'microsoft certified', 'oracle certified', 'comptia', 'cissp', 'ceh',
-                'pmp', 'scrum master', 'agile', 'itil'
-            ]
-        }
-
-        # Initialize dynamic skill learner
-        self.skill_learner = DynamicSkillLearner()
-
-        # Flatten skills for easier matching (combine static + dynamic)
-        self.all_skills = []
-        for category, skills in self.skills_database.items():
-            self.all_skills.extend(skills)
-
-        # Add dynamically learned skills
-        dynamic_skills = self.skill_learner.get_all_skills()
-        for category, skills in dynamic_skills.items():
-            self.all_skills.extend(list(skills))
+        self.skills_database = SKILLS_DATABASE
+
+        self.pdf_parser = PDFParser()
+        self.docx_parser = DOCXParser()
+
+        # (vocabulary version, combined skills, lowercased set, skill matchers), replaced as one tuple
+        self._skills = (None, (), frozenset(), ())
+
+    @property
+    def skill_learner(self):
+        return self.skill_service.learner
+
+    def _current_skill_state(self):
+        """Skill tables for the latest vocabulary snapshot, rebuilt only when it changes"""
+        vocabulary = self.skill_service.snapshot()
+        if self._skills[0] != vocabulary.version:
+            # Flatten skills for easier matching (combine static + dynamic)
+            all_skills = []
+            for category, skills in self.skills_database.items():
+                all_skills.extend(skills)
+            all_skills.extend(vocabulary.all_skills)
+
+            all_skills = tuple(all_skills)
+            known_skills = frozenset(skill.lower() for skill in all_skills)
+            # A whole-word match of a skill implies each of its words is a whole word of the text,
+            # so the words double as a set-lookup prefilter before the regex runs
+            matchers = tuple(
+                (skill, tuple(WORD_PATTERN.findall(skill.lower())), r'\b' + re.escape(skill.lower()) + r'\b')
+                for skill in all_skills
+            )
+            self._skills = (vocabulary.version, all_skills, known_skills, matchers)
+        return self._skills
+
+    def current_skills(self):
+        """Static plus learned skills for the latest vocabulary snapshot"""
+        _, all_skills, known_skills, _ = self._current_skill_state()
+        return all_skills, known_skills
+
+    @property
+    def all_skills(self):
+        return self.current_skills()[0]
 
     def extract_text_from_pdf(self, file_path):
         """Extract text from PDF file using PyMuPDF"""
@@ -97,19 +151,9 @@ class ResumeParser:
             raise Exception(f"Error reading PDF: {str(e)}")
 
     def extract_text_from_docx(self, file_path):
-        """Extract text from DOCX file"""
+        """Extract text from DOCX file in a single streaming pass"""
         try:
-            # Try with docx2txt first (simpler)
-            text = docx2txt.process(file_path)
-            if text.strip():
-                return text.strip()
-
-            # Fallback to python-docx
-            doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return '\n'.join(self.docx_parser.iter_paragraphs(file_path)).strip()
         except Exception as e:
             raise Exception(f"Error reading DOCX: {str(e)}")
 
@@ -131,66 +175,60 @@ class ResumeParser:
         text = re.sub(r'\n+', '\n', text)
         return text.strip()
 
-    def extract_contact_info(self, text):
+    def extract_contact_info(self, document):
         """Extract contact information from resume text"""
+        document = self._as_document(document)
         contact_info = {}
 
         # Email extraction
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        contact_info['emails'] = emails
+        contact_info['emails'] = EMAIL_PATTERN.findall(document.text) if '@' in document.text else []
 
         # Phone number extraction
-        phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, text)
-        contact_info['phones'] = [phone[0] + phone[1] if isinstance(phone, tuple) else phone for phone in phones]
+        contact_info['phones'] = [match.group(0) for match in PHONE_PATTERN.finditer(document.text)]
 
         # LinkedIn profile
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        linkedin = re.findall(linkedin_pattern, text.lower())
-        contact_info['linkedin'] = linkedin
+        contact_info['linkedin'] = (
+            LINKEDIN_PATTERN.findall(document.lower) if 'linkedin.com/in/' in document.lower else []
+        )
 
         return contact_info
 
-    def extract_skills(self, text):
+    def extract_skills(self, document):
         """Extract skills from resume text using multiple approaches"""
-        text_lower = text.lower()
+        document = self._as_document(document)
+        text_lower = document.lower
         found_skills = []
+        _, _, known_skills, matchers = self._current_skill_state()
 
-        # Method 1: Direct skill matching
-        for skill in self.all_skills:
-            if skill.lower() in text_lower:
+        # Method 1: Direct skill matching. The document's word set is built in one scan,
+        # so most skills are ruled out by set lookups instead of a search of the text each
+        for skill, words, pattern in matchers:
+            if words and document.has_words(words):
                 # Check if it's a whole word match
-                pattern = r'\b' + re.escape(skill.lower()) + r'\b'
                 if re.search(pattern, text_lower):
                     found_skills.append(skill)
 
         # Method 2: NLP-based extraction using spaCy
         if self.nlp:
-            doc = self.nlp(text)
+            doc = self.nlp(document.text)
 
             # Extract noun phrases that might be skills
             for chunk in doc.noun_chunks:
                 chunk_text = chunk.text.lower().strip()
-                if len(chunk_text) > 2 and chunk_text in [skill.lower() for skill in self.all_skills]:
+                if len(chunk_text) > 2 and chunk_text in known_skills:
                     found_skills.append(chunk_text)
 
         # Remove duplicates and return
         return list(set(found_skills))
 
-    def extract_experience(self, text):
+    def extract_experience(self, document):
         """Extract work experience information"""
+        document = self._as_document(document)
         experience = []
 
         # Look for common experience patterns
-        experience_patterns = [
-            r'(\d{4})\s*[-–]\s*(\d{4}|\w+)\s*[:\-]?\s*([^\n]+)',
-            r'(\w+\s+\d{4})\s*[-–]\s*(\w+\s+\d{4}|\w+)\s*[:\-]?\s*([^\n]+)',
-        ]
-
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in EXPERIENCE_PATTERNS:
+            for match in pattern.findall(document.text):
                 if len(match) >= 3:
                     experience.append({
                         'start_date': match[0],
@@ -199,14 +237,9 @@ class ResumeParser:
                     })
 
         # Look for job titles and companies
-        job_title_patterns = [
-            r'(software engineer|developer|analyst|manager|director|consultant|specialist|coordinator)',
-            r'(senior|junior|lead|principal|associate)\s+(engineer|developer|analyst|manager)',
-        ]
-
         job_titles = []
-        for pattern in job_title_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in JOB_TITLE_PATTERNS:
+            matches = pattern.findall(document.text)
             job_titles.extend([' '.join(match) if isinstance(match, tuple) else match for match in matches])
 
         return {
@@ -214,19 +247,14 @@ class ResumeParser:
             'job_titles': list(set(job_titles))
         }
 
-    def extract_education(self, text):
+    def extract_education(self, document):
         """Extract education information"""
+        document = self._as_document(document)
         education = []
 
         # Degree patterns
-        degree_patterns = [
-            r'(bachelor|master|phd|doctorate|associate|diploma|certificate)\s*(of|in|degree)?\s*([^\n,]+)',
-            r'(b\.?s\.?|m\.?s\.?|m\.?a\.?|ph\.?d\.?|b\.?a\.?)\s*(in)?\s*([^\n,]+)',
-        ]
-
-        for pattern in degree_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in DEGREE_PATTERNS:
+            for match in pattern.findall(document.text):
                 if len(match) >= 3:
                     education.append({
                         'degree_type': match[0],
@@ -234,26 +262,77 @@ class ResumeParser:
                     })
 
         # University/Institution patterns
-        university_pattern = r'(university|college|institute|school)\s+of\s+([^\n,]+)|([^\n,]+)\s+(university|college|institute)'
-        universities = re.findall(university_pattern, text, re.IGNORECASE)
-
         institutions = []
-        for match in universities:
-            if match[1]:  # "University of X" format
-                institutions.append(f"University of {match[1]}")
-            elif match[2]:  # "X University" format
-                institutions.append(f"{match[2]} {match[3]}")
+        if document.contains_any(UNIVERSITY_KEYWORDS):
+            for match in UNIVERSITY_PATTERN.findall(document.text):
+                if match[1]:  # "University of X" format
+                    institutions.append(f"University of {match[1]}")
+                elif match[2]:  # "X University" format
+                    institutions.append(f"{match[2]} {match[3]}")
 
         return {
             'degrees': education,
             'institutions': list(set(institutions))
         }
 
-    def parse_resume(self, file_path):
+    def analyze_document(self, document, sections=None):
+        """Run every structured extractor over one analyzed document
+
+        When sections are given, each extractor listed in SECTION_ROUTES only sees
+        the sections routed to it, falling back to the whole document when none
+        of them were found. Other extractors always see the whole document.
+        """
+        extractors = {
+            'contact_info': self.extract_contact_info,
+            'skills': self.extract_skills,
+            'experience': self.extract_experience,
+            'education': self.extract_education
+        }
+
+        section_documents = {}
+        results = {}
+        for name, extractor in extractors.items():
+            target = document
+            if sections and name in SECTION_ROUTES:
+                routed = tuple(section for section in SECTION_ROUTES[name] if sections.get(section))
+                if routed:
+                    if routed not in section_documents:
+                        section_text = '\n'.join(sections[section] for section in routed)
+                        section_documents[routed] = AnalyzedDocument(self.clean_text(section_text))
+                    target = section_documents[routed]
+            results[name] = extractor(target)
+
+        return results
+
+    def extract_text_and_sections(self, file_path):
+        """Extract text and split it into resume sections, using PDF layout cues when available"""
+        file_extension = os.path.splitext(file_path)[1].lower()
+
+        if file_extension == '.pdf':
+            try:
+                formatted = self.pdf_parser.extract_text_with_formatting(file_path)
+            except Exception as e:
+                raise Exception(f"Error reading PDF: {str(e)}")
+            return formatted['full_text'].strip(), self.pdf_parser.find_sections_from_layout(formatted)
+
+        text = self.extract_text(file_path)
+        return text, self.pdf_parser.find_sections(text)
+
+    @staticmethod
+    def _as_document(document):
+        """Accept raw text for backwards compatibility"""
+        if isinstance(document, AnalyzedDocument):
+            return document
+        return AnalyzedDocument(document)
+
+    def parse_resume(self, file_path, section_routing=True):
         """Main method to parse resume and extract all information"""
         try:
-            # Extract text from file
-            text = self.extract_text(file_path)
+            # Extract text from file, segmenting it into sections first when routing
+            if section_routing:
+                text, sections = self.extract_text_and_sections(file_path)
+            else:
+                text, sections = self.extract_text(file_path), None
 
             if not text or len(text.strip()) < 50:
                 return {
@@ -261,29 +340,23 @@ class ResumeParser:
                     'error': 'Could not extract sufficient text from the resume. Please ensure the file is not corrupted.'
                 }
 
-            # Clean the text
-            cleaned_text = self.clean_text(text)
+            # Clean the text and compute its shared views once
+            document = AnalyzedDocument(self.clean_text(text))
 
             # Extract different components
-            contact_info = self.extract_contact_info(cleaned_text)
-            skills = self.extract_skills(cleaned_text)
-            experience = self.extract_experience(cleaned_text)
-            education = self.extract_education(cleaned_text)
-
-            # Calculate some basic statistics
-            word_count = len(cleaned_text.split())
-            sentence_count = len(sent_tokenize(cleaned_text))
+            extracted = self.analyze_document(document, sections)
+            skills = extracted['skills']
 
             return {
                 'success': True,
-                'text': cleaned_text,
-                'contact_info': contact_info,
+                'text': document.text,
+                'contact_info': extracted['contact_info'],
                 'skills': skills,
-                'experience': experience,
-                'education': education,
+                'experience': extracted['experience'],
+                'education': extracted['education'],
                 'statistics': {
-                    'word_count': word_count,
-                    'sentence_count': sentence_count,
+                    'word_count': document.word_count,
+                    'sentence_count': document.sentence_count,
                     'skills_count': len(skills)
                 }
             }
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Refresh Scheduler - Runs periodic refresh tasks while the server is up
+"""
+
+import os
+import random
+import socket
+import threading
+import time
+from datetime import datetime
+from database import get_connection
+
+# A shared task's lease; the running worker renews it, so a killed worker blocks the task only this long
+LEASE_TIMEOUT = int(os.getenv('SCHEDULER_LEASE_SECONDS', '120'))
+
+class ScheduledTask:
+    """A periodic task with its interval, jitter and in-process run statistics"""
+
+    def __init__(self, name, func, interval, jitter=0.1, lease_timeout=None, local=False):
+        self.name = name
+        self.func = func
+        self.interval = interval  # seconds
+        self.jitter = jitter      # fraction of the interval
+        self.lease_timeout = lease_timeout or LEASE_TIMEOUT
+        self.local = local        # local tasks run in every process without a lease
+
+        self.next_run = None
+        self.last_run = None
+        self.last_duration = None
+        self.last_status = None
+        self.running = False
+
+    def next_delay(self):
+        """Interval with random jitter so workers and hosts don't fire in lockstep"""
+        spread = self.interval * self.jitter
+        return self.interval + random.uniform(-spread, spread)
+
+class RefreshScheduler:
+    """
+    Background scheduler for live-job fetches, skill learning and index rebuilds.
+
+    Shared tasks are single-flight across every worker that uses the same
+    database: a worker must win a lease row in ``scheduler_tasks`` before it
+    runs a task, and the next-run time and last duration are persisted there.
+    Leases are short and renewed while the task runs, so a worker killed
+    mid-run frees the task within one lease timeout; next_run alone decides
+    how far apart runs are.
+    """
+
+    def __init__(self, poll_interval=30):
+        self.poll_interval = poll_interval
+        self.tasks = {}
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def add_task(self, name, func, interval, jitter=0.1, lease_timeout=None, local=False, last_run=None):
+        """Register a task; last_run seeds the first next-run time for new tasks"""
+        task = ScheduledTask(name, func, interval, jitter, lease_timeout, local)
+
+        now = time.time()
+        first_run = (last_run + task.interval) if last_run else now + task.next_delay()
+        task.next_run = first_run
+
+        if not local:
+            conn = get_connection()
+            try:
+                conn.execute(
+                    'INSERT OR IGNORE INTO scheduler_tasks (name, next_run) VALUES (?, ?)',
+                    (name, first_run)
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+        self.tasks[name] = task
+        return task
+
+    def start(self):
+        """Start the scheduler thread (one per process)"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        # Threads do not survive fork, so the owner must name the process that runs them
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name='refresh-scheduler', daemon=True)
+        self._thread.start()
+        print(f"⏰ Refresh scheduler started with {len(self.tasks)} tasks")
+
+    def stop(self, timeout=5):
+        """Stop the scheduler thread"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run_loop(self):
+        while not self._stop_event.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                print(f"⚠️ Scheduler error: {e}")
+            self._stop_event.wait(self.poll_interval)
+
+    def run_pending(self):
+        """Run every task that is due and that this process wins the lease for"""
+        for task in list(self.tasks.values()):
+            if self._stop_event.is_set():
+                break
+            if task.local:
+                if time.time() >= task.next_run:
+                    self._execute(task)
+                    task.next_run = time.time() + task.next_delay()
+            elif self._acquire_lease(task):
+                self._execute_leased(task)
+
+    def run_now(self, name):
+        """Run a task immediately in this process, still honoring the lease for shared tasks"""
+        task = self.tasks[name]
+        if task.local:
+            self._execute(task)
+            return True
+        if not self._acquire_lease(task, force=True):
+            return False
+        self._execute_leased(task)
+        return True
+
+    def _execute_leased(self, task):
+        """Run a task this process holds the lease for, renewing the lease until it finishes"""
+        finished = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(task, finished),
+                                     name=f'lease-{task.name}', daemon=True)
+        heartbeat.start()
+        try:
+            self._execute(task)
+        finally:
+            finished.set()
+            heartbeat.join()
+            self._release_lease(task)
+
+    def _heartbeat(self, task, finished):
+        while not finished.wait(task.lease_timeout / 3):
+            try:
+                if not self._renew_lease(task):
+                    print(f"⚠️ Lost the lease for scheduled task {task.name}")
+                    return
+            except Exception as e:
+                print(f"⚠️ Could not renew the lease for {task.name}: {e}")
+
+    def _execute(self, task):
+        task.running = True
+        started = time.time()
+        try:
+            task.func()
+            task.last_status = 'ok'
+        except Exception as e:
+            task.last_status = f'error: {e}'
+            print(f"⚠️ Scheduled task {task.name} failed: {e}")
+        finally:
+            task.running = False
+            task.last_run = started
+            task.last_duration = time.time() - started
+
+    def _acquire_lease(self, task, force=False):
+        """Atomically claim a due task; only one process across all workers succeeds"""
+        now = time.time()
+        due_clause = '' if force else 'AND next_run <= ?'
+        params = [self.owner, now + task.lease_timeout, task.name]
+        if not force:
+            params.append(now)
+        params.append(now)
+
+        conn = get_connection()
+        try:
+            cursor = conn.execute(f'''
+                UPDATE scheduler_tasks
+                SET lease_owner = ?, lease_expires = ?
+                WHERE name = ? {due_clause}
+                AND (lease_owner IS NULL OR lease_expires < ?)
+            ''', params)
+            conn.commit()
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def _renew_lease(self, task):
+        """Push our lease expiry forward; False if another process has taken the lease"""
+        conn = get_connection()
+        try:
+            cursor = conn.execute('''
+                UPDATE scheduler_tasks SET lease_expires = ?
+                WHERE name = ? AND lease_owner = ?
+            ''', (time.time() + task.lease_timeout, task.name, self.owner))
+            conn.commit()
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def _release_lease(self, task):
+        """Persist the run result and schedule the next run"""
+        task.next_run = time.time() + task.next_delay()
+
+        conn = get_connection()
+        try:
+            conn.execute('''
+                UPDATE scheduler_tasks
+                SET next_run = ?, last_run = ?, last_duration = ?, last_status = ?,
+                    lease_owner = NULL, lease_expires = NULL
+                WHERE name = ? AND lease_owner = ?
+            ''', (task.next_run, task.last_run, task.last_duration, task.last_status,
+                  task.name, self.owner))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_stats(self):
+        """Return next-run and last-duration stats for every task"""
+        persisted = {}
+        conn = get_connection()
+        try:
+            cursor = conn.execute('''
+                SELECT name, next_run, last_run, last_duration, last_status, lease_owner
+                FROM scheduler_tasks
+            ''')
+            for row in cursor.fetchall():
+                persisted[row[0]] = row
+        finally:
+            conn.close()
+
+        stats = {}
+        for name, task in self.tasks.items():
+            row = persisted.get(name)
+            if row:
+                next_run, last_run, last_duration, last_status, running_on = row[1:]
+            else:
+                next_run, last_run, last_duration, last_status = (
+                    task.next_run, task.last_run, task.last_duration, task.last_status
+                )
+                running_on = self.owner if task.running else None
+
+            stats[name] = {
+                'interval_seconds': task.interval,
+                'shared': not task.local,
+                'next_run': self._format_time(next_run),
+                'last_run': self._format_time(last_run),
+                'last_duration_seconds': round(last_duration, 3) if last_duration is not None else None,
+                'last_status': last_status,
+                'running_on': running_on
+            }
+
+        return stats
+
+    @staticmethod
+    def _format_time(timestamp):
+        return datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
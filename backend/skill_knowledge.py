@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Skill Knowledge - One DynamicSkillLearner per process, read through immutable vocabulary snapshots
+
+Consumers call snapshot() and keep using the SkillVocabulary they got; it
+never changes underneath them. Learning publishes a new snapshot with a
+higher version by swapping a single reference, so readers need no locks and
+pick up new skills on their next call. Other processes see skills saved to
+the shared store through reload_if_changed().
+"""
+
+import os
+import threading
+import time
+from dynamic_skill_learner import DynamicSkillLearner
+
+class SkillVocabulary:
+    """Immutable, versioned view of every known skill"""
+
+    __slots__ = ('version', 'categories', 'all_skills', 'known_skills')
+
+    def __init__(self, version, categories):
+        self.version = version
+        self.categories = {category: frozenset(skills) for category, skills in categories.items()}
+        self.all_skills = tuple(sorted(set().union(*self.categories.values()))) if self.categories else ()
+        self.known_skills = frozenset(skill.lower() for skill in self.all_skills)
+
+    def __len__(self):
+        return len(self.all_skills)
+
+    def __contains__(self, skill):
+        return skill.lower() in self.known_skills
+
+class SkillKnowledgeService:
+    """Owns the process's DynamicSkillLearner and publishes vocabulary snapshots from it"""
+
+    def __init__(self, learner=None, reload_interval=None):
+        self.learner = learner or DynamicSkillLearner()
+        # Serializes learning and publishing; snapshot() never takes it
+        self._lock = threading.Lock()
+        # Store version this process has caught up with
+        self._store_version = self.learner.store.version()
+        # Minimum seconds between store checks in reload_if_changed()
+        self.reload_interval = reload_interval if reload_interval is not None else float(
+            os.getenv('SKILL_RELOAD_SECONDS', '60'))
+        self._checked_at = time.monotonic()
+        self._snapshot = SkillVocabulary(1, self.learner.get_all_skills())
+
+    def snapshot(self):
+        """The current vocabulary; cheap enough to call on every request"""
+        return self._snapshot
+
+    @property
+    def version(self):
+        return self._snapshot.version
+
+    def _publish(self):
+        """Build the next snapshot from the learner and swap it in (caller holds the lock)"""
+        self._snapshot = SkillVocabulary(self._snapshot.version + 1, self.learner.get_all_skills())
+        print(f"📚 Published skill vocabulary v{self._snapshot.version} ({len(self._snapshot)} skills)")
+
+    def learn_from_job_postings(self, job_descriptions):
+        with self._lock:
+            new_skills = self.learner.learn_skills_from_job_postings(job_descriptions)
+            if new_skills:
+                self._publish()
+            return new_skills
+
+    def update_from_external_sources(self):
+        with self._lock:
+            self.learner.update_skills_from_external_sources()
+            self._publish()
+
+    def save(self):
+        with self._lock:
+            versions = self.learner.save_learned_skills()
+            # Skip our own write, but only if nobody else wrote since our last reload;
+            # otherwise the next reload_if_changed() must still pick their skills up
+            if versions and versions[0] == self._store_version:
+                self._store_version = versions[1]
+
+    def reload_if_changed(self, force=False):
+        """Reload skills another process saved to the shared store; returns True if a new snapshot was published"""
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.reload_interval:
+            return False
+        self._checked_at = now
+
+        store_version = self.learner.store.version()
+        if store_version == self._store_version:
+            return False
+
+        with self._lock:
+            self.learner.reload_learned_skills()
+            self._store_version = store_version
+            self._publish()
+        return True
+
+_service = None
+_service_lock = threading.Lock()
+
+def get_skill_service():
+    """The process-wide SkillKnowledgeService, created on first use"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = SkillKnowledgeService()
+    return _service
+
+# Test function
+if __name__ == "__main__":
+    service = get_skill_service()
+    vocabulary = service.snapshot()
+    print(f"Skill vocabulary v{vocabulary.version} with {len(vocabulary)} skills")
+
+    service.learn_from_job_postings(["We need a developer with React, TypeScript, and GraphQL experience"])
+    print(f"Old snapshot still has {len(vocabulary)} skills; v{service.version} has {len(service.snapshot())}")
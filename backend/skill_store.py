@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Skill Store - Incremental SQLite persistence for dynamically learned skills
+"""
+
+import os
+import pickle
+import random
+import sqlite3
+from collections import defaultdict
+from datetime import datetime
+
+class SkillStore:
+    """Stores learned skills, frequencies and sampled contexts; saves write only deltas"""
+
+    def __init__(self, db_path="database/learned_skills.db", max_contexts=20):
+        self.db_path = db_path
+        self.max_contexts = max_contexts  # reservoir size per skill
+        self._random = random.Random()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._init_schema()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_schema(self):
+        conn = self._connect()
+        try:
+            conn.executescript('''
+                CREATE TABLE IF NOT EXISTS learned_skills (
+                    skill TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    PRIMARY KEY (skill, category)
+                );
+                CREATE TABLE IF NOT EXISTS skill_frequency (
+                    skill TEXT PRIMARY KEY,
+                    count INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_skill_frequency_count ON skill_frequency (count DESC);
+                CREATE TABLE IF NOT EXISTS skill_contexts (
+                    skill TEXT NOT NULL,
+                    slot INTEGER NOT NULL,
+                    context TEXT NOT NULL,
+                    PRIMARY KEY (skill, slot)
+                );
+                CREATE TABLE IF NOT EXISTS skill_context_counts (
+                    skill TEXT PRIMARY KEY,
+                    seen INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS store_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            ''')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def is_empty(self):
+        """Check whether nothing has been learned yet"""
+        conn = self._connect()
+        try:
+            return conn.execute('SELECT 1 FROM learned_skills LIMIT 1').fetchone() is None
+        finally:
+            conn.close()
+
+    def load_learned_skills(self):
+        """Return learned skills grouped by category"""
+        learned = defaultdict(set)
+        conn = self._connect()
+        try:
+            for skill, category in conn.execute('SELECT skill, category FROM learned_skills'):
+                learned[category].add(skill)
+        finally:
+            conn.close()
+        return learned
+
+    def top_skills(self, top_n=20):
+        """Return the most frequent skills as (skill, count) pairs"""
+        conn = self._connect()
+        try:
+            return conn.execute(
+                'SELECT skill, count FROM skill_frequency ORDER BY count DESC LIMIT ?', (top_n,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+    def get_frequency(self, skill):
+        """Return the all-time mention count of a skill"""
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT count FROM skill_frequency WHERE skill = ?', (skill,)).fetchone()
+            return row[0] if row else 0
+        finally:
+            conn.close()
+
+    def get_contexts(self, skill):
+        """Return the sampled contexts stored for a skill"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                'SELECT context FROM skill_contexts WHERE skill = ? ORDER BY slot', (skill,)
+            ).fetchall()
+            return [row[0] for row in rows]
+        finally:
+            conn.close()
+
+    def get_meta(self, key, default=None):
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT value FROM store_meta WHERE key = ?', (key,)).fetchone()
+            return row[0] if row else default
+        finally:
+            conn.close()
+
+    def version(self):
+        """Number of writes ever applied to the store"""
+        return int(self.get_meta('version', 0))
+
+    def apply_delta(self, new_skills=(), frequency_delta=None, contexts=(), meta=None, merge_meta=None):
+        """
+        Write one batch of changes in a single transaction.
+
+        new_skills is an iterable of (category, skill) pairs, frequency_delta maps
+        skills to count increments and contexts is an iterable of (skill, context)
+        pairs. Contexts are reservoir-sampled so each skill keeps at most
+        max_contexts of them no matter how often it is seen. merge_meta maps keys
+        to functions that receive the stored value (or None) and return the new
+        one; they run under the write lock, so concurrent writers never lose each
+        other's updates. Returns the store version before and after this write.
+        """
+        conn = self._connect()
+        try:
+            # Take the write lock before any read so read-modify-write steps are atomic
+            conn.execute('BEGIN IMMEDIATE')
+            conn.executemany(
+                'INSERT OR IGNORE INTO learned_skills (skill, category) VALUES (?, ?)',
+                [(skill, category) for category, skill in new_skills]
+            )
+
+            if frequency_delta:
+                conn.executemany('''
+                    INSERT INTO skill_frequency (skill, count) VALUES (?, ?)
+                    ON CONFLICT(skill) DO UPDATE SET count = count + excluded.count
+                ''', list(frequency_delta.items()))
+
+            self._sample_contexts(conn, contexts)
+
+            meta = dict(meta or {})
+            for key, merge in (merge_meta or {}).items():
+                row = conn.execute('SELECT value FROM store_meta WHERE key = ?', (key,)).fetchone()
+                meta[key] = merge(row[0] if row else None)
+
+            if meta:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)',
+                    list(meta.items())
+                )
+
+            # Monotonic write counter: readers compare it to tell their own writes from others'
+            row = conn.execute("SELECT value FROM store_meta WHERE key = 'version'").fetchone()
+            previous = int(row[0]) if row else 0
+            conn.executemany(
+                'INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)',
+                [('last_updated', datetime.now().isoformat()), ('version', str(previous + 1))]
+            )
+            conn.commit()
+            return previous, previous + 1
+        finally:
+            conn.close()
+
+    def _sample_contexts(self, conn, contexts):
+        """Reservoir sampling (algorithm R) over every context ever offered per skill"""
+        grouped = defaultdict(list)
+        for skill, context in contexts:
+            grouped[skill].append(context)
+
+        for skill, skill_contexts in grouped.items():
+            row = conn.execute('SELECT seen FROM skill_context_counts WHERE skill = ?', (skill,)).fetchone()
+            seen = row[0] if row else 0
+
+            for context in skill_contexts:
+                seen += 1
+                if seen <= self.max_contexts:
+                    slot = seen - 1
+                else:
+                    slot = self._random.randrange(seen)
+                    if slot >= self.max_contexts:
+                        continue
+                conn.execute(
+                    'INSERT OR REPLACE INTO skill_contexts (skill, slot, context) VALUES (?, ?, ?)',
+                    (skill, slot, context)
+                )
+
+            conn.execute(
+                'INSERT OR REPLACE INTO skill_context_counts (skill, seen) VALUES (?, ?)',
+                (skill, seen)
+            )
+
+    def import_pickle(self, filename):
+        """One-time migration from the old whole-file pickle format"""
+        with open(filename, 'rb') as f:
+            data = pickle.load(f)
+
+        new_skills = [
+            (category, skill)
+            for category, skills in data.get('learned_skills', {}).items()
+            for skill in skills
+        ]
+        contexts = [
+            (skill, context)
+            for skill, skill_contexts in data.get('skill_contexts', {}).items()
+            for context in skill_contexts
+        ]
+        self.apply_delta(new_skills, data.get('skill_frequency', {}), contexts)
+        return len(new_skills)
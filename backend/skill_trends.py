@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Skill Trends - Bounded-memory, time-decayed tracking of trending skills
+"""
+
+import json
+import math
+import time
+
+WINDOWS = {
+    'week': 7 * 24 * 3600,
+    'month': 30 * 24 * 3600
+}
+
+class DecayedHeavyHitters:
+    """
+    Space-Saving heavy-hitters sketch with exponential time decay.
+
+    Counts use forward decay: each mention is stored with weight
+    exp(rate * (t - landmark)), so old mentions never need to be touched and
+    the decayed value is recovered at query time. At most 2 * capacity items
+    are tracked; when the table fills up it is pruned back to the capacity
+    largest counts, and new items start at the largest pruned count so
+    estimates stay upper bounds, as in Space-Saving.
+    """
+
+    def __init__(self, capacity=500, half_life=WINDOWS['week'], landmark=None):
+        self.capacity = capacity
+        self.half_life = half_life
+        self.rate = math.log(2) / half_life
+        self.landmark = landmark if landmark is not None else time.time()
+        self.counts = {}   # item -> forward-decayed weight
+        self.floor = 0.0   # largest weight evicted so far
+
+    def _weight(self, timestamp):
+        return math.exp(self.rate * (timestamp - self.landmark))
+
+    def add(self, item, count=1, timestamp=None):
+        """Record count mentions of item at timestamp (defaults to now)"""
+        timestamp = timestamp if timestamp is not None else time.time()
+        weight = self._weight(timestamp)
+
+        # Keep weights in floating-point range by moving the landmark forward
+        if weight > 1e100:
+            self._rescale(timestamp)
+            weight = 1.0
+
+        if item in self.counts:
+            self.counts[item] += count * weight
+        else:
+            self.counts[item] = self.floor + count * weight
+            if len(self.counts) > 2 * self.capacity:
+                self._prune()
+
+    def _prune(self):
+        ranked = sorted(self.counts.items(), key=lambda entry: entry[1], reverse=True)
+        self.floor = max(self.floor, ranked[self.capacity][1])
+        self.counts = dict(ranked[:self.capacity])
+
+    def _rescale(self, timestamp):
+        factor = math.exp(-self.rate * (timestamp - self.landmark))
+        self.counts = {item: weight * factor for item, weight in self.counts.items()}
+        self.floor *= factor
+        self.landmark = timestamp
+
+    def estimate(self, item, now=None):
+        """Decayed count of item as of now"""
+        now = now if now is not None else time.time()
+        weight = self.counts.get(item, 0.0)
+        return weight / self._weight(now)
+
+    def top(self, top_n=20, now=None):
+        """Return the top_n items as (item, decayed count) pairs"""
+        now = now if now is not None else time.time()
+        scale = self._weight(now)
+        ranked = sorted(self.counts.items(), key=lambda entry: entry[1], reverse=True)[:top_n]
+        return [(item, weight / scale) for item, weight in ranked]
+
+    def merge(self, other):
+        """Add the counts of another sketch with the same half-life, e.g. mentions recorded by another process"""
+        # Rebase both sketches onto the later landmark so weights are comparable
+        if other.landmark > self.landmark:
+            self._rescale(other.landmark)
+        factor = math.exp(self.rate * (other.landmark - self.landmark))
+
+        # An item missing from a sketch was seen at most floor times there, so adding
+        # the floor keeps every merged count an upper bound
+        other_floor = other.floor * factor
+        for item in set(self.counts) | set(other.counts):
+            mine = self.counts.get(item, self.floor)
+            theirs = other.counts[item] * factor if item in other.counts else other_floor
+            self.counts[item] = mine + theirs
+        self.floor += other_floor
+
+        if len(self.counts) > 2 * self.capacity:
+            self._prune()
+
+    def to_dict(self):
+        return {
+            'capacity': self.capacity,
+            'half_life': self.half_life,
+            'landmark': self.landmark,
+            'floor': self.floor,
+            'counts': self.counts
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['capacity'], data['half_life'], data['landmark'])
+        sketch.floor = data.get('floor', 0.0)
+        sketch.counts = dict(data.get('counts', {}))
+        return sketch
+
+class SkillTrendTracker:
+    """Tracks skill mentions over several decay windows with constant memory"""
+
+    def __init__(self, capacity=500, windows=None):
+        self.capacity = capacity
+        self.sketches = {
+            name: DecayedHeavyHitters(capacity, half_life)
+            for name, half_life in (windows or WINDOWS).items()
+        }
+
+    def observe(self, skill_counts, timestamp=None):
+        """Record a mapping of skill -> mention count observed at timestamp"""
+        for skill, count in skill_counts.items():
+            for sketch in self.sketches.values():
+                sketch.add(skill, count, timestamp)
+
+    def top(self, window='week', top_n=20, now=None):
+        """Most mentioned skills in a decay window as (skill, decayed count) pairs"""
+        return [(skill, round(count, 2)) for skill, count in self.sketches[window].top(top_n, now)]
+
+    def compare(self, short_window='week', long_window='month', top_n=20, now=None):
+        """
+        Rank skills by how much hotter they are in the short window than the long one.
+
+        Decayed counts are converted to rates (mentions per day) so windows with
+        different half-lives are comparable; a lift above 1.0 means the skill
+        is mentioned more often recently than over the longer horizon.
+        """
+        short_sketch = self.sketches[short_window]
+        long_sketch = self.sketches[long_window]
+        seconds_per_day = 24 * 3600
+
+        trends = []
+        for skill, short_count in short_sketch.top(short_sketch.capacity, now):
+            long_count = long_sketch.estimate(skill, now)
+            short_rate = short_count * short_sketch.rate * seconds_per_day
+            long_rate = long_count * long_sketch.rate * seconds_per_day
+            trends.append({
+                'skill': skill,
+                f'{short_window}_mentions_per_day': round(short_rate, 3),
+                f'{long_window}_mentions_per_day': round(long_rate, 3),
+                'lift': round(short_rate / long_rate, 3) if long_rate > 0 else None
+            })
+
+        trends.sort(key=lambda trend: (trend['lift'] or 0.0, trend[f'{short_window}_mentions_per_day']),
+                    reverse=True)
+        return trends[:top_n]
+
+    def merge(self, other):
+        """Add another tracker's counts window by window"""
+        for name, sketch in other.sketches.items():
+            if name in self.sketches:
+                self.sketches[name].merge(sketch)
+
+    def to_json(self):
+        return json.dumps({
+            'capacity': self.capacity,
+            'sketches': {name: sketch.to_dict() for name, sketch in self.sketches.items()}
+        })
+
+    @classmethod
+    def from_json(cls, payload):
+        data = json.loads(payload)
+        tracker = cls(data['capacity'])
+        tracker.sketches = {
+            name: DecayedHeavyHitters.from_dict(sketch)
+            for name, sketch in data['sketches'].items()
+        }
+        return tracker
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Synthetic Corpus - Deterministic job CSVs and resume files for scale and performance testing
+
+Usage (from the backend directory):
+    python synthetic_corpus.py --jobs 100000 --resumes 500 --out ../database/synthetic
+    python synthetic_corpus.py --jobs 5000 --resumes 60 --formats pdf,docx,txt --seed 7
+
+Skills are drawn from the parser's and SkillExtractor's skill databases,
+with Zipf-like popularity inside each category and a role-specific mix of
+categories, so the text looks like what the matcher sees in production.
+Every job and resume is generated from its own seed derived from --seed and
+its position. The first N rows are therefore identical at any --jobs count,
+and two runs with the same arguments produce the same files. The jobs CSV has
+the same columns as database/jobs.csv; point JobMatcher.load_job_data() at it.
+"""
+
+import argparse
+import csv
+import os
+import random
+from resume_parser import SKILLS_DATABASE
+from utils.skill_extractor import SKILL_DATABASE
+
+JOB_COLUMNS = ['title', 'company', 'location', 'description', 'requirements', 'salary_range',
+               'job_type', 'experience_level']
+
+# role -> (skill category weights, degree field)
+ROLES = {
+    'Software Engineer': ({'programming_languages': 4, 'frameworks_libraries': 3, 'databases': 2,
+                           'tools_technologies': 2, 'cloud_platforms': 1, 'methodologies': 1}, 'Computer Science'),
+    'Backend Developer': ({'programming_languages': 4, 'frameworks_libraries': 2, 'databases': 3,
+                           'cloud_platforms': 1, 'devops_tools': 1}, 'Computer Science'),
+    'Frontend Developer': ({'web_technologies': 4, 'programming_languages': 2, 'frameworks_libraries': 3,
+                            'tools_technologies': 1}, 'Computer Science'),
+    'Full Stack Developer': ({'web_technologies': 3, 'programming_languages': 3, 'frameworks_libraries': 3,
+                              'databases': 2, 'cloud_platforms': 1}, 'Software Engineering'),
+    'Data Scientist': ({'data_science_ml': 5, 'programming_languages': 2, 'databases': 1,
+                        'frameworks_libraries': 2}, 'Statistics'),
+    'Machine Learning Engineer': ({'data_science_ml': 4, 'programming_languages': 3, 'cloud_platforms': 1,
+                                   'devops_tools': 1}, 'Computer Science'),
+    'Data Engineer': ({'databases': 4, 'programming_languages': 3, 'cloud_platforms': 2,
+                       'data_science_ml': 1, 'devops_tools': 1}, 'Information Systems'),
+    'DevOps Engineer': ({'devops_tools': 4, 'cloud_platforms': 3, 'tools_technologies': 3,
+                         'programming_languages': 1}, 'Computer Engineering'),
+    'Cloud Architect': ({'cloud_platforms': 5, 'devops_tools': 2, 'databases': 1,
+                         'certifications': 2}, 'Computer Engineering'),
+    'Mobile Developer': ({'mobile_development': 5, 'programming_languages': 3, 'version_control': 1},
+                         'Computer Science'),
+    'QA Engineer': ({'tools_technologies': 3, 'programming_languages': 2, 'methodologies': 2,
+                     'version_control': 1}, 'Information Technology')
+}
+
+# experience_level -> (title prefix, years range, salary range in $k)
+SENIORITY = [
+    ('Junior', 'Junior', (0, 2), (55, 85)),
+    ('Mid-level', '', (2, 5), (80, 130)),
+    ('Senior', 'Senior', (5, 10), (120, 180)),
+    ('Lead', 'Lead', (8, 15), (150, 220))
+]
+
+JOB_TYPES = [('Full-time', 0.8), ('Contract', 0.1), ('Part-time', 0.05), ('Internship', 0.05)]
+
+LOCATIONS = [
+    'San Francisco, CA', 'New York, NY', 'Seattle, WA', 'Austin, TX', 'Boston, MA', 'Chicago, IL',
+    'Denver, CO', 'Atlanta, GA', 'Los Angeles, CA', 'Portland, OR', 'Raleigh, NC', 'Remote'
+]
+
+COMPANY_WORDS = ['Tech', 'Data', 'Cloud', 'Nimbus', 'Vertex', 'Blue', 'Quantum', 'Bright', 'Apex', 'Pixel',
+                 'Stack', 'Signal', 'Harbor', 'Summit', 'Lumen', 'Orbit']
+COMPANY_SUFFIXES = ['Corp', 'Labs', 'Systems', 'Solutions', 'Analytics', 'Technologies', 'Inc.', 'LLC', 'Works']
+
+FIRST_NAMES = ['Alex', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Jamie', 'Avery', 'Priya', 'Wei',
+               'Carlos', 'Fatima', 'Noah', 'Emma', 'Liam', 'Olivia', 'Hiro', 'Amara', 'Mateo', 'Sofia']
+LAST_NAMES = ['Smith', 'Johnson', 'Lee', 'Garcia', 'Patel', 'Chen', 'Nguyen', 'Kim', 'Brown', 'Martinez',
+              'Davis', 'Lopez', 'Wilson', 'Okafor', 'Singh', 'Tanaka', 'Rossi', 'Muller', 'Cohen', 'Ali']
+UNIVERSITIES = ['University of California, Berkeley', 'University of Texas at Austin', 'Georgia Institute of Technology',
+                'University of Washington', 'Carnegie Mellon University', 'University of Michigan',
+                'Purdue University', 'University of Illinois Urbana-Champaign']
+
+DESCRIPTION_TEMPLATES = [
+    "{company} is looking for a {title} to join our team. You will build and maintain {focus} "
+    "using {skills}. You will work closely with product and design to ship features our customers rely on.",
+    "Join {company} as a {title}. Our team develops {focus} at scale with {skills}. "
+    "We value ownership, code review and continuous delivery.",
+    "As a {title} at {company}, you will design, implement and operate {focus}. "
+    "Day to day you will use {skills} and mentor other engineers."
+]
+FOCUS = {
+    'Software Engineer': 'scalable web services', 'Backend Developer': 'APIs and distributed services',
+    'Frontend Developer': 'responsive user interfaces', 'Full Stack Developer': 'end-to-end product features',
+    'Data Scientist': 'predictive models and analytics', 'Machine Learning Engineer': 'production machine learning pipelines',
+    'Data Engineer': 'data pipelines and warehouses', 'DevOps Engineer': 'CI/CD pipelines and cloud infrastructure',
+    'Cloud Architect': 'secure multi-region cloud platforms', 'Mobile Developer': 'iOS and Android applications',
+    'QA Engineer': 'automated test suites'
+}
+BULLET_TEMPLATES = [
+    "Developed and maintained {focus} using {a} and {b}",
+    "Improved performance of {focus} by {pct}% by introducing {a}",
+    "Designed {focus} on {a}, serving {users} users",
+    "Led migration from {b} to {a}, cutting costs by {pct}%",
+    "Collaborated with cross-functional teams to deliver {focus} with {a}"
+]
+
+def skill_pools():
+    """Merge both skill databases by category; the parser's list order stands in for popularity"""
+    pools = {}
+    for category in sorted(set(SKILLS_DATABASE) | set(SKILL_DATABASE)):
+        ordered = list(SKILLS_DATABASE.get(category, []))
+        ordered += sorted(set(SKILL_DATABASE.get(category, ())) - set(ordered))
+        pools[category] = ordered
+    return pools
+
+class SkillSampler:
+    """Draws distinct skills for a role with Zipf-like popularity inside each category"""
+
+    def __init__(self, zipf_exponent=1.1):
+        self.pools = skill_pools()
+        self.weights = {
+            category: [1 / (rank + 1) ** zipf_exponent for rank in range(len(skills))]
+            for category, skills in self.pools.items()
+        }
+
+    def sample(self, rng, role, count):
+        category_weights, _ = ROLES[role]
+        categories = [category for category in category_weights if self.pools.get(category)]
+        chosen = []
+        # Bounded attempts: small categories can run out of unused skills
+        for _ in range(count * 4):
+            if len(chosen) >= count:
+                break
+            category = rng.choices(categories, weights=[category_weights[c] for c in categories])[0]
+            skill = rng.choices(self.pools[category], weights=self.weights[category])[0]
+            if skill not in chosen:
+                chosen.append(skill)
+        return chosen
+
+# Spellings that str.title() gets wrong
+DISPLAY_NAMES = {
+    'javascript': 'JavaScript', 'typescript': 'TypeScript', 'postgresql': 'PostgreSQL', 'mysql': 'MySQL',
+    'mongodb': 'MongoDB', 'graphql': 'GraphQL', 'github': 'GitHub', 'gitlab': 'GitLab', 'node.js': 'Node.js',
+    'scikit-learn': 'scikit-learn', 'pytorch': 'PyTorch', 'tensorflow': 'TensorFlow', 'numpy': 'NumPy',
+    'c++': 'C++', 'c#': 'C#', 'php': 'PHP', 'ios': 'iOS', 'jquery': 'jQuery', 'fastapi': 'FastAPI',
+    'dynamodb': 'DynamoDB', 'elasticsearch': 'Elasticsearch', 'nosql': 'NoSQL', 'git': 'Git', 'go': 'Go',
+    'koa': 'Koa', 'lua': 'Lua', 'npm': 'npm', 'pip': 'pip', 'vue': 'Vue'
+}
+
+def display(skill):
+    """Skills are stored lowercase; write them the way postings and resumes do"""
+    if skill in DISPLAY_NAMES:
+        return DISPLAY_NAMES[skill]
+    return skill.upper() if len(skill) <= 3 else skill.title()
+
+class CorpusGenerator:
+    """Seeded generator of job rows and structured resumes"""
+
+    def __init__(self, seed=42, duplicate_rate=0.02):
+        self.seed = seed
+        self.duplicate_rate = duplicate_rate
+        self.sampler = SkillSampler()
+        self.roles = sorted(ROLES)
+
+    def _rng(self, kind, number):
+        # String seeds are hashed deterministically by random.Random, independent of PYTHONHASHSEED
+        return random.Random(f"{self.seed}:{kind}:{number}")
+
+    def company(self, rng):
+        return f"{rng.choice(COMPANY_WORDS)}{rng.choice(COMPANY_WORDS).lower()} {rng.choice(COMPANY_SUFFIXES)}"
+
+    def job(self, number):
+        """One job row; a small share are reposts of an earlier job, like real job boards"""
+        rng = self._rng('job', number)
+        if number > 0 and rng.random() < self.duplicate_rate:
+            original = self.job(rng.randrange(number))
+            original['location'] = rng.choice(LOCATIONS)
+            original['description'] += ' Apply today!'
+            return original
+
+        role = rng.choice(self.roles)
+        level, prefix, (min_years, max_years), (min_salary, max_salary) = rng.choice(SENIORITY)
+        title = f"{prefix} {role}".strip()
+        company = self.company(rng)
+        skills = [display(skill) for skill in self.sampler.sample(rng, role, rng.randint(5, 10))]
+        years = rng.randint(max(1, min_years), max_years)
+        salary = rng.randint(min_salary, max_salary)
+
+        return {
+            'title': title,
+            'company': company,
+            'location': rng.choice(LOCATIONS),
+            'description': rng.choice(DESCRIPTION_TEMPLATES).format(
+                company=company, title=title, focus=FOCUS[role], skills=', '.join(skills[:3])
+            ),
+            'requirements': f"{', '.join(skills)}, {years}+ years experience",
+            'salary_range': f"${salary},000 - ${salary + rng.randint(15, 45)},000",
+            'job_type': rng.choices([t for t, _ in JOB_TYPES], weights=[w for _, w in JOB_TYPES])[0],
+            'experience_level': level
+        }
+
+    def write_jobs(self, path, count):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=JOB_COLUMNS)
+            writer.writeheader()
+            for number in range(count):
+                writer.writerow(self.job(number))
+        print(f"✅ Wrote {count} jobs to {path}")
+
+    def resume(self, number):
+        """A resume as (kind, text) blocks: name, line, heading, bullet"""
+        rng = self._rng('resume', number)
+        role = rng.choice(self.roles)
+        _, field = ROLES[role]
+        level, prefix, (min_years, max_years), _ = rng.choice(SENIORITY)
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        skills = self.sampler.sample(rng, role, rng.randint(8, 18))
+        years = rng.randint(max(1, min_years), max_years)
+        end_year = 2025
+
+        blocks = [
+            ('name', f"{first} {last}".upper()),
+            ('line', f"{prefix} {role}".strip()),
+            ('line', f"Email: {first.lower()}.{last.lower()}{number}@example.com"),
+            ('line', f"Phone: ({rng.randint(200, 989)}) {rng.randint(200, 989)}-{rng.randint(1000, 9999)}"),
+            ('line', f"LinkedIn: linkedin.com/in/{first.lower()}-{last.lower()}-{number}"),
+            ('line', f"Location: {rng.choice(LOCATIONS)}"),
+            ('heading', 'PROFESSIONAL SUMMARY'),
+            ('line', f"{role} with {years}+ years of experience building {FOCUS[role]} "
+                     f"with {', '.join(display(skill) for skill in skills[:3])}."),
+            ('heading', 'TECHNICAL SKILLS')
+        ]
+        by_category = {}
+        for skill in skills:
+            category = next(c for c, pool in self.sampler.pools.items() if skill in pool)
+            by_category.setdefault(category, []).append(display(skill))
+        for category, category_skills in by_category.items():
+            blocks.append(('line', f"{category.replace('_', ' ').title()}: {', '.join(category_skills)}"))
+
+        blocks.append(('heading', 'PROFESSIONAL EXPERIENCE'))
+        year = end_year
+        remaining = years
+        position = 0
+        while remaining > 0 and position < 4:
+            span = min(remaining, rng.randint(1, 4))
+            start = year - span
+            title = f"{prefix} {role}".strip() if position == 0 else role
+            end = 'Present' if position == 0 else str(year)
+            blocks.append(('line', f"{title} | {self.company(rng)} | {start} - {end}"))
+            for _ in range(rng.randint(2, 4)):
+                a, b = rng.sample(skills, 2) if len(skills) > 1 else (skills[0], skills[0])
+                blocks.append(('bullet', rng.choice(BULLET_TEMPLATES).format(
+                    focus=FOCUS[role], a=display(a), b=display(b),
+                    pct=rng.randint(10, 60), users=f"{rng.randint(1, 900)}k"
+                )))
+            year, remaining, position = start, remaining - span, position + 1
+
+        graduation = year - rng.randint(0, 2)
+        blocks += [
+            ('heading', 'EDUCATION'),
+            ('line', f"{rng.choice(['Bachelor of Science', 'Master of Science'])} in {field}"),
+            ('line', f"{rng.choice(UNIVERSITIES)} | {graduation - 4} - {graduation}")
+        ]
+        certifications = [display(skill) for skill in skills if skill in self.sampler.pools.get('certifications', [])]
+        if certifications:
+            blocks.append(('heading', 'CERTIFICATIONS'))
+            blocks += [('bullet', certification) for certification in certifications]
+        return blocks
+
+    def write_resumes(self, directory, count, formats=('txt', 'pdf', 'docx')):
+        """Write count resumes, cycling through formats so each format gets a share"""
+        writers = {'txt': write_text, 'pdf': write_pdf, 'docx': write_docx}
+        os.makedirs(directory, exist_ok=True)
+        for number in range(count):
+            extension = formats[number % len(formats)]
+            path = os.path.join(directory, f"resume_{number:06d}.{extension}")
+            writers[extension](path, self.resume(number))
+        print(f"✅ Wrote {count} resumes ({', '.join(formats)}) to {directory}")
+
+def write_text(path, blocks):
+    lines = []
+    for kind, text in blocks:
+        if kind == 'heading':
+            lines += ['', text]
+        elif kind == 'bullet':
+            lines.append(f"• {text}")
+        else:
+            lines.append(text)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+
+def write_pdf(path, blocks):
+    """Single-column PDF with larger bold headings, so layout-based section detection has real cues"""
+    import fitz  # PyMuPDF
+
+    styles = {'name': (18, 'hebo'), 'heading': (13, 'hebo'), 'line': (10, 'helv'), 'bullet': (10, 'helv')}
+    document = fitz.open()
+    page, y = document.new_page(), 60
+    for kind, text in blocks:
+        size, font = styles[kind]
+        if kind == 'heading':
+            y += 8
+        if y > page.rect.height - 60:
+            page, y = document.new_page(), 60
+        x = 72 if kind != 'bullet' else 84
+        text = f"• {text}" if kind == 'bullet' else text
+        rect = fitz.Rect(x, y - size, page.rect.width - 60, y + 3 * size)
+        # insert_textbox wraps long lines; a negative result means the box was too small
+        overflow = page.insert_textbox(rect, text, fontsize=size, fontname=font)
+        lines = 1 if overflow >= 0 else 3
+        y += size * 1.5 * (lines if len(text) > 95 else 1)
+    document.save(path)
+    document.close()
+
+def write_docx(path, blocks):
+    from docx import Document
+
+    document = Document()
+    for kind, text in blocks:
+        if kind == 'name':
+            document.add_heading(text, level=0)
+        elif kind == 'heading':
+            document.add_heading(text, level=1)
+        elif kind == 'bullet':
+            document.add_paragraph(text, style='List Bullet')
+        else:
+            document.add_paragraph(text)
+    document.save(path)
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic job and resume corpus')
+    parser.add_argument('--out', default='../database/synthetic', help='Output directory')
+    parser.add_argument('--jobs', type=int, default=10000, help='Number of job rows')
+    parser.add_argument('--resumes', type=int, default=100, help='Number of resume files')
+    parser.add_argument('--formats', default='txt,pdf,docx', help='Comma-separated resume formats')
+    parser.add_argument('--seed', type=int, default=42, help='Seed; the same seed reproduces the same corpus')
+    parser.add_argument('--duplicate-rate', type=float, default=0.02,
+                        help='Share of jobs that repost an earlier job (exercises near-duplicate removal)')
+    args = parser.parse_args()
+
+    formats = tuple(fmt.strip().lower() for fmt in args.formats.split(',') if fmt.strip())
+    unknown = set(formats) - {'txt', 'pdf', 'docx'}
+    if unknown:
+        parser.error(f"Unknown formats: {', '.join(sorted(unknown))}")
+
+    generator = CorpusGenerator(args.seed, args.duplicate_rate)
+    if args.jobs:
+        generator.write_jobs(os.path.join(args.out, 'jobs.csv'), args.jobs)
+    if args.resumes:
+        generator.write_resumes(os.path.join(args.out, 'resumes'), args.resumes, formats)
+
+if __name__ == "__main__":
+    main()
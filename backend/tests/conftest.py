@@ -0,0 +1,135 @@
+"""Shared pytest fixtures; tests import backend modules the way the app does, from the backend directory"""
+
+import os
+import re
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+WORD_PATTERN = re.compile(r'[a-z][a-z0-9+#.]*')
+
+def textblob_corpora_available():
+    try:
+        from textblob import TextBlob
+        TextBlob('Python developer').noun_phrases
+        return True
+    except Exception:
+        return False
+
+def punkt_available():
+    try:
+        import nltk
+        nltk.data.find('tokenizers/punkt_tab')
+        return True
+    except LookupError:
+        return False
+
+@pytest.fixture
+def offline_sentences(monkeypatch):
+    """Split sentences on terminal punctuation when NLTK's punkt model is not downloaded"""
+    import analyzed_document
+    if not punkt_available():
+        monkeypatch.setattr(analyzed_document, 'sent_tokenize',
+                            lambda text: [s for s in re.split(r'(?<=[.!?])\s+', text) if s])
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """A fresh users.db with the current schema"""
+    import database as db
+    monkeypatch.setenv('DATABASE_PATH', str(tmp_path / 'users.db'))
+    db.init_database()
+    return db
+
+@pytest.fixture
+def offline_nlp(monkeypatch):
+    """Word sets instead of TextBlob noun phrases when the NLTK corpora are not downloaded"""
+    from utils import job_features, similarity
+    if not textblob_corpora_available():
+        def noun_phrase_set(text):
+            return frozenset(WORD_PATTERN.findall(text.lower()))
+        monkeypatch.setattr(job_features, 'noun_phrase_set', noun_phrase_set)
+        monkeypatch.setattr(similarity, 'noun_phrase_set', noun_phrase_set)
+    similarity.noun_phrases.cache_clear()
+    yield
+    similarity.noun_phrases.cache_clear()
+
+JOBS = [
+    {'title': 'Senior Python Developer', 'company': 'TechCorp', 'location': 'Remote',
+     'description': 'Build Django and Flask APIs backed by PostgreSQL on AWS.',
+     'requirements': 'Python, Django, Flask, PostgreSQL, AWS, 5+ years experience',
+     'salary_range': '$120,000 - $150,000', 'job_type': 'Full-time', 'experience_level': 'Senior'},
+    {'title': 'Data Scientist', 'company': 'DataCo', 'location': 'Boston, MA',
+     'description': 'Train machine learning models with Python, pandas and scikit-learn.',
+     'requirements': 'Python, pandas, scikit-learn, SQL, statistics, 3+ years experience',
+     'salary_range': '$110,000 - $140,000', 'job_type': 'Full-time', 'experience_level': 'Mid-level'},
+    {'title': 'Frontend Engineer', 'company': 'WebWorks', 'location': 'Austin, TX',
+     'description': 'Create React and TypeScript user interfaces for our web platform.',
+     'requirements': 'JavaScript, TypeScript, React, CSS, 2+ years experience',
+     'salary_range': '$95,000 - $125,000', 'job_type': 'Full-time', 'experience_level': 'Mid-level'},
+    {'title': 'DevOps Engineer', 'company': 'CloudOps', 'location': 'Seattle, WA',
+     'description': 'Run Kubernetes clusters and Terraform pipelines on AWS.',
+     'requirements': 'Docker, Kubernetes, Terraform, AWS, Python, 4+ years experience',
+     'salary_range': '$115,000 - $145,000', 'job_type': 'Full-time', 'experience_level': 'Senior'},
+    {'title': 'Junior Java Developer', 'company': 'Enterprise Inc', 'location': 'Chicago, IL',
+     'description': 'Maintain Spring Boot services and write unit tests.',
+     'requirements': 'Java, Spring, SQL, Git, 1+ years experience',
+     'salary_range': '$70,000 - $90,000', 'job_type': 'Full-time', 'experience_level': 'Junior'}
+]
+
+@pytest.fixture
+def jobs():
+    import pandas as pd
+    return pd.DataFrame(JOBS)
+
+class FakeSkillStore:
+    def __init__(self):
+        self.meta = {}
+
+    def get_meta(self, key, default=None):
+        return self.meta.get(key, default)
+
+    def version(self):
+        return int(self.meta.get('version', 0))
+
+class FakeSkillLearner:
+    """Just enough of DynamicSkillLearner for code that reads the skill vocabulary"""
+
+    def __init__(self, skills=('python', 'django', 'flask', 'sql', 'aws', 'react', 'docker', 'java')):
+        self.store = FakeSkillStore()
+        self.skills = {'base': set(skills)}
+        self.stop_words = {'the', 'and', 'with', 'a', 'of', 'in'}
+
+    def get_all_skills(self):
+        return {category: set(skills) for category, skills in self.skills.items()}
+
+    def reload_learned_skills(self):
+        pass
+
+@pytest.fixture
+def skill_learner_factory(tmp_path, monkeypatch):
+    """Real DynamicSkillLearners sharing one store, as separate worker processes would"""
+    import dynamic_skill_learner
+    monkeypatch.setattr(dynamic_skill_learner.nltk.data, 'find', lambda resource: True)
+    monkeypatch.setattr(dynamic_skill_learner, 'stopwords',
+                        SimpleNamespace(words=lambda language: ['the', 'and', 'with']))
+    store_path = str(tmp_path / 'learned_skills.db')
+    return lambda: dynamic_skill_learner.DynamicSkillLearner(store_path)
+
+@pytest.fixture
+def skill_service(monkeypatch):
+    """Process-wide skill service backed by a fake learner (the real one needs NLTK data)"""
+    import skill_knowledge
+    service = skill_knowledge.SkillKnowledgeService(learner=FakeSkillLearner(), reload_interval=0)
+    monkeypatch.setattr(skill_knowledge, '_service', service)
+    return service
+
+@pytest.fixture
+def matcher(tmp_path, skill_service, offline_nlp):
+    from job_matcher import JobMatcher
+    job_matcher = JobMatcher(index_dir=str(tmp_path / 'job_index'))
+    job_matcher.live_csv_path = str(tmp_path / 'live_jobs.csv')
+    return job_matcher
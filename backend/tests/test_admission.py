@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from admission import AdmissionClass, AdmissionRejected
+
+def test_check_rejects_only_when_queue_is_full():
+    admission_class = AdmissionClass('match', max_concurrent=1, max_queue=0, queue_timeout=1)
+    admission_class.check()
+
+    started = admission_class.acquire()
+    with pytest.raises(AdmissionRejected):
+        admission_class.check()
+
+    admission_class.release(started)
+    admission_class.check()
+
+@pytest.fixture
+def asgi_app(skill_service, tmp_path, monkeypatch):
+    pytest.importorskip('quart')
+    (tmp_path / 'backend').mkdir()
+    monkeypatch.chdir(tmp_path / 'backend')  # the app creates ../uploads on import
+    import asgi_app as module
+
+    async def run(func, *args):
+        return [] if func.__name__ == 'rank_jobs' else None
+    monkeypatch.setattr(module.pool, 'run', run)
+    return module
+
+def stream(asgi_app, consume):
+    """Call the stream view like the server does, optionally without ever iterating its body"""
+    async def call():
+        async with asgi_app.app.test_request_context('/api/match-jobs/stream', method='POST',
+                                                     json={'resume_data': {'skills': ['python']}}):
+            response = await asgi_app.match_jobs_stream()
+            chunks = []
+            if consume:
+                async with response.response as body:
+                    chunks = [chunk async for chunk in body]
+            return response, chunks
+    return asyncio.run(call())
+
+def test_stream_never_iterated_holds_no_slot(asgi_app):
+    match_admission = asgi_app.admission.classes['match']
+
+    response, _ = stream(asgi_app, consume=False)
+
+    assert response.status_code == 200
+    assert match_admission.in_flight == 0
+
+def test_stream_releases_slot_when_done(asgi_app):
+    match_admission = asgi_app.admission.classes['match']
+    admitted = match_admission.admitted
+
+    _, chunks = stream(asgi_app, consume=True)
+
+    assert b'event: done' in chunks[-1]
+    assert match_admission.admitted == admitted + 1
+    assert match_admission.in_flight == 0
+
+def test_stream_rejects_with_429_when_queue_is_full(asgi_app, monkeypatch):
+    match_admission = asgi_app.admission.classes['match']
+    monkeypatch.setattr(match_admission, 'in_flight', match_admission.max_concurrent)
+    monkeypatch.setattr(match_admission, 'queued', match_admission.max_queue)
+
+    async def call():
+        async with asgi_app.app.test_request_context('/api/match-jobs/stream', method='POST',
+                                                     json={'resume_data': {'skills': ['python']}}):
+            return await asgi_app.match_jobs_stream()
+
+    _, status, headers = asyncio.run(call())
+    assert status == 429
+    assert 'Retry-After' in headers
@@ -0,0 +1,34 @@
+"""Flask routes: how bad input and missing state map to HTTP statuses"""
+
+import pytest
+
+@pytest.fixture
+def client(skill_service, tmp_path, monkeypatch):
+    pytest.importorskip('flask')
+    (tmp_path / 'backend').mkdir()
+    monkeypatch.chdir(tmp_path / 'backend')  # the app creates ../uploads on import
+    import app as module
+    return module.app.test_client()
+
+@pytest.mark.parametrize('body', [
+    {'page_size': [5]},
+    {'page_size': {'size': 5}},
+    {'rerank_k': [10]},
+    {'latency_budget_ms': {'ms': 100}},
+    {'fields': 5},
+])
+def test_malformed_match_parameters_are_bad_requests(client, body):
+    response = client.post('/api/match-jobs', json=dict(body, resume_data={'skills': ['python']}))
+
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+@pytest.mark.parametrize('path', ['/api/match-jobs', '/api/match-jobs/stream'])
+def test_matching_a_stored_resume_before_the_index_loads_is_unavailable(client, path, monkeypatch):
+    import app as module
+    monkeypatch.setattr(module.job_matcher, 'index', None)
+
+    response = client.post(path, json={'resume_id': 1, 'session_id': 's1'})
+
+    assert response.status_code == 503
+    assert response.get_json() == {'error': 'Job index not ready'}
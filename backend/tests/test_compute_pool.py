@@ -0,0 +1,9 @@
+import asyncio
+
+import pytest
+
+def test_compute_pool_refuses_to_run_before_start():
+    from compute_pool import ComputePool, analyze_skill_gap
+
+    with pytest.raises(RuntimeError, match='before start'):
+        asyncio.run(ComputePool('unused').run(analyze_skill_gap, ['python'], 'Python and SQL'))
@@ -0,0 +1,153 @@
+"""Schema migrations from the original single-file app.py database"""
+
+import sqlite3
+
+import pytest
+
+@pytest.fixture
+def legacy_database(tmp_path, monkeypatch):
+    """A users.db written by the original app: wide resume_analyses, job text embedded in job_matches"""
+    import database as db
+    path = tmp_path / 'users.db'
+    monkeypatch.setenv('DATABASE_PATH', str(path))
+
+    conn = sqlite3.connect(path)
+    conn.executescript('''
+        CREATE TABLE users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE resume_analyses (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT,
+            filename TEXT,
+            extracted_text TEXT,
+            skills TEXT,
+            experience TEXT,
+            education TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE job_matches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT,
+            resume_id INTEGER,
+            job_title TEXT,
+            company TEXT,
+            match_score REAL,
+            job_description TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+    ''')
+    conn.execute("INSERT INTO users (session_id) VALUES ('s1')")
+    conn.execute('''
+        INSERT INTO resume_analyses (id, session_id, filename, extracted_text, skills, experience, education, created_at)
+        VALUES (7, 's1', 'cv.pdf', ?, '["python"]', '[]', '[]', '2024-01-01 10:00:00')
+    ''', ('Python developer ' * 200,))
+    conn.executemany('''
+        INSERT INTO job_matches (session_id, resume_id, job_title, company, match_score, job_description, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', [
+        ('s1', 7, 'Data Scientist', 'DataCo', 81.0, 'Models', '2024-01-01 10:01:00'),
+        ('s1', None, 'DevOps Engineer', 'CloudOps', 64.0, 'Clusters', '2024-01-01 10:02:00'),
+        ('s2', None, 'Frontend Engineer', 'WebWorks', 55.0, 'React', '2024-01-01 10:03:00'),
+    ])
+    conn.commit()
+    conn.close()
+    return db
+
+def test_job_matches_migrate_to_jobs_table(legacy_database):
+    legacy_database.init_database()
+
+    conn = legacy_database.get_connection()
+    try:
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(job_matches)')]
+        titles = sorted(row[0] for row in conn.execute('SELECT title FROM jobs'))
+        count = conn.execute('SELECT COUNT(*) FROM job_matches').fetchone()[0]
+    finally:
+        conn.close()
+
+    assert 'job_description' not in columns
+    assert titles == ['Data Scientist', 'DevOps Engineer', 'Frontend Engineer']
+    assert count == 3
+
+def test_legacy_matches_without_resume_stay_in_session_history(legacy_database):
+    legacy_database.init_database()
+
+    resumes, matches = legacy_database.get_session_history('s1')
+    assert [resume['id'] for resume in resumes] == [7]
+    assert [(match['job_title'], match['company']) for match in matches] == [
+        ('DevOps Engineer', 'CloudOps'), ('Data Scientist', 'DataCo')
+    ]
+
+    _, matches = legacy_database.get_session_history('s2')
+    assert [match['job_title'] for match in matches] == ['Frontend Engineer']
+
+def test_migrated_database_records_new_matches(legacy_database):
+    legacy_database.init_database()
+    legacy_database.init_database()
+
+    conn = legacy_database.get_connection()
+    try:
+        job_id = conn.execute("SELECT id FROM jobs WHERE title = 'Data Scientist'").fetchone()[0]
+    finally:
+        conn.close()
+    legacy_database.store_job_matches(7, [{'job_id': job_id, 'match_score': 90.0}])
+
+    _, matches = legacy_database.get_session_history('s1')
+    assert len(matches) == 3
+    assert sorted(match['match_score'] for match in matches) == [64.0, 81.0, 90.0]
+
+def test_session_id_column_added_to_already_normalized_table(database):
+    conn = database.get_connection()
+    try:
+        conn.executescript('''
+            DROP TABLE job_matches;
+            CREATE TABLE job_matches (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                resume_id INTEGER,
+                job_id INTEGER,
+                match_score REAL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+        ''')
+    finally:
+        conn.close()
+
+    database.init_database()
+
+    assert database.get_session_history('nobody') == ([], [])
+
+def test_resume_text_moves_to_compressed_blobs(legacy_database):
+    legacy_database.init_database()
+
+    conn = legacy_database.get_connection()
+    try:
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(resume_analyses)')]
+        stored = conn.execute('SELECT extracted_text FROM resume_blobs WHERE resume_id = 7').fetchone()[0]
+    finally:
+        conn.close()
+
+    assert 'extracted_text' not in columns
+    assert len(stored) < len('Python developer ' * 200)
+
+    details = legacy_database.get_resume_details(7)
+    assert details['text'] == 'Python developer ' * 200
+    assert details['skills'] == ['python']
+
+def test_migration_vacuums_freed_pages(legacy_database):
+    conn = legacy_database.get_connection()
+    conn.executemany(
+        "INSERT INTO resume_analyses (session_id, filename, extracted_text, skills) VALUES ('s1', ?, ?, '[]')",
+        [(f'cv{i}.pdf', f'Resume {i} ' * 2000) for i in range(50)]
+    )
+    conn.commit()
+    conn.close()
+
+    legacy_database.init_database()
+
+    conn = legacy_database.get_connection()
+    try:
+        assert conn.execute('PRAGMA freelist_count').fetchone()[0] == 0
+    finally:
+        conn.close()
@@ -0,0 +1,29 @@
+"""Pre-fork hooks in gunicorn.conf.py"""
+
+import logging
+import os
+import runpy
+import sys
+from types import SimpleNamespace
+
+GUNICORN_CONF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'gunicorn.conf.py')
+
+def test_failed_warm_up_still_freezes_heap(monkeypatch, caplog):
+    calls = []
+
+    def warm_up(resume_parser, job_matcher):
+        raise RuntimeError('model download failed')
+
+    monkeypatch.setitem(sys.modules, 'app', SimpleNamespace(
+        init_app=lambda: calls.append('init_app'), resume_parser=None, job_matcher=None))
+    monkeypatch.setitem(sys.modules, 'warmup', SimpleNamespace(
+        warm_up=warm_up, freeze_heap=lambda: calls.append('freeze_heap')))
+    monkeypatch.setenv('WARMUP', 'true')
+    config = runpy.run_path(GUNICORN_CONF)
+
+    server = SimpleNamespace(log=logging.getLogger('gunicorn.test'))
+    with caplog.at_level(logging.WARNING):
+        config['on_starting'](server)
+
+    assert calls == ['init_app', 'freeze_heap']
+    assert 'Warm-up failed: model download failed' in caplog.text
@@ -0,0 +1,104 @@
+import json
+
+import numpy as np
+import pytest
+
+pytest.importorskip('sklearn')
+
+from job_index import JobIndex
+
+@pytest.fixture
+def index(jobs, offline_nlp):
+    return JobIndex.build(jobs)
+
+def test_save_publishes_current_pointer(index, tmp_path):
+    index.save(str(tmp_path))
+
+    assert JobIndex.current_version(str(tmp_path)) == index.version
+    assert (tmp_path / 'snapshots' / index.version / 'meta.json').exists()
+    assert not [name for name in (tmp_path / 'snapshots').iterdir() if '.tmp-' in name.name]
+
+def test_load_maps_the_saved_snapshot(index, tmp_path):
+    index.save(str(tmp_path))
+    loaded = JobIndex.load(str(tmp_path), mmap=True)
+
+    assert loaded.version == index.version
+    assert len(loaded) == len(index)
+    # Views of the read-only mapped files, not private copies
+    assert not loaded.job_vectors.data.flags.writeable
+    assert not loaded.signatures.flags.writeable
+    assert (loaded.job_vectors != index.job_vectors).nnz == 0
+    np.testing.assert_array_equal(loaded.signatures, index.signatures)
+    assert list(loaded.job_data['title']) == list(index.job_data['title'])
+
+def test_job_table_rows_match_the_built_dataframe(index, tmp_path):
+    index.job_data['job_id'] = range(101, 101 + len(index))
+    index.save(str(tmp_path))
+    loaded = JobIndex.load(str(tmp_path))
+
+    assert list(loaded.job_data.columns) == list(index.job_data.columns)
+    for row in range(len(index)):
+        assert loaded.job_data.iloc[row].to_dict() == index.job_data.iloc[row].to_dict()
+    assert isinstance(loaded.job_data.iloc[0]['noun_phrases'], frozenset)
+    assert loaded.job_data.iloc[-1]['job_id'] == 100 + len(index)
+    assert list(loaded.job_data['job_id']) == list(index.job_data['job_id'])
+
+def test_job_table_is_mapped_not_unpickled(index, tmp_path):
+    index.save(str(tmp_path))
+    snapshot_dir = tmp_path / 'snapshots' / index.version
+    loaded = JobIndex.load(str(tmp_path))
+
+    assert not (snapshot_dir / 'jobs.pkl').exists()
+    assert isinstance(loaded.job_data._text, np.memmap)
+    assert not loaded.job_data._text.flags.writeable
+    # Terms cut by max_features grow with the corpus and are not pickled
+    assert loaded.vectorizer.stop_words_ is None
+
+def test_snapshot_with_pickled_jobs_still_loads(index, tmp_path):
+    index.save(str(tmp_path))
+    snapshot_dir = tmp_path / 'snapshots' / index.version
+    meta = json.loads((snapshot_dir / 'meta.json').read_text())
+    del meta['job_columns']
+    (snapshot_dir / 'meta.json').write_text(json.dumps(meta))
+    index.job_data.to_pickle(snapshot_dir / 'jobs.pkl')
+
+    loaded = JobIndex.load(str(tmp_path))
+
+    assert list(loaded.job_data['title']) == list(index.job_data['title'])
+
+def test_newer_snapshot_replaces_current_and_prunes_old(jobs, offline_nlp, tmp_path):
+    versions = []
+    for number in range(3):
+        index = JobIndex.build(jobs, None)
+        index.version = f"2026010{number}T000000000000"
+        index.save(str(tmp_path), keep=2)
+        versions.append(index.version)
+
+    assert JobIndex.load(str(tmp_path)).version == versions[-1]
+    assert sorted(path.name for path in (tmp_path / 'snapshots').iterdir()) == versions[1:]
+
+def test_load_without_snapshot_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        JobIndex.load(str(tmp_path))
+
+def test_wordless_texts_have_no_jaccard_similarity(jobs, offline_nlp):
+    import pandas as pd
+    blank = {column: '' for column in jobs.columns}
+    index = JobIndex.build(pd.concat([jobs, pd.DataFrame([blank, blank])], ignore_index=True))
+    empty_signature = index.hasher.signature('')
+
+    assert not index.jaccard_signature(empty_signature).any()
+    assert not index.jaccard_signature(empty_signature, [5, 6], num_perm=16).any()
+    # A real query never matches the wordless rows
+    scores = index.jaccard_signature(index.hasher.signature('Python Django developer'))
+    assert scores[0] > 0 and not scores[5:].any()
+
+def test_snapshot_without_minhash_is_sketched_on_load(index, tmp_path):
+    index.save(str(tmp_path))
+    (tmp_path / 'snapshots' / index.version / 'minhash.npy').unlink()
+
+    loaded = JobIndex.load(str(tmp_path))
+
+    assert not loaded.signatures_saved
+    assert loaded.hasher is not None
+    np.testing.assert_array_equal(loaded.signatures, index.signatures)
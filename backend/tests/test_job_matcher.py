@@ -0,0 +1,177 @@
+import os
+
+import pytest
+
+pytest.importorskip('sklearn')
+
+def test_load_job_data_builds_and_maps_index(matcher, database, jobs, tmp_path):
+    csv_path = tmp_path / 'jobs.csv'
+    jobs.to_csv(csv_path, index=False)
+
+    matcher.load_job_data(str(csv_path), use_live_data=False)
+
+    assert len(matcher.index) == len(jobs)
+    assert matcher.job_data['job_id'].notna().all()
+
+def test_load_job_data_failure_keeps_jobs_csv(matcher, jobs, tmp_path, monkeypatch):
+    # No init_database(): registering jobs fails with "no such table: jobs"
+    monkeypatch.setenv('DATABASE_PATH', str(tmp_path / 'empty.db'))
+    csv_path = tmp_path / 'jobs.csv'
+    jobs.to_csv(csv_path, index=False)
+    original = csv_path.read_text()
+
+    with pytest.raises(Exception, match='no such table'):
+        matcher.load_job_data(str(csv_path), use_live_data=False)
+
+    assert csv_path.read_text() == original
+
+def test_load_job_data_failure_keeps_serving_existing_index(matcher, database, jobs, tmp_path, monkeypatch):
+    csv_path = tmp_path / 'jobs.csv'
+    jobs.to_csv(csv_path, index=False)
+    matcher.load_job_data(str(csv_path), use_live_data=False)
+    version = matcher.index.version
+
+    monkeypatch.setattr(matcher, 'index_is_current', lambda path: False)
+    monkeypatch.setattr('job_matcher.sync_jobs', lambda records: 1 / 0)
+    matcher.load_job_data(str(csv_path), use_live_data=False)
+
+    assert matcher.index.version == version
+
+RESUME = {
+    'text': 'Senior Python developer building Django and Flask APIs on AWS with PostgreSQL and Docker.',
+    'skills': ['python', 'django', 'flask', 'aws', 'docker', 'sql'],
+    'experience': {'job_titles': ['Senior Python Developer'], 'timeline': [], 'total_years': 6},
+    'education': {}
+}
+
+@pytest.fixture
+def loaded_matcher(matcher, database, jobs, tmp_path):
+    csv_path = tmp_path / 'jobs.csv'
+    jobs.to_csv(csv_path, index=False)
+    matcher.load_job_data(str(csv_path), use_live_data=False)
+    return matcher
+
+def assert_non_increasing(ranking):
+    scores = [score for _, score in ranking]
+    assert scores == sorted(scores, reverse=True)
+
+@pytest.mark.parametrize('rerank_k', [0, 1, 2, 5])
+def test_rank_jobs_scores_are_non_increasing(loaded_matcher, rerank_k):
+    ranking = loaded_matcher.rank_jobs(loaded_matcher.index, RESUME, top_n=5, rerank_k=rerank_k, budget_ms=10000)
+
+    assert len(ranking) == 5
+    assert_non_increasing(ranking)
+    assert ranking[0][0] == 0  # the Python developer job
+
+def test_out_of_budget_tail_stays_below_reranked_head(loaded_matcher, monkeypatch):
+    # Re-rank exactly one candidate before the budget runs out
+    clock = iter([0.0, 0.0, 0.0] + [10.0] * 10)
+    monkeypatch.setattr('job_matcher.time.perf_counter', lambda: next(clock))
+
+    ranking = loaded_matcher.rank_jobs(loaded_matcher.index, RESUME, top_n=5, rerank_k=5, budget_ms=1)
+
+    assert len(ranking) == 5
+    assert_non_increasing(ranking)
+
+def test_paged_ranking_is_non_increasing(loaded_matcher):
+    _, ranking = loaded_matcher.rank_for_paging(RESUME, limit=5, rerank_k=2, budget_ms=10000)
+    assert_non_increasing(ranking)
+
+    matches, _ = loaded_matcher.build_page(loaded_matcher.index.version, ranking, 0, 5, RESUME)
+    percentages = [match['match_score'] for match in matches]
+    assert percentages == sorted(percentages, reverse=True)
+
+def test_rerank_puts_tail_on_the_reranked_scale(loaded_matcher, monkeypatch):
+    # Re-ranked scores lower than the raw cosine of the candidates behind them
+    monkeypatch.setattr(loaded_matcher.similarity, 'comprehensive_similarity',
+                        lambda *args, **kwargs: {'overall_similarity': 0.1})
+    index = loaded_matcher.index
+    profile = loaded_matcher.build_profile(index, RESUME)
+    candidates = [(0, 0.9), (1, 0.8), (2, 0.7), (3, 0.6)]
+
+    ranking = loaded_matcher.rerank_candidates(index, profile, candidates, rerank_k=2, budget_ms=10000)
+
+    assert [row for row, _ in ranking] == [0, 1, 2, 3]
+    assert_non_increasing(ranking)
+    assert all(score <= 0.1 for _, score in ranking[2:])
+
+def test_scale_below_maps_tail_under_ceiling():
+    from job_matcher import JobMatcher
+    assert JobMatcher.scale_below([(3, 0.5), (4, 0.25)], 0.4) == [(3, 0.4), (4, 0.2)]
+    assert JobMatcher.scale_below([(3, 0.0)], 0.4) == [(3, 0.0)]
+
+def test_stale_profile_is_reencoded_against_the_callers_index(loaded_matcher, jobs):
+    from database import save_resume_analysis
+    from job_index import JobIndex
+
+    resume_id = save_resume_analysis('session', 'resume.pdf', dict(RESUME, contact_info={}))
+    loaded_matcher.store_resume_profile(resume_id, RESUME)
+    ranked_with = JobIndex.build(jobs.iloc[:3])
+    # A reload swaps in a snapshot with yet another vocabulary
+    loaded_matcher.index = JobIndex.build(jobs.iloc[2:])
+
+    profile = loaded_matcher.resume_profile(resume_id, ranked_with)
+
+    assert profile['index_version'] == ranked_with.version
+    assert profile['vector'].shape[1] == ranked_with.job_vectors.shape[1]
+    assert loaded_matcher.rank_jobs(ranked_with, RESUME, top_n=3, profile=profile)
+
+def test_build_page_walks_a_stored_ranking(loaded_matcher):
+    version, ranking = loaded_matcher.rank_for_paging(RESUME, limit=5)
+
+    first, projected = loaded_matcher.build_page(version, ranking, 0, 2, RESUME, fields=('job_id', 'title'))
+    second, _ = loaded_matcher.build_page(version, ranking, 2, 2, RESUME)
+    last, _ = loaded_matcher.build_page(version, ranking, 4, 2, RESUME)
+
+    titles = [match['title'] for match in first + second + last]
+    assert titles == [loaded_matcher.index.job_data.iloc[row]['title'] for row, _ in ranking]
+    assert [set(match) for match in projected] == [{'job_id', 'title'}] * 2
+
+def test_build_page_maps_a_snapshot_published_by_another_worker(loaded_matcher, jobs, tmp_path):
+    from job_matcher import JobMatcher
+    other = JobMatcher(index_dir=loaded_matcher.index_dir)
+    other.live_csv_path = loaded_matcher.live_csv_path
+    csv_path = tmp_path / 'other_jobs.csv'
+    jobs.iloc[:4].to_csv(csv_path, index=False)
+    other.load_job_data(str(csv_path), use_live_data=False)
+    version, ranking = other.rank_for_paging(RESUME, limit=4)
+
+    matches, _ = loaded_matcher.build_page(version, ranking, 0, 4, RESUME)
+
+    assert loaded_matcher.index.version == version
+    assert len(matches) == 4
+
+def test_build_page_rejects_a_ranking_from_a_retired_snapshot(loaded_matcher):
+    from job_matcher import StaleRankingError
+    _, ranking = loaded_matcher.rank_for_paging(RESUME, limit=5)
+
+    with pytest.raises(StaleRankingError):
+        loaded_matcher.build_page('retired-version', ranking, 0, 5, RESUME)
+
+def test_resume_profile_without_an_index_is_not_a_missing_resume(matcher):
+    from job_matcher import IndexNotReadyError
+    assert matcher.index is None
+
+    with pytest.raises(IndexNotReadyError):
+        matcher.resume_profile(1)
+
+def test_reloaded_snapshot_without_minhash_still_ranks(loaded_matcher, jobs):
+    from job_index import JobIndex
+    old = JobIndex.build(jobs.iloc[:4])
+    old.save(loaded_matcher.index_dir)
+    os.remove(os.path.join(loaded_matcher.index_dir, 'snapshots', old.version, 'minhash.npy'))
+
+    assert loaded_matcher.reload_index_if_changed()
+
+    assert loaded_matcher.index.version == old.version
+    assert loaded_matcher.rank_jobs(loaded_matcher.index, RESUME, top_n=4, rerank_k=4, budget_ms=10000)
+
+def test_load_job_data_rebuilds_a_snapshot_without_minhash_once(loaded_matcher, tmp_path, monkeypatch):
+    version = loaded_matcher.index.version
+    os.remove(os.path.join(loaded_matcher.index_dir, 'snapshots', version, 'minhash.npy'))
+    monkeypatch.setattr(loaded_matcher, 'index_is_current', lambda path: True)
+
+    loaded_matcher.load_job_data(str(tmp_path / 'jobs.csv'), use_live_data=False)
+
+    assert loaded_matcher.index.version != version
+    assert loaded_matcher.index.signatures_saved
@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+
+import pytest
+
+pytest.importorskip('requests')
+
+import load_test
+
+def test_parse_mix_reads_weights_and_drops_zero():
+    assert load_test.parse_mix('upload=1,match=4,history=0,skill-gap') == {
+        'upload': 1.0, 'match': 4.0, 'skill-gap': 1.0
+    }
+    with pytest.raises(ValueError):
+        load_test.parse_mix('search=1')
+
+def test_summarize_reports_percentiles_and_errors():
+    results = [(0.01 * number, 200) for number in range(1, 101)] + [(0.5, 503), (0.1, 0)]
+    summary = load_test.summarize(results, elapsed=2.0)
+
+    assert summary['requests'] == 102
+    assert summary['errors'] == 2
+    assert summary['status_codes'] == {'200': 100, '503': 1, '0': 1}
+    assert (summary['p50_ms'], summary['p99_ms']) == (500.0, 990.0)
+    assert summary['throughput_rps'] == 50.0
+
+def test_schedule_is_seeded():
+    tester = load_test.LoadTester('http://localhost:1', mix={'match': 3, 'history': 1}, seed=7)
+    assert tester.schedule(50, 11) == tester.schedule(50, 11)
+    assert set(tester.schedule(200, 11)) == {'match', 'history'}
+
+PORT = 58731
+
+SERVER = '''
+import http.server, os, subprocess, sys
+child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(600)'])
+open(sys.argv[2], 'w').write(str(child.pid))
+class Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200); self.end_headers(); self.wfile.write(b'{}')
+    def log_message(self, *args):
+        pass
+http.server.HTTPServer(('127.0.0.1', int(sys.argv[1])), Handler).serve_forever()
+'''
+
+def alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # Reaped zombies are gone; unreaped ones are dead but still listed
+    with open(f'/proc/{pid}/stat') as f:
+        return f.read().split(')')[-1].split()[0] != 'Z'
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='reads /proc')
+def test_local_server_stops_the_whole_process_group(tmp_path):
+    script, pid_file = tmp_path / 'server.py', tmp_path / 'child.pid'
+    script.write_text(SERVER)
+    command = [sys.executable, str(script), str(PORT), str(pid_file)]
+
+    with load_test.LocalServer(command, f'http://127.0.0.1:{PORT}', startup_timeout=30) as server:
+        parent = server.process.pid
+        child = int(pid_file.read_text())
+        assert alive(child)
+
+    deadline = time.monotonic() + 10
+    while alive(child) and time.monotonic() < deadline:
+        time.sleep(0.1)
+    assert not alive(child)
+    assert not alive(parent)
@@ -0,0 +1,68 @@
+"""Cursors and stored rankings behind paginated match responses"""
+
+import pytest
+
+match_pages = pytest.importorskip('match_pages')
+
+def test_cursor_round_trip():
+    cursor = match_pages.encode_cursor('abc123', 20)
+    assert match_pages.decode_cursor(cursor) == ('abc123', 20)
+
+@pytest.mark.parametrize('cursor', ['', 'abc123', 'abc123:', ':20', 'abc123:-1', 'abc123:x'])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        match_pages.decode_cursor(cursor)
+
+def test_next_cursor_stops_after_the_last_page():
+    assert match_pages.next_cursor('r', 0, 10, 25) == 'r:10'
+    assert match_pages.next_cursor('r', 10, 10, 25) == 'r:20'
+    assert match_pages.next_cursor('r', 20, 10, 25) is None
+    assert match_pages.next_cursor('r', 0, 10, 10) is None
+
+def test_page_size_is_clamped():
+    assert match_pages.parse_page_size(None) == match_pages.DEFAULT_PAGE_SIZE
+    assert match_pages.parse_page_size('0') == 1
+    assert match_pages.parse_page_size(1000) == match_pages.MAX_PAGE_SIZE
+
+def test_stored_ranking_round_trip(database):
+    ranking = [[3, 0.9], [0, 0.5]]
+    database.save_match_ranking('r1', 'v1', ['python'], ranking)
+
+    assert database.load_match_ranking('r1') == {
+        'index_version': 'v1', 'resume_skills': ['python'], 'ranking': ranking
+    }
+    assert database.load_match_ranking('unknown') is None
+
+def test_stored_ranking_expires_after_ttl(database, monkeypatch):
+    monkeypatch.setattr(database.time, 'time', lambda: 1000.0)
+    database.save_match_ranking('old', 'v1', [], [[0, 0.5]], ttl=60)
+
+    monkeypatch.setattr(database.time, 'time', lambda: 1061.0)
+    assert database.load_match_ranking('old', ttl=60) is None
+
+    # Saving another ranking drops the expired one
+    database.save_match_ranking('new', 'v1', [], [[1, 0.4]], ttl=60)
+    conn = database.get_connection()
+    try:
+        ids = [row[0] for row in conn.execute('SELECT id FROM match_rankings')]
+    finally:
+        conn.close()
+    assert ids == ['new']
+
+@pytest.mark.parametrize('value', [[5], {'size': 5}, 'ten'])
+def test_malformed_page_size_is_a_client_error(value):
+    with pytest.raises(ValueError, match='page_size'):
+        match_pages.parse_page_size(value)
+
+@pytest.mark.parametrize('params, name', [
+    ({'rerank_k': [5]}, 'rerank_k'),
+    ({'latency_budget_ms': {'ms': 100}}, 'latency_budget_ms'),
+])
+def test_malformed_rerank_parameters_are_client_errors(params, name):
+    with pytest.raises(ValueError, match=name):
+        match_pages.parse_rerank(params)
+
+@pytest.mark.parametrize('value', [5, ['title', 3], {'title': True}])
+def test_malformed_fields_are_client_errors(value):
+    with pytest.raises(ValueError):
+        match_pages.parse_fields(value)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from utils.minhash import MAX_HASH, MinHasher, canonical_indices, near_duplicate_clusters, normalize_company
+
+POSTING = ("Senior Python Developer building scalable APIs with Django and AWS for our platform team. "
+           "You will own services end to end, mentor engineers and improve reliability.")
+REPOST = POSTING.replace("Senior", "Sr.") + " Apply today!"
+OTHER = ("Frontend Engineer creating React and TypeScript interfaces for a design system used by "
+         "millions of customers across web and mobile.")
+
+def test_signatures_are_deterministic_across_hashers():
+    np.testing.assert_array_equal(MinHasher().signature(POSTING), MinHasher().signature(POSTING))
+
+def test_jaccard_estimate_separates_reposts_from_other_jobs():
+    hasher = MinHasher()
+    assert MinHasher.jaccard(hasher.signature(POSTING), hasher.signature(REPOST)) >= 0.7
+    assert MinHasher.jaccard(hasher.signature(POSTING), hasher.signature(OTHER)) < 0.1
+
+def test_canonical_indices_keeps_longest_of_each_cluster():
+    assert canonical_indices([POSTING, OTHER, REPOST], threshold=0.7) == [1, 2]
+
+def test_empty_texts_are_never_merged():
+    hasher = MinHasher()
+    signatures = hasher.signatures(['', '   ', POSTING, '...'])
+    assert np.all(signatures[0] == MAX_HASH)
+
+    assert near_duplicate_clusters(signatures, 0.8) == [0, 1, 2, 3]
+    assert canonical_indices(['', POSTING, ''], 0.8) == [0, 1, 2]
+    assert MinHasher.jaccard(signatures[0], signatures[1]) == 0.0
+
+def test_same_posting_from_different_companies_is_kept():
+    texts = [POSTING, POSTING, POSTING]
+    companies = ['techcorp', 'datacorp', 'techcorp']
+
+    assert canonical_indices(texts, 0.8, groups=companies) == [1, 2]
+    assert canonical_indices(texts, 0.8) == [2]
+
+def test_clusters_are_labelled_by_lowest_row():
+    hasher = MinHasher()
+    labels = near_duplicate_clusters(hasher.signatures([OTHER, POSTING, POSTING, OTHER]), 0.8)
+    assert labels == [0, 1, 1, 0]
+
+@pytest.mark.parametrize('num_perm, bands', [(128, 16), (64, 8)])
+def test_lsh_finds_exact_duplicates_at_any_banding(num_perm, bands):
+    signatures = MinHasher(num_perm=num_perm).signatures([POSTING, OTHER, POSTING])
+    assert near_duplicate_clusters(signatures, 0.9, bands=bands) == [0, 1, 0]
+
+@pytest.mark.parametrize('company, normalized', [
+    ('Acme', 'acme'),
+    ('Acme, Inc.', 'acme'),
+    ('  ACME   Corp ', 'acme'),
+    ('Acme Holdings LLC', 'acme holdings'),
+    ('Co', 'co'),
+    ('', ''),
+])
+def test_normalize_company(company, normalized):
+    assert normalize_company(company) == normalized
+
+def test_same_posting_under_spellings_of_one_company_is_merged():
+    live_job_fetcher = pytest.importorskip('live_job_fetcher')
+    jobs = [
+        {'title': 'Senior Python Developer', 'company': 'Acme', 'description': POSTING, 'source': 'RemoteOK'},
+        {'title': 'Senior Python Developer', 'company': 'Acme, Inc.', 'description': POSTING, 'source': 'Indeed'},
+        {'title': 'Senior Python Developer', 'company': 'Globex', 'description': POSTING, 'source': 'Indeed'},
+    ]
+
+    kept = live_job_fetcher.LiveJobFetcher().remove_near_duplicates(jobs)
+
+    assert [job['company'] for job in kept] == ['Acme, Inc.', 'Globex']
@@ -0,0 +1,125 @@
+import os
+import re
+
+import pytest
+
+from analyzed_document import AnalyzedDocument
+
+SAMPLE_RESUME = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                             'sample_resume.txt')
+
+@pytest.fixture
+def parser(skill_service, offline_sentences):
+    from resume_parser import ResumeParser
+    resume_parser = ResumeParser()
+    resume_parser.nlp = None  # spaCy noun chunks are not under test
+    return resume_parser
+
+def scan_skills(parser, text):
+    """The per-skill substring scan extract_skills replaced"""
+    text_lower = text.lower()
+    return {
+        skill for skill in parser.all_skills
+        if skill.lower() in text_lower and re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower)
+    }
+
+@pytest.mark.parametrize('text', [
+    'Built APIs in Node.js and C# on ASP.NET; migrated SQL Server to PostgreSQL.',
+    'JavaScript (not Java), C++ templates, scikit-learn, Google Cloud and AWS Certified.',
+    'Go, R and Rust; Travis CI, GitHub Actions, problem solving and time management.',
+])
+def test_extract_skills_matches_per_skill_scan(parser, text):
+    assert set(parser.extract_skills(AnalyzedDocument(text))) == scan_skills(parser, text)
+
+def test_extract_skills_on_sample_resume(parser):
+    with open(SAMPLE_RESUME, encoding='utf-8') as f:
+        text = parser.clean_text(f.read())
+
+    skills = set(parser.extract_skills(AnalyzedDocument(text)))
+
+    assert skills == scan_skills(parser, text)
+    assert {'python', 'react', 'docker'} <= skills
+
+def test_skill_tables_follow_vocabulary_version(parser, skill_service):
+    document = AnalyzedDocument('Experienced with Elixir and Phoenix.')
+    assert 'elixir' not in parser.extract_skills(document)
+
+    skill_service.learner.skills['languages'] = {'elixir'}
+    with skill_service._lock:
+        skill_service._publish()
+
+    assert 'elixir' in parser.extract_skills(document)
+
+def write_docx(path, paragraphs):
+    docx = pytest.importorskip('docx')
+    document = docx.Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    document.save(path)
+
+def test_contact_details_below_first_header_are_found(parser, tmp_path):
+    path = str(tmp_path / 'resume.docx')
+    write_docx(path, [
+        'JANE DOE',
+        'Senior Software Engineer',
+        'PROFESSIONAL SUMMARY',
+        'Python developer with 6 years of experience. Email: jane.doe@example.com',
+        'TECHNICAL SKILLS',
+        'Python, Django, PostgreSQL, Docker, AWS',
+        'EXPERIENCE',
+        'Senior Software Engineer | TechCorp | 2019 - Present',
+        'EDUCATION',
+        'Bachelor of Science in Computer Science',
+        'Phone: (555) 123-4567 | linkedin.com/in/jane-doe'
+    ])
+
+    result = parser.parse_resume(path)
+
+    assert result['success'], result.get('error')
+    assert result['contact_info']['emails'] == ['jane.doe@example.com']
+    assert result['contact_info']['phones'] == ['(555) 123-4567']
+    assert result['contact_info']['linkedin'] == ['linkedin.com/in/jane-doe']
+    assert 'python' in result['skills']
+
+def test_section_routing_still_scopes_other_extractors(parser):
+    sections = {'contact': 'JANE DOE', 'skills': 'Python, Docker', 'experience': 'Built React apps'}
+    document = AnalyzedDocument('JANE DOE jane@example.com Python, Docker Built React apps Java')
+
+    results = parser.analyze_document(document, sections)
+
+    assert results['contact_info']['emails'] == ['jane@example.com']
+    assert 'java' not in results['skills']
+    assert {'python', 'docker', 'react'} <= set(results['skills'])
+
+def test_content_lines_mentioning_section_words_are_not_headers(parser, tmp_path):
+    path = str(tmp_path / 'resume.docx')
+    write_docx(path, [
+        'JANE DOE',
+        'Skills:',
+        'React, Kubernetes',
+        'Work Experience',
+        'Senior Developer at TechCorp',
+        'Led three projects for banking clients',
+        'Built Go services backed by Redis',
+        'Received honors for Terraform rollout',
+        'Migrated education portal to AWS',
+    ])
+
+    result = parser.parse_resume(path)
+
+    assert result['success'], result.get('error')
+    assert {'go', 'kubernetes', 'react', 'redis', 'terraform', 'aws'} <= set(result['skills'])
+    assert 'Senior Developer' in result['experience']['job_titles']
+
+@pytest.mark.parametrize('line, section', [
+    ('PROFESSIONAL EXPERIENCE', 'experience'),
+    ('Work Experience:', 'experience'),
+    ('— Technical Skills —', 'skills'),
+    ('Licenses & Certifications', 'certifications'),
+    ('Gained experience with SQL', None),
+    ('Led three projects for banking clients', None),
+    ('Received honors for Terraform rollout', None),
+])
+def test_section_header_must_be_the_whole_line(line, section):
+    from utils.pdf_parser import PDFParser
+    assert PDFParser().match_section_header(line) == section
@@ -0,0 +1,114 @@
+"""Single-flight leases and persisted schedules shared by every worker on one database"""
+
+import threading
+import time
+
+import pytest
+
+from scheduler import RefreshScheduler
+
+def make_scheduler(owner):
+    scheduler = RefreshScheduler(poll_interval=0.05)
+    # Workers on one host differ only by pid; tests run in one process
+    scheduler.owner = owner
+    return scheduler
+
+def task_row(database, name):
+    conn = database.get_connection()
+    try:
+        return conn.execute(
+            'SELECT next_run, last_run, lease_owner, lease_expires FROM scheduler_tasks WHERE name = ?', (name,)
+        ).fetchone()
+    finally:
+        conn.close()
+
+def test_a_due_task_runs_in_only_one_worker(database):
+    started, release = threading.Event(), threading.Event()
+    runs = []
+
+    def slow_refresh():
+        runs.append('first')
+        started.set()
+        release.wait(5)
+
+    due = time.time() - 3600
+    first, second = make_scheduler('host:1'), make_scheduler('host:2')
+    first.add_task('refresh', slow_refresh, interval=3600, last_run=due - 3600)
+    second.add_task('refresh', lambda: runs.append('second'), interval=3600, last_run=due - 3600)
+
+    worker = threading.Thread(target=first.run_pending)
+    worker.start()
+    assert started.wait(5)
+    second.run_pending()
+    assert not second.run_now('refresh')
+    release.set()
+    worker.join(5)
+
+    assert runs == ['first']
+    # Finished: the lease is released and the next run is an interval away
+    next_run, last_run, lease_owner, _ = task_row(database, 'refresh')
+    assert lease_owner is None
+    assert next_run > time.time() + 3000
+
+    second.run_pending()
+    assert runs == ['first']
+
+def test_lease_of_a_killed_worker_expires(database):
+    runs = []
+    scheduler = make_scheduler('host:2')
+    scheduler.add_task('refresh', lambda: runs.append('run'), interval=6 * 3600,
+                       last_run=time.time() - 7 * 3600)
+
+    # A worker died holding an unexpired lease: the task waits for it
+    conn = database.get_connection()
+    conn.execute("UPDATE scheduler_tasks SET lease_owner = 'host:1', lease_expires = ?", (time.time() + 60,))
+    conn.commit()
+    scheduler.run_pending()
+    assert runs == []
+
+    # Once the short lease runs out, the next poll picks the task up
+    conn.execute('UPDATE scheduler_tasks SET lease_expires = ?', (time.time() - 1,))
+    conn.commit()
+    conn.close()
+    scheduler.run_pending()
+    assert runs == ['run']
+
+def test_default_lease_is_short_for_long_intervals(database):
+    import scheduler as scheduler_module
+    task = make_scheduler('host:1').add_task('skill_learning', lambda: None, interval=24 * 3600)
+    assert task.lease_timeout == scheduler_module.LEASE_TIMEOUT < task.interval
+
+def test_running_task_renews_its_lease(database):
+    def slow_refresh():
+        time.sleep(0.8)
+
+    first, second = make_scheduler('host:1'), make_scheduler('host:2')
+    first.add_task('refresh', slow_refresh, interval=3600, lease_timeout=0.3, last_run=time.time() - 7200)
+    second.add_task('refresh', lambda: pytest.fail('ran twice'), interval=3600, lease_timeout=0.3)
+
+    worker = threading.Thread(target=first.run_pending)
+    worker.start()
+    time.sleep(0.5)
+    # Past the original lease timeout, the heartbeat has kept the lease alive
+    _, _, lease_owner, lease_expires = task_row(database, 'refresh')
+    assert lease_owner == 'host:1'
+    assert lease_expires > time.time()
+    second.run_pending()
+    worker.join(5)
+
+def test_next_run_survives_a_restart(database):
+    runs = []
+    scheduler = make_scheduler('host:1')
+    scheduler.add_task('refresh', lambda: runs.append('run'), interval=3600, last_run=time.time() - 7200)
+    scheduler.run_pending()
+    next_run = task_row(database, 'refresh')[0]
+
+    # A restarted worker registers the task again but keeps the stored schedule
+    restarted = make_scheduler('host:2')
+    restarted.add_task('refresh', lambda: runs.append('again'), interval=3600, last_run=time.time() - 7200)
+    restarted.run_pending()
+
+    assert runs == ['run']
+    assert task_row(database, 'refresh')[0] == next_run
+    stats = restarted.get_stats()['refresh']
+    assert stats['last_status'] is not None and stats['running_on'] is None
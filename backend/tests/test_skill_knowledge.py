@@ -0,0 +1,38 @@
+from skill_knowledge import SkillKnowledgeService
+
+def learn(service, category, skill):
+    service.learner.add_learned_skills(category, [skill])
+    service.learner._frequency_delta[skill] += 1
+
+def test_snapshots_are_immutable_and_versioned(skill_service):
+    before = skill_service.snapshot()
+    skill_service.learner.skills['languages'] = {'elixir'}
+    with skill_service._lock:
+        skill_service._publish()
+
+    assert 'elixir' not in before
+    assert 'elixir' in skill_service.snapshot()
+    assert skill_service.version == before.version + 1
+
+def test_own_save_does_not_trigger_reload(skill_learner_factory):
+    service = SkillKnowledgeService(skill_learner_factory(), reload_interval=0)
+    learn(service, 'languages', 'elixir')
+    service.save()
+
+    assert service.reload_if_changed(force=True) is False
+
+def test_save_keeps_other_processes_writes_visible(skill_learner_factory):
+    first = SkillKnowledgeService(skill_learner_factory(), reload_interval=0)
+    second = SkillKnowledgeService(skill_learner_factory(), reload_interval=0)
+
+    learn(second, 'languages', 'zig')
+    second.save()
+    # first saves its own skill before it has reloaded second's
+    learn(first, 'languages', 'elixir')
+    first.save()
+
+    assert first.reload_if_changed(force=True) is True
+    assert 'zig' in first.snapshot()
+    assert 'elixir' in first.snapshot()
+    assert second.reload_if_changed(force=True) is True
+    assert 'elixir' in second.snapshot()
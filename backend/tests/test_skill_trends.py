@@ -0,0 +1,64 @@
+import pytest
+
+from skill_trends import DecayedHeavyHitters, SkillTrendTracker
+
+NOW = 1_800_000_000
+
+def test_merge_matches_observing_everything_in_one_tracker():
+    combined, first, second = SkillTrendTracker(), SkillTrendTracker(), SkillTrendTracker()
+    first.sketches = {name: DecayedHeavyHitters(500, sketch.half_life, NOW - 3600)
+                      for name, sketch in first.sketches.items()}
+
+    for tracker, counts, timestamp in ((first, {'python': 3, 'rust': 1}, NOW - 1800),
+                                       (second, {'python': 2, 'go': 4}, NOW)):
+        tracker.observe(counts, timestamp)
+        combined.observe(counts, timestamp)
+    first.merge(second)
+
+    for window in ('week', 'month'):
+        assert first.top(window, now=NOW) == combined.top(window, now=NOW)
+
+def test_merge_prunes_to_capacity():
+    sketch, other = DecayedHeavyHitters(capacity=2, landmark=NOW), DecayedHeavyHitters(capacity=2, landmark=NOW)
+    for number in range(4):
+        sketch.add(f"a{number}", number + 1, NOW)
+        other.add(f"b{number}", number + 1, NOW)
+
+    sketch.merge(other)
+
+    assert len(sketch.counts) <= 4
+    assert {item for item, _ in sketch.top(2, NOW)} == {'a3', 'b3'}
+
+def test_concurrent_saves_keep_each_others_trends(skill_learner_factory):
+    first, second = skill_learner_factory(), skill_learner_factory()
+
+    first.observe_trends({'python': 5})
+    first._frequency_delta.update({'python': 5})
+    second.observe_trends({'rust': 3})
+    second._frequency_delta.update({'rust': 3})
+    first.save_learned_skills()
+    second.save_learned_skills()
+
+    stored = dict(skill_learner_factory().get_trending_skills(window='week'))
+    assert stored['python'] == pytest.approx(5, rel=0.01)
+    assert stored['rust'] == pytest.approx(3, rel=0.01)
+
+    # Saving again without new mentions must not count them twice
+    first.observe_trends({'go': 1})
+    first._frequency_delta.update({'go': 1})
+    first.save_learned_skills()
+    stored = dict(skill_learner_factory().get_trending_skills(window='week'))
+    assert stored['python'] == pytest.approx(5, rel=0.01)
+    assert stored['go'] == pytest.approx(1, rel=0.01)
+
+def test_reload_picks_up_trends_saved_elsewhere(skill_learner_factory):
+    reader, writer = skill_learner_factory(), skill_learner_factory()
+    reader.observe_trends({'python': 1})
+
+    writer.observe_trends({'kotlin': 2})
+    writer._frequency_delta.update({'kotlin': 2})
+    writer.save_learned_skills()
+    reader.reload_learned_skills()
+
+    trending = dict(reader.get_trending_skills(window='week'))
+    assert set(trending) == {'python', 'kotlin'}
@@ -0,0 +1,101 @@
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import IO, Iterator, List
+
+# WordprocessingML and markup-compatibility namespaces
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC_NS = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+PARAGRAPH = W_NS + 'p'
+TEXT = W_NS + 't'
+TAB = W_NS + 'tab'
+BREAKS = (W_NS + 'br', W_NS + 'cr')
+BODY = W_NS + 'body'
+# Text boxes are stored twice (DrawingML choice + VML fallback); only read the choice
+FALLBACK = MC_NS + 'Fallback'
+
+HEADER_PART = re.compile(r'^word/header\d*\.xml$')
+FOOTER_PART = re.compile(r'^word/footer\d*\.xml$')
+
+class DOCXParser:
+    """Streaming DOCX text extraction that reads the package XML in a single pass"""
+
+    def __init__(self):
+        self.supported_formats = ['.docx']
+
+    def extract_text(self, file_path: str) -> str:
+        """Extract raw text from DOCX file"""
+        try:
+            return '\n'.join(self.iter_paragraphs(file_path)).strip()
+        except Exception as e:
+            raise Exception(f"Error extracting text from DOCX: {str(e)}")
+
+    def iter_paragraphs(self, file_path: str) -> Iterator[str]:
+        """Lazily yield non-empty paragraphs from headers, body (incl. tables and text boxes) and footers"""
+        with zipfile.ZipFile(file_path) as archive:
+            for part in self.content_parts(archive):
+                with archive.open(part) as stream:
+                    yield from self._iter_part_paragraphs(stream)
+
+    def content_parts(self, archive: zipfile.ZipFile) -> List[str]:
+        """Return the XML parts that hold document text, in reading order"""
+        names = archive.namelist()
+        headers = sorted(name for name in names if HEADER_PART.match(name))
+        footers = sorted(name for name in names if FOOTER_PART.match(name))
+        body = ['word/document.xml'] if 'word/document.xml' in names else []
+        return headers + body + footers
+
+    def _iter_part_paragraphs(self, stream: IO[bytes]) -> Iterator[str]:
+        """Incrementally parse one XML part, discarding elements once they are consumed"""
+        paragraph_stack = []  # text boxes nest paragraphs inside paragraphs
+        depth = 0
+        body, body_depth = None, None
+        fallback_depth = None
+
+        for event, elem in ET.iterparse(stream, events=('start', 'end')):
+            tag = elem.tag
+
+            if event == 'start':
+                depth += 1
+                if tag == PARAGRAPH and fallback_depth is None:
+                    paragraph_stack.append([])
+                elif tag == FALLBACK and fallback_depth is None:
+                    fallback_depth = depth
+                elif tag == BODY:
+                    body, body_depth = elem, depth
+                continue
+
+            if fallback_depth is not None:
+                if tag == FALLBACK and depth == fallback_depth:
+                    fallback_depth = None
+            elif tag == TEXT and paragraph_stack:
+                paragraph_stack[-1].append(elem.text or '')
+            elif tag == TAB and paragraph_stack:
+                paragraph_stack[-1].append('\t')
+            elif tag in BREAKS and paragraph_stack:
+                paragraph_stack[-1].append('\n')
+            elif tag == PARAGRAPH and paragraph_stack:
+                text = ''.join(paragraph_stack.pop()).strip()
+                if text:
+                    yield text
+
+            depth -= 1
+
+            # Drop finished top-level body elements so memory stays bounded
+            if body is not None and depth == body_depth:
+                body.clear()
+
+    def is_valid_docx(self, file_path: str) -> bool:
+        """Check if the file is a valid DOCX package"""
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                return 'word/document.xml' in archive.namelist()
+        except Exception:
+            return False
+
+# Test function
+if __name__ == "__main__":
+    parser = DOCXParser()
+    print("DOCX Parser utility initialized successfully!")
+    print(f"Supported formats: {parser.supported_formats}")
@@ -0,0 +1,78 @@
+import re
+from typing import Dict, FrozenSet, Iterable
+from textblob import TextBlob
+
+# Columns added to the job index at build time; scoring reads these instead of re-parsing job text
+FEATURE_COLUMNS = ('required_years', 'noun_phrases', 'title_tokens', 'seniority')
+
+YEARS_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?experience'),
+    re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:relevant\s*)?experience'),
+    re.compile(r'minimum\s*(?:of\s*)?(\d+)\s*years?'),
+    re.compile(r'at\s*least\s*(\d+)\s*years?')
+]
+
+# Checked in order, so the more specific levels win ("senior manager" is a manager)
+SENIORITY_LEVELS = [
+    (5, re.compile(r'\b(?:director|head of|vp|vice president|chief|cto|cio)\b')),
+    (4, re.compile(r'\b(?:principal|staff|lead|architect|manager)\b')),
+    (3, re.compile(r'\b(?:senior|sr\.?)\b')),
+    (1, re.compile(r'\b(?:junior|jr\.?|entry[- ]level|graduate|associate)\b')),
+    (0, re.compile(r'\b(?:intern|internship|trainee)\b')),
+    (2, re.compile(r'\b(?:mid[- ]level|mid|intermediate)\b'))
+]
+UNKNOWN_SENIORITY = -1
+
+WORD_PATTERN = re.compile(r'\w+')
+
+def required_years(text: str) -> int:
+    """Years of experience a job text asks for, or 0 when it does not say"""
+    text = text.lower()
+    for pattern in YEARS_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return int(match.group(1))
+    return 0
+
+def noun_phrase_set(text: str) -> FrozenSet[str]:
+    """Lowercased TextBlob noun phrases of a text"""
+    return frozenset(phrase.lower() for phrase in TextBlob(text).noun_phrases)
+
+def title_tokens(title: str) -> FrozenSet[str]:
+    return frozenset(WORD_PATTERN.findall(title.lower()))
+
+def seniority(*texts: str) -> int:
+    """Seniority level 0 (intern) to 5 (director) from titles or experience levels; -1 if unknown"""
+    for text in texts:
+        text = str(text or '').lower()
+        for level, pattern in SENIORITY_LEVELS:
+            if pattern.search(text):
+                return level
+    return UNKNOWN_SENIORITY
+
+def job_text(job: Dict) -> str:
+    """Title, description and requirements joined the way SimilarityCalculator.prepare_job_text does"""
+    return ' '.join(str(job[field]) for field in ('title', 'description', 'requirements') if field in job)
+
+def extract_job_features(job: Dict) -> Dict:
+    """Compute every feature column for one job record"""
+    text = job_text(job)
+    return {
+        'required_years': required_years(text),
+        'noun_phrases': noun_phrase_set(text),
+        'title_tokens': title_tokens(str(job.get('title', ''))),
+        'seniority': seniority(job.get('title', ''), job.get('experience_level', ''))
+    }
+
+def add_job_features(job_data):
+    """Return a copy of the job DataFrame with the FEATURE_COLUMNS filled in"""
+    job_data = job_data.copy()
+    features = [extract_job_features(job) for job in job_data.to_dict('records')]
+    for column in FEATURE_COLUMNS:
+        job_data[column] = [feature[column] for feature in features]
+    return job_data
+
+def has_job_features(job: Iterable) -> bool:
+    """True for job records (dicts, Series or DataFrames) that already carry the feature columns"""
+    columns = job.columns if hasattr(job, 'columns') else job
+    return all(column in columns for column in FEATURE_COLUMNS)
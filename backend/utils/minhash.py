@@ -0,0 +1,179 @@
+import re
+import zlib
+import numpy as np
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence
+
+# Universal hashing h(x) = (a * x + b) mod p with a Mersenne prime; a < 2^31 and
+# x < 2^32 keep every product inside uint64
+MERSENNE_PRIME = (1 << 31) - 1
+MAX_HASH = np.uint32(MERSENNE_PRIME)
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# Legal-form suffixes ignored when comparing employers, so "Acme, Inc." and "Acme" are one company
+COMPANY_SUFFIXES = frozenset({
+    'inc', 'incorporated', 'llc', 'llp', 'lp', 'ltd', 'limited', 'corp', 'corporation',
+    'co', 'company', 'plc', 'gmbh', 'ag', 'sa', 'bv', 'pty'
+})
+
+class MinHasher:
+    """MinHash signatures over word shingles, estimating Jaccard similarity of texts"""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 42):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # Fixed seed so signatures stay comparable across processes and index builds
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self.b = rng.randint(0, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+
+    def shingles(self, text: str) -> np.ndarray:
+        """Hash every run of shingle_size consecutive words to a 32-bit integer"""
+        words = WORD_PATTERN.findall(text.lower())
+        if not words:
+            return np.empty(0, dtype=np.uint64)
+
+        size = min(self.shingle_size, len(words))
+        hashes = {
+            zlib.crc32(' '.join(words[i:i + size]).encode('utf-8'))
+            for i in range(len(words) - size + 1)
+        }
+        return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+    def signature(self, text: str) -> np.ndarray:
+        """Return the num_perm minimum hash values of the text's shingles"""
+        shingles = self.shingles(text)
+        if shingles.size == 0:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint32)
+
+        hashed = (np.outer(shingles, self.a) + self.b) % MERSENNE_PRIME
+        return hashed.min(axis=0).astype(np.uint32)
+
+    def signatures(self, texts: Iterable[str]) -> np.ndarray:
+        """Stack signatures of many texts into an (n, num_perm) uint32 array"""
+        rows = [self.signature(text) for text in texts]
+        if not rows:
+            return np.empty((0, self.num_perm), dtype=np.uint32)
+        return np.vstack(rows)
+
+    @staticmethod
+    def jaccard(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+        """Estimated Jaccard similarity: the fraction of matching minimum hashes; 0 if either text had no words"""
+        if empty_signatures(signature_a).any() or empty_signatures(signature_b).any():
+            return 0.0
+        return float(np.mean(signature_a == signature_b))
+
+def empty_signatures(signatures: np.ndarray) -> np.ndarray:
+    """
+    True for each signature of a text without words.
+
+    Shingle hashes are reduced modulo MERSENNE_PRIME, so only an empty text
+    ever yields MAX_HASH and checking the first value is enough.
+    """
+    return np.asarray(signatures)[..., 0] == MAX_HASH
+
+class LSHIndex:
+    """
+    Banded locality-sensitive hashing over MinHash signatures.
+
+    Each signature is cut into bands of rows values; two items become
+    candidates when any band matches exactly, which happens with probability
+    1 - (1 - s^rows)^bands for Jaccard similarity s. Lookups touch one bucket
+    per band instead of every stored signature.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.buckets: List[Dict[bytes, List[int]]] = [defaultdict(list) for _ in range(bands)]
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def insert(self, item_id: int, signature: np.ndarray):
+        for band, key in enumerate(self._band_keys(signature)):
+            self.buckets[band][key].append(item_id)
+
+    def query(self, signature: np.ndarray) -> set:
+        """Return ids of stored items that share at least one band with the signature"""
+        candidates = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self.buckets[band].get(key, ()))
+        return candidates
+
+def near_duplicate_clusters(signatures: np.ndarray, threshold: float = 0.8, bands: int = 16,
+                            groups: Sequence = None) -> List[int]:
+    """
+    Group signatures whose estimated Jaccard similarity reaches threshold.
+
+    Returns a cluster label per row (the lowest row index in its cluster).
+    LSH candidates are verified against the full signature before merging,
+    so band collisions between unrelated postings are discarded. Rows only
+    merge with rows of the same group when groups are given, and signatures
+    of texts without words stay in clusters of their own.
+    """
+    count, num_perm = signatures.shape if signatures.ndim == 2 else (0, 0)
+    parent = list(range(count))
+
+    def find(item):
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    lsh = LSHIndex(num_perm, bands)
+    for item in range(count):
+        signature = signatures[item]
+        # Every empty text has the same all-MAX_HASH signature; it says nothing about similarity
+        if empty_signatures(signature):
+            continue
+        for candidate in lsh.query(signature):
+            if groups is not None and groups[candidate] != groups[item]:
+                continue
+            if MinHasher.jaccard(signature, signatures[candidate]) >= threshold:
+                root_a, root_b = find(item), find(candidate)
+                if root_a != root_b:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+        lsh.insert(item, signature)
+
+    return [find(item) for item in range(count)]
+
+def normalize_company(company) -> str:
+    """Lowercased employer name without punctuation, extra whitespace or trailing legal suffixes"""
+    words = WORD_PATTERN.findall(str(company or '').lower())
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+def canonical_indices(texts: Sequence[str], threshold: float = 0.8, hasher: MinHasher = None,
+                      groups: Sequence = None) -> List[int]:
+    """
+    Return the indices to keep: one per near-duplicate cluster.
+
+    groups (e.g. the employer of each posting) restricts clusters to items of
+    the same group. The longest text in a cluster is kept since it carries the
+    most detail; ties go to the later item so fresher postings win.
+    """
+    hasher = hasher or MinHasher()
+    labels = near_duplicate_clusters(hasher.signatures(texts), threshold, groups=groups)
+
+    best: Dict[int, int] = {}
+    for item, label in enumerate(labels):
+        current = best.get(label)
+        if current is None or len(texts[item]) >= len(texts[current]):
+            best[label] = item
+
+    return sorted(best.values())
+
+# Test function
+if __name__ == "__main__":
+    hasher = MinHasher()
+    first = hasher.signature("Senior Python Developer building scalable APIs with Django and AWS for our platform team")
+    second = hasher.signature("Sr. Python Developer building scalable APIs with Django and AWS for our platform team")
+    print(f"Estimated Jaccard similarity: {MinHasher.jaccard(first, second):.2f}")
@@ -1,6 +1,24 @@
 import fitz  # PyMuPDF
 import re
-from typing import Dict, List, Optional
+from statistics import median
+from typing import Dict, List, Optional, Tuple
+
+def _header(alternatives: str) -> re.Pattern:
+    """A header is a whole line made of one of the alternatives, e.g. "Work Experience:" """
+    return re.compile(r'^\W*(?:' + alternatives + r')\W*$')
+
+# Common section headers; content lines such as "Led projects for banking clients" never match
+SECTION_PATTERNS = {
+    'contact': _header(r'contact(\s+(information|info|details))?|personal\s+(information|details)'),
+    'summary': _header(r'((professional|career|executive)\s+)?(summary|profile)|(career\s+)?objective|about(\s+me)?'),
+    'experience': _header(r'((professional|work|relevant)\s+)?experience|employment(\s+history)?|work\s+history'),
+    'education': _header(r'education|academic\s+background|qualifications'),
+    'skills': _header(r'((technical|core|key)\s+)?(skills|competencies)|(areas\s+of\s+)?expertise'),
+    'projects': _header(r'((personal|selected|key)\s+)?projects|portfolio'),
+    'certifications': _header(r'certifications|certificates|licenses(\s+(and|&)\s+certifications)?'),
+    'awards': _header(r'awards|achievements|honors(\s+(and|&)\s+awards)?'),
+    'references': _header(r'references')
+}
 
 class PDFParser:
     """Utility class for parsing PDF files and extracting structured information"""
@@ -42,6 +60,7 @@ class PDFParser:
                     'blocks': []
                 }
                 
+                line_number = 0
                 for block in blocks["blocks"]:
                     if "lines" in block:
                         for line in block["lines"]:
@@ -50,8 +69,11 @@ class PDFParser:
                                     'text': span["text"],
                                     'font': span["font"],
                                     'size': span["size"],
-                                    'bbox': span["bbox"]
+                                    'flags': span.get("flags", 0),
+                                    'bbox': span["bbox"],
+                                    'line': line_number
                                 })
+                            line_number += 1
                 
                 pages_data.append(page_data)
             
@@ -88,46 +110,84 @@ class PDFParser:
         except Exception as e:
             raise Exception(f"Error extracting PDF metadata: {str(e)}")
     
+    def match_section_header(self, line: str) -> Optional[str]:
+        """Return the section a short header line introduces, or None"""
+        line_lower = line.lower().strip()
+        if not line_lower or len(line_lower) >= 50:
+            return None
+
+        for section_name, pattern in SECTION_PATTERNS.items():
+            if pattern.match(line_lower):
+                return section_name
+        return None
+
     def find_sections(self, text: str) -> Dict[str, str]:
         """Identify common resume sections in the text"""
-        sections = {}
-        
-        # Common section headers
-        section_patterns = {
-            'contact': r'(contact|personal\s+information|contact\s+information)',
-            'summary': r'(summary|profile|objective|about)',
-            'experience': r'(experience|work\s+experience|employment|professional\s+experience)',
-            'education': r'(education|academic|qualifications)',
-            'skills': r'(skills|technical\s+skills|competencies|expertise)',
-            'projects': r'(projects|portfolio)',
-            'certifications': r'(certifications|certificates|licenses)',
-            'awards': r'(awards|achievements|honors)',
-            'references': r'(references)'
-        }
-        
-        text_lines = text.split('\n')
-        current_section = None
-        section_content = {}
+        return self._group_sections((line, True) for line in text.split('\n'))
+    
+    def find_sections_from_layout(self, formatted: Dict) -> Dict[str, str]:
+        """
+        Identify resume sections using layout cues from extract_text_with_formatting().
+
+        Only lines set larger than the body text, in bold, or in capitals can be
+        headers, so sentences such as "Gained experience with SQL" stay content.
+        """
+        lines = self._layout_lines(formatted)
+        if not lines:
+            return {}
+
+        body_size = median(size for _, size, _ in lines)
+
+        def header_styled(text, size, bold):
+            return size >= body_size * 1.15 or bold or (text.isupper() and len(text) > 3)
+
+        return self._group_sections(
+            (text, header_styled(text, size, bold)) for text, size, bold in lines
+        )
+
+    def _layout_lines(self, formatted: Dict) -> List[Tuple[str, float, bool]]:
+        """Rebuild (text, max font size, bold) lines from formatted spans"""
+        lines = []
+        for page in formatted.get('pages', []):
+            current_line = None
+            parts, sizes, bold = [], [], True
+            for span in page['blocks'] + [None]:
+                if span is None or span.get('line') != current_line:
+                    text = ''.join(parts).strip()
+                    if text:
+                        lines.append((text, max(sizes), bold))
+                    if span is None:
+                        break
+                    current_line = span.get('line')
+                    parts, sizes, bold = [], [], True
+                parts.append(span['text'])
+                sizes.append(span['size'])
+                # PyMuPDF flag bit 4 (16) marks bold text
+                if span['text'].strip():
+                    bold = bold and bool(span.get('flags', 0) & 16 or 'bold' in span['font'].lower())
+        return lines
+
+    def _group_sections(self, lines) -> Dict[str, str]:
+        """Group (line, may_be_header) pairs under the most recent section header"""
+        current_section = 'contact'  # text before the first header is usually contact details
+        section_content = {'contact': []}
         
-        for line in text_lines:
-            line_lower = line.lower().strip()
-            
-            # Check if line matches any section header
-            for section_name, pattern in section_patterns.items():
-                if re.search(pattern, line_lower) and len(line_lower) < 50:
-                    current_section = section_name
-                    section_content[section_name] = []
-                    break
-            else:
+        for line, may_be_header in lines:
+            section_name = self.match_section_header(line) if may_be_header else None
+
+            if section_name:
+                current_section = section_name
+                section_content.setdefault(section_name, [])
+            elif line.strip():
                 # Add content to current section
-                if current_section and line.strip():
-                    section_content[current_section].append(line.strip())
+                section_content[current_section].append(line.strip())
         
         # Convert lists to strings
-        for section, content in section_content.items():
-            sections[section] = '\n'.join(content)
-        
-        return sections
+        return {
+            section: '\n'.join(content)
+            for section, content in section_content.items()
+            if content
+        }
     
     def extract_tables(self, file_path: str) -> List[List[str]]:
         """Extract tables from PDF (basic implementation)"""
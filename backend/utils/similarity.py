@@ -5,6 +5,15 @@ from textblob import TextBlob
 import re
 from typing import List, Dict, Tuple
 import math
+from functools import lru_cache
+from utils.job_features import (
+    extract_job_features, has_job_features, noun_phrase_set, required_years, seniority, UNKNOWN_SENIORITY
+)
+
+@lru_cache(maxsize=1024)
+def noun_phrases(text: str) -> frozenset:
+    """Lowercased noun phrases of a text, cached because the same resume is compared with many jobs"""
+    return noun_phrase_set(text)
 
 class SimilarityCalculator:
     """Advanced similarity calculation utility for resume-job matching"""
@@ -137,37 +146,41 @@ class SimilarityCalculator:
     def semantic_similarity(self, text1: str, text2: str) -> float:
         """Calculate semantic similarity using TextBlob sentiment and polarity"""
         try:
-            blob1 = TextBlob(text1)
-            blob2 = TextBlob(text2)
-            
             # Extract key phrases and compare
-            phrases1 = set([phrase.lower() for phrase in blob1.noun_phrases])
-            phrases2 = set([phrase.lower() for phrase in blob2.noun_phrases])
-            
-            if not phrases1 or not phrases2:
-                return 0.0
-            
-            # Calculate phrase overlap
-            common_phrases = phrases1.intersection(phrases2)
-            total_phrases = phrases1.union(phrases2)
-            
-            if len(total_phrases) == 0:
-                return 0.0
-            
-            return len(common_phrases) / len(total_phrases)
+            return self.phrase_overlap(noun_phrases(text1), noun_phrases(text2))
         
         except Exception as e:
             print(f"Error in semantic similarity calculation: {str(e)}")
             return 0.0
     
-    def experience_similarity(self, resume_experience: Dict, job_requirements: str) -> float:
-        """Calculate similarity based on experience level and job titles"""
+    @staticmethod
+    def phrase_overlap(phrases1: frozenset, phrases2: frozenset) -> float:
+        """Jaccard overlap of two noun phrase sets"""
+        if not phrases1 or not phrases2:
+            return 0.0
+        
+        # Calculate phrase overlap
+        common_phrases = phrases1.intersection(phrases2)
+        total_phrases = phrases1.union(phrases2)
+        
+        return len(common_phrases) / len(total_phrases)
+    
+    def experience_similarity(self, resume_experience: Dict, job_requirements: str,
+                              job_features: Dict = None) -> float:
+        """Calculate similarity based on experience level and job titles
+        
+        job_features, when given, are the precomputed columns from the job index
+        and replace parsing job_requirements.
+        """
         try:
             similarity_score = 0.0
             factors = 0
             
             # Extract years of experience from job requirements
-            job_years = self.extract_years_experience(job_requirements)
+            if job_features is not None:
+                job_years = job_features['required_years']
+            else:
+                job_years = self.extract_years_experience(job_requirements)
             
             # Calculate experience timeline similarity
             if 'timeline' in resume_experience and resume_experience['timeline']:
@@ -182,12 +195,25 @@ class SimilarityCalculator:
             
             # Calculate job title similarity
             if 'job_titles' in resume_experience and resume_experience['job_titles']:
-                job_title_similarity = self.calculate_job_title_similarity(
-                    resume_experience['job_titles'], 
-                    job_requirements
-                )
+                if job_features is not None:
+                    job_title_similarity = self.title_token_similarity(
+                        resume_experience['job_titles'],
+                        job_features['title_tokens']
+                    )
+                else:
+                    job_title_similarity = self.calculate_job_title_similarity(
+                        resume_experience['job_titles'], 
+                        job_requirements
+                    )
                 similarity_score += job_title_similarity
                 factors += 1
+                
+                # Seniority match (only known once the job side has been parsed at ingest)
+                if job_features is not None and job_features['seniority'] != UNKNOWN_SENIORITY:
+                    resume_seniority = max(seniority(title) for title in resume_experience['job_titles'])
+                    if resume_seniority != UNKNOWN_SENIORITY:
+                        similarity_score += 1.0 - abs(resume_seniority - job_features['seniority']) / 5
+                        factors += 1
             
             return similarity_score / factors if factors > 0 else 0.0
         
@@ -197,19 +223,7 @@ class SimilarityCalculator:
     
     def extract_years_experience(self, text: str) -> int:
         """Extract required years of experience from job description"""
-        patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:relevant\s*)?experience',
-            r'minimum\s*(?:of\s*)?(\d+)\s*years?',
-            r'at\s*least\s*(\d+)\s*years?'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                return int(match.group(1))
-        
-        return 0
+        return required_years(text)
     
     def calculate_total_experience(self, timeline: List[Dict]) -> float:
         """Calculate total years of experience from timeline"""
@@ -267,20 +281,53 @@ class SimilarityCalculator:
         
         return max_similarity
     
-    def comprehensive_similarity(self, resume_data: Dict, job_data: Dict) -> Dict[str, float]:
-        """Calculate comprehensive similarity using multiple methods"""
+    def title_token_similarity(self, resume_titles: List[str], job_title_tokens: frozenset) -> float:
+        """Best fraction of a resume title's words that appear in the job title"""
+        max_similarity = 0.0
         
-        # Prepare texts
-        resume_text = self.prepare_resume_text(resume_data)
+        for title in resume_titles:
+            title_words = set(title.lower().split())
+            if title_words and job_title_tokens:
+                overlap = len(title_words.intersection(job_title_tokens))
+                max_similarity = max(max_similarity, overlap / len(title_words))
+        
+        return max_similarity
+    
+    def comprehensive_similarity(self, resume_data: Dict, job_data: Dict,
+                                 tfidf_score: float = None, resume_text: str = None,
+                                 jaccard_score: float = None, resume_phrases: frozenset = None) -> Dict[str, float]:
+        """Calculate comprehensive similarity using multiple methods
+
+        When re-ranking many jobs for one resume, pass the cosine score and the
+        MinHash Jaccard estimate from the job index as tfidf_score and
+        jaccard_score, plus the resume's noun phrases (or the prepared
+        resume_text), so none of them is recomputed per job.
+        """
+        
+        # Prepare texts; the resume text is only needed for scores the caller did not supply
+        if resume_text is None and None in (tfidf_score, jaccard_score, resume_phrases):
+            resume_text = self.prepare_resume_text(resume_data)
         job_text = self.prepare_job_text(job_data)
         
+        # Job rows from the index carry their parsed features; plain dicts are parsed here
+        job_features = job_data if has_job_features(job_data) else extract_job_features(job_data)
+        
         # Calculate different similarity metrics
         similarities = {}
         
         # Text-based similarities
-        similarities['tfidf_similarity'] = self.cosine_similarity_tfidf(resume_text, job_text)
-        similarities['jaccard_similarity'] = self.jaccard_similarity(resume_text, job_text)
-        similarities['semantic_similarity'] = self.semantic_similarity(resume_text, job_text)
+        if tfidf_score is not None:
+            similarities['tfidf_similarity'] = float(tfidf_score)
+        else:
+            similarities['tfidf_similarity'] = self.cosine_similarity_tfidf(resume_text, job_text)
+        if jaccard_score is not None:
+            similarities['jaccard_similarity'] = float(jaccard_score)
+        else:
+            similarities['jaccard_similarity'] = self.jaccard_similarity(resume_text, job_text)
+        similarities['semantic_similarity'] = self.phrase_overlap(
+            resume_phrases if resume_phrases is not None else noun_phrases(resume_text),
+            job_features['noun_phrases']
+        )
         
         # Skill-based similarity
         resume_skills = resume_data.get('skills', [])
@@ -290,7 +337,9 @@ class SimilarityCalculator:
         
         # Experience-based similarity
         resume_experience = resume_data.get('experience', {})
-        similarities['experience_similarity'] = self.experience_similarity(resume_experience, job_text)
+        similarities['experience_similarity'] = self.experience_similarity(
+            resume_experience, job_text, job_features
+        )
         
         # Calculate weighted overall similarity
         weights = {
@@ -4,6 +4,82 @@ from typing import List, Dict, Set
 import spacy
 from textblob import TextBlob
 
+# Comprehensive skill database organized by categories
+SKILL_DATABASE = {
+    'programming_languages': {
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'php', 
+        'ruby', 'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab', 
+        'perl', 'shell', 'bash', 'powershell', 'vba', 'assembly', 'cobol',
+        'fortran', 'haskell', 'erlang', 'clojure', 'dart', 'lua'
+    },
+    'web_technologies': {
+        'html', 'css', 'sass', 'scss', 'less', 'bootstrap', 'tailwind css',
+        'react', 'angular', 'vue.js', 'svelte', 'ember.js', 'backbone.js',
+        'jquery', 'node.js', 'express.js', 'next.js', 'nuxt.js', 'gatsby',
+        'webpack', 'gulp', 'grunt', 'parcel', 'vite'
+    },
+    'frameworks_libraries': {
+        'django', 'flask', 'fastapi', 'spring', 'spring boot', 'laravel',
+        'rails', 'asp.net', 'express', 'koa', 'nestjs', 'tensorflow',
+        'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib',
+        'seaborn', 'opencv', 'nltk', 'spacy', 'plotly', 'bokeh'
+    },
+    'databases': {
+        'mysql', 'postgresql', 'sqlite', 'mongodb', 'redis', 'cassandra',
+        'elasticsearch', 'oracle', 'sql server', 'mariadb', 'dynamodb',
+        'firebase', 'neo4j', 'couchdb', 'influxdb', 'clickhouse'
+    },
+    'cloud_platforms': {
+        'aws', 'amazon web services', 'azure', 'microsoft azure', 
+        'google cloud', 'gcp', 'google cloud platform', 'heroku',
+        'digitalocean', 'linode', 'vultr', 'cloudflare', 'vercel',
+        'netlify', 'firebase hosting'
+    },
+    'devops_tools': {
+        'docker', 'kubernetes', 'jenkins', 'gitlab ci', 'github actions',
+        'travis ci', 'circleci', 'ansible', 'terraform', 'vagrant',
+        'chef', 'puppet', 'saltstack', 'helm', 'istio', 'prometheus',
+        'grafana', 'elk stack', 'nagios', 'zabbix'
+    },
+    'version_control': {
+        'git', 'github', 'gitlab', 'bitbucket', 'svn', 'mercurial',
+        'perforce', 'bazaar'
+    },
+    'mobile_development': {
+        'android', 'ios', 'react native', 'flutter', 'xamarin',
+        'ionic', 'cordova', 'phonegap', 'swift', 'objective-c',
+        'kotlin', 'java android'
+    },
+    'data_science_ml': {
+        'machine learning', 'deep learning', 'artificial intelligence',
+        'data science', 'data analysis', 'statistics', 'big data',
+        'hadoop', 'spark', 'kafka', 'airflow', 'jupyter', 'r studio',
+        'tableau', 'power bi', 'qlik', 'looker', 'data mining',
+        'predictive modeling', 'neural networks', 'computer vision',
+        'natural language processing', 'nlp'
+    },
+    'soft_skills': {
+        'leadership', 'communication', 'teamwork', 'problem solving',
+        'analytical thinking', 'creative thinking', 'adaptability',
+        'time management', 'project management', 'critical thinking',
+        'collaboration', 'mentoring', 'public speaking', 'negotiation',
+        'conflict resolution', 'emotional intelligence', 'decision making'
+    },
+    'methodologies': {
+        'agile', 'scrum', 'kanban', 'lean', 'waterfall', 'devops',
+        'ci/cd', 'tdd', 'test driven development', 'bdd', 
+        'behavior driven development', 'pair programming', 'code review',
+        'design patterns', 'microservices', 'monolithic', 'mvc',
+        'rest api', 'graphql', 'soap'
+    },
+    'certifications': {
+        'aws certified', 'azure certified', 'google certified',
+        'cisco certified', 'microsoft certified', 'oracle certified',
+        'comptia', 'cissp', 'ceh', 'pmp', 'scrum master', 'itil',
+        'six sigma', 'prince2'
+    }
+}
+
 class SkillExtractor:
     """Advanced skill extraction utility with multiple extraction methods"""
     
@@ -18,80 +94,7 @@ class SkillExtractor:
             self.nlp = None
         
         # Comprehensive skill database organized by categories
-        self.skill_database = {
-            'programming_languages': {
-                'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'php', 
-                'ruby', 'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab', 
-                'perl', 'shell', 'bash', 'powershell', 'vba', 'assembly', 'cobol',
-                'fortran', 'haskell', 'erlang', 'clojure', 'dart', 'lua'
-            },
-            'web_technologies': {
-                'html', 'css', 'sass', 'scss', 'less', 'bootstrap', 'tailwind css',
-                'react', 'angular', 'vue.js', 'svelte', 'ember.js', 'backbone.js',
-                'jquery', 'node.js', 'express.js', 'next.js', 'nuxt.js', 'gatsby',
-                'webpack', 'gulp', 'grunt', 'parcel', 'vite'
-            },
-            'frameworks_libraries': {
-                'django', 'flask', 'fastapi', 'spring', 'spring boot', 'laravel',
-                'rails', 'asp.net', 'express', 'koa', 'nestjs', 'tensorflow',
-                'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib',
-                'seaborn', 'opencv', 'nltk', 'spacy', 'plotly', 'bokeh'
-            },
-            'databases': {
-                'mysql', 'postgresql', 'sqlite', 'mongodb', 'redis', 'cassandra',
-                'elasticsearch', 'oracle', 'sql server', 'mariadb', 'dynamodb',
-                'firebase', 'neo4j', 'couchdb', 'influxdb', 'clickhouse'
-            },
-            'cloud_platforms': {
-                'aws', 'amazon web services', 'azure', 'microsoft azure', 
-                'google cloud', 'gcp', 'google cloud platform', 'heroku',
-                'digitalocean', 'linode', 'vultr', 'cloudflare', 'vercel',
-                'netlify', 'firebase hosting'
-            },
-            'devops_tools': {
-                'docker', 'kubernetes', 'jenkins', 'gitlab ci', 'github actions',
-                'travis ci', 'circleci', 'ansible', 'terraform', 'vagrant',
-                'chef', 'puppet', 'saltstack', 'helm', 'istio', 'prometheus',
-                'grafana', 'elk stack', 'nagios', 'zabbix'
-            },
-            'version_control': {
-                'git', 'github', 'gitlab', 'bitbucket', 'svn', 'mercurial',
-                'perforce', 'bazaar'
-            },
-            'mobile_development': {
-                'android', 'ios', 'react native', 'flutter', 'xamarin',
-                'ionic', 'cordova', 'phonegap', 'swift', 'objective-c',
-                'kotlin', 'java android'
-            },
-            'data_science_ml': {
-                'machine learning', 'deep learning', 'artificial intelligence',
-                'data science', 'data analysis', 'statistics', 'big data',
-                'hadoop', 'spark', 'kafka', 'airflow', 'jupyter', 'r studio',
-                'tableau', 'power bi', 'qlik', 'looker', 'data mining',
-                'predictive modeling', 'neural networks', 'computer vision',
-                'natural language processing', 'nlp'
-            },
-            'soft_skills': {
-                'leadership', 'communication', 'teamwork', 'problem solving',
-                'analytical thinking', 'creative thinking', 'adaptability',
-                'time management', 'project management', 'critical thinking',
-                'collaboration', 'mentoring', 'public speaking', 'negotiation',
-                'conflict resolution', 'emotional intelligence', 'decision making'
-            },
-            'methodologies': {
-                'agile', 'scrum', 'kanban', 'lean', 'waterfall', 'devops',
-                'ci/cd', 'tdd', 'test driven development', 'bdd', 
-                'behavior driven development', 'pair programming', 'code review',
-                'design patterns', 'microservices', 'monolithic', 'mvc',
-                'rest api', 'graphql', 'soap'
-            },
-            'certifications': {
-                'aws certified', 'azure certified', 'google certified',
-                'cisco certified', 'microsoft certified', 'oracle certified',
-                'comptia', 'cissp', 'ceh', 'pmp', 'scrum master', 'itil',
-                'six sigma', 'prince2'
-            }
-        }
+        self.skill_database = SKILL_DATABASE
         
         # Create a flat list of all skills for quick lookup
         self.all_skills = set()
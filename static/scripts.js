@@ -175,17 +175,32 @@ async function handleFormSubmit(e) {
 
 // Get job matches for the analyzed resume
 async function getJobMatches(resumeData, sessionId, resumeId) {
+    // Uploaded resumes are already encoded server-side, so only the id needs to be sent
+    const payload = JSON.stringify(resumeId ? {
+        session_id: sessionId,
+        resume_id: resumeId
+    } : {
+        resume_data: resumeData,
+        session_id: sessionId
+    });
+    
+    // Prefer the streaming endpoint so the first matches render while the rest are scored
+    if (window.ReadableStream && window.TextDecoder) {
+        try {
+            await streamJobMatches(payload);
+            return;
+        } catch (error) {
+            console.warn('Streaming job matches failed, falling back:', error);
+        }
+    }
+    
     try {
         const response = await fetch('/api/match-jobs', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
             },
-            body: JSON.stringify({
-                resume_data: resumeData,
-                session_id: sessionId,
-                resume_id: resumeId
-            })
+            body: payload
         });
         
         const data = await response.json();
@@ -202,6 +217,72 @@ async function getJobMatches(resumeData, sessionId, resumeId) {
     }
 }
 
+// Read Server-Sent Events from the streaming endpoint and render each match on arrival
+async function streamJobMatches(payload) {
+    const response = await fetch('/api/match-jobs/stream', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'Accept': 'text/event-stream'
+        },
+        body: payload
+    });
+    
+    if (!response.ok || !response.body) {
+        throw new Error(`Stream request failed with status ${response.status}`);
+    }
+    
+    const container = document.getElementById('jobRecommendations');
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let count = 0;
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        
+        buffer += decoder.decode(value, { stream: true });
+        
+        // Events are separated by a blank line
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const event = parseSseEvent(buffer.slice(0, boundary));
+            buffer = buffer.slice(boundary + 2);
+            
+            // Streamed cards arrive one by one, so they need no staggered animation
+            if (event.type === 'match') {
+                if (count === 0) {
+                    container.innerHTML = '';
+                    hideLoading();
+                }
+                container.insertAdjacentHTML('beforeend', renderJobCard(event.data, 0));
+                count++;
+            } else if (event.type === 'error') {
+                showAlert('Error finding job matches: ' + (event.data.error || 'Unknown error'), 'warning');
+            } else if (event.type === 'done' && count === 0) {
+                displayJobMatches([]);
+            }
+        }
+    }
+}
+
+// Parse one "event: ...\ndata: ..." block
+function parseSseEvent(block) {
+    let type = 'message';
+    const dataLines = [];
+    
+    block.split('\n').forEach(line => {
+        if (line.startsWith('event:')) {
+            type = line.slice(6).trim();
+        } else if (line.startsWith('data:')) {
+            dataLines.push(line.slice(5).trim());
+        }
+    });
+    
+    return { type, data: dataLines.length ? JSON.parse(dataLines.join('\n')) : {} };
+}
+
 // Display resume analysis results
 function displayResumeAnalysis(data) {
     // Update statistics
@@ -253,54 +334,64 @@ function displayJobMatches(matches) {
         return;
     }
     
-    const jobsHtml = matches.map((job, index) => `
-        <div class="job-card fade-in" style="animation-delay: ${index * 0.1}s">
-            <div class="row align-items-center">
-                <div class="col-md-8">
-                    <h5 class="mb-2">
-                        <i class="fas fa-briefcase me-2 text-primary"></i>
-                        ${job.title}
-                    </h5>
-                    <p class="text-muted mb-2">
-                        <i class="fas fa-building me-2"></i>
-                        ${job.company}
-                    </p>
-                    <p class="text-muted mb-2">
-                        <i class="fas fa-map-marker-alt me-2"></i>
-                        ${job.location}
-                    </p>
-                    <p class="mb-3">${job.description.substring(0, 150)}...</p>
-                    <div class="d-flex flex-wrap gap-2 mb-3">
-                        ${job.requirements.split(',').slice(0, 5).map(req => 
-                            `<span class="badge bg-secondary">${req.trim()}</span>`
-                        ).join('')}
+    const jobsHtml = matches.map((job, index) => renderJobCard(job, index)).join('');
+    
+    container.innerHTML = jobsHtml;
+}
+
+// Render one job match card
+function renderJobCard(job, index) {
+    return `
+    <div class="job-card fade-in" style="animation-delay: ${index * 0.1}s">
+        <div class="row align-items-center">
+            <div class="col-md-8">
+                <h5 class="mb-2">
+                    <i class="fas fa-briefcase me-2 text-primary"></i>
+                    ${job.title}
+                </h5>
+                <p class="text-muted mb-2">
+                    <i class="fas fa-building me-2"></i>
+                    ${job.company}
+                </p>
+                <p class="text-muted mb-2">
+                    <i class="fas fa-map-marker-alt me-2"></i>
+                    ${job.location}
+                </p>
+                <p class="mb-3">${job.description.substring(0, 150)}...</p>
+                <div class="d-flex flex-wrap gap-2 mb-3">
+                    ${job.requirements.split(',').slice(0, 5).map(req => 
+                        `<span class="badge bg-secondary">${req.trim()}</span>`
+                    ).join('')}
+                </div>
+                ${job.skill_gap && job.skill_gap.missing_skills.length ? `
+                <p class="small text-muted mb-2">
+                    <i class="fas fa-exclamation-circle me-1"></i>
+                    Missing: ${job.skill_gap.missing_skills.join(', ')}
+                </p>` : ''}
+                <div class="row text-muted small">
+                    <div class="col-md-6">
+                        <i class="fas fa-dollar-sign me-1"></i>
+                        ${job.salary_range}
                     </div>
-                    <div class="row text-muted small">
-                        <div class="col-md-6">
-                            <i class="fas fa-dollar-sign me-1"></i>
-                            ${job.salary_range}
-                        </div>
-                        <div class="col-md-6">
-                            <i class="fas fa-clock me-1"></i>
-                            ${job.job_type} • ${job.experience_level}
-                        </div>
+                    <div class="col-md-6">
+                        <i class="fas fa-clock me-1"></i>
+                        ${job.job_type} • ${job.experience_level}
                     </div>
                 </div>
-                <div class="col-md-4 text-center">
-                    <div class="match-score ${getMatchScoreClass(job.match_score)}">
-                        ${job.match_score}%
-                    </div>
-                    <p class="small text-muted mb-3">Match Score</p>
-                    <button class="btn btn-primary btn-sm" onclick="analyzeSkillGap('${job.title}', '${job.requirements}')">
-                        <i class="fas fa-chart-line me-1"></i>
-                        Skill Gap
-                    </button>
+            </div>
+            <div class="col-md-4 text-center">
+                <div class="match-score ${getMatchScoreClass(job.match_score)}">
+                    ${job.match_score}%
                 </div>
+                <p class="small text-muted mb-3">Match Score</p>
+                <button class="btn btn-primary btn-sm" onclick="analyzeSkillGap('${job.title}', '${job.requirements}')">
+                    <i class="fas fa-chart-line me-1"></i>
+                    Skill Gap
+                </button>
             </div>
         </div>
-    `).join('');
-    
-    container.innerHTML = jobsHtml;
+    </div>
+`;
 }
 
 // Get match score CSS class